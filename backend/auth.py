@@ -4,7 +4,13 @@ Provides JWT-based authentication with secure password hashing
 """
 import jwt
 import bcrypt
+import asyncio
+import hashlib
+import os
 import secrets
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 from fastapi import HTTPException, status
@@ -27,6 +33,60 @@ ADMIN_USERS = {
     }
 }
 
+# bcrypt runs in a small dedicated pool so a login burst cannot block the
+# event loop or starve the default executor; excess attempts are rejected
+PASSWORD_WORKERS = int(os.environ.get('PASSWORD_WORKERS', 2))
+PASSWORD_MAX_PENDING = int(os.environ.get('PASSWORD_MAX_PENDING', 8))
+
+_password_executor = ThreadPoolExecutor(max_workers=PASSWORD_WORKERS, thread_name_prefix="bcrypt")
+_password_slots: Optional[asyncio.Semaphore] = None
+
+class PasswordPoolBusy(Exception):
+    """Raised when too many password checks are already queued"""
+
+# Verified tokens, keyed by digest, so repeated admin calls skip the JWT
+# signature check until the token expires
+TOKEN_CACHE_SIZE = int(os.environ.get('TOKEN_CACHE_SIZE', 256))
+
+class TokenCache:
+    """Bounded LRU of token digest -> (exp timestamp, username)"""
+
+    def __init__(self, maxsize: int = TOKEN_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, digest: str) -> Optional[str]:
+        entry = self._entries.get(digest)
+        if entry is None:
+            return None
+        expires_at, username = entry
+        if expires_at <= time.time():
+            del self._entries[digest]
+            return None
+        self._entries.move_to_end(digest)
+        return username
+
+    def put(self, digest: str, expires_at: float, username: str) -> None:
+        self._entries[digest] = (expires_at, username)
+        self._entries.move_to_end(digest)
+        if len(self._entries) > self.maxsize:
+            now = time.time()
+            for key in [k for k, (exp, _) in self._entries.items() if exp <= now]:
+                del self._entries[key]
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, digest: str) -> None:
+        self._entries.pop(digest, None)
+
+_token_cache = TokenCache()
+# Digests of logged-out tokens -> exp timestamp; entries are dropped once
+# the token would have expired anyway
+_revoked_tokens: dict = {}
+
+def token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
 class UserLogin(BaseModel):
     username: str
     password: str
@@ -51,12 +111,27 @@ def get_password_hash(password: str) -> str:
     salt = bcrypt.gensalt()
     return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
 
-def authenticate_user(username: str, password: str) -> Optional[dict]:
+async def run_password_task(func, *args):
+    """Run a bcrypt call on the password pool, bounded by PASSWORD_MAX_PENDING"""
+    global _password_slots
+    if _password_slots is None:
+        _password_slots = asyncio.Semaphore(PASSWORD_MAX_PENDING)
+    if _password_slots.locked():
+        raise PasswordPoolBusy()
+    async with _password_slots:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_password_executor, func, *args)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash without blocking the event loop"""
+    return await run_password_task(verify_password, plain_password, hashed_password)
+
+async def authenticate_user(username: str, password: str) -> Optional[dict]:
     """Authenticate user credentials"""
     user = ADMIN_USERS.get(username)
     if not user:
         return None
-    if not verify_password(password, user["hashed_password"]):
+    if not await verify_password_async(password, user["hashed_password"]):
         return None
     return user
 
@@ -72,24 +147,48 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+def _decode_token(token: str) -> Optional[dict]:
+    try:
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except jwt.ExpiredSignatureError:
+        return None
+    except jwt.InvalidTokenError:
+        return None
+
 def verify_token(token: str) -> Optional[dict]:
     """Verify and decode JWT token"""
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
+    digest = token_digest(token)
+    if digest in _revoked_tokens:
+        return None
+    
+    username = _token_cache.get(digest)
+    if username is None:
+        payload = _decode_token(token)
+        if payload is None:
             return None
-        
-        # Check if user still exists and is active
-        user = ADMIN_USERS.get(username)
-        if user is None or not user.get("is_active", False):
+        username = payload.get("sub")
+        if username is None:
             return None
-            
-        return user
-    except jwt.ExpiredSignatureError:
-        return None
-    except jwt.JWTError:
+        _token_cache.put(digest, payload["exp"], username)
+    
+    # Check if user still exists and is active
+    user = ADMIN_USERS.get(username)
+    if user is None or not user.get("is_active", False):
         return None
+        
+    return user
+
+def revoke_token(token: str) -> None:
+    """Reject a token from now on (logout)"""
+    digest = token_digest(token)
+    _token_cache.discard(digest)
+    payload = _decode_token(token)
+    if payload is None:
+        return
+    now = time.time()
+    for key in [k for k, exp in _revoked_tokens.items() if exp <= now]:
+        del _revoked_tokens[key]
+    _revoked_tokens[digest] = payload["exp"]
 
 def get_current_user(token: str) -> dict:
     """Get current user from token"""
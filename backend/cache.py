@@ -0,0 +1,91 @@
+"""
+In-process read cache for the public Database queries
+Entries expire after a TTL, the least recently used entry is evicted when the
+cache is full and concurrent misses for the same key share a single load
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class TTLCache:
+    """Bounded TTL + LRU cache with single-flight loading.
+
+    All methods must be called from the event loop thread; there is no await
+    between a lookup and the matching update, so no lock is needed. A load
+    runs as its own task that every caller waiting on the key shields, so a
+    cancelled caller never cancels or fails the others.
+    Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0, timer: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for key, calling loader once on a miss"""
+        if not self.enabled:
+            return await loader()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > self.timer():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+
+        self.misses += 1
+        pending = self._inflight.get(key)
+        if pending is None:
+            # The load runs as its own task so cancelling the caller that
+            # started it does not fail everyone waiting on the same key
+            pending = self._inflight[key] = asyncio.ensure_future(loader())
+            pending.add_done_callback(lambda task: self._settle(key, task))
+        return await asyncio.shield(pending)
+
+    def _settle(self, key: Hashable, task: asyncio.Future) -> None:
+        # Retrieve the outcome even when nobody is left waiting for it
+        failed = task.cancelled() or task.exception() is not None
+        # An invalidation while loading detaches the task; don't store
+        # a value that may predate the write.
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            if not failed:
+                self._store(key, task.result())
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (self.timer() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single key and any load in flight for it"""
+        self._entries.pop(key, None)
+        self._inflight.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every key for which predicate(key) is true"""
+        for key in [k for k in self._entries if predicate(k)]:
+            del self._entries[key]
+        for key in [k for k in self._inflight if predicate(k)]:
+            del self._inflight[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._inflight.clear()
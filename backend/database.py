@@ -1,57 +1,208 @@
 from motor.motor_asyncio import AsyncIOMotorClient
-from datetime import datetime
-from typing import List, Optional
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Set
+import asyncio
+import logging
 import os
-from models import BlogPost, ContactMessage, AboutContent
+from slugs import fold_turkish, slugify, slug_suffix, suffix_pattern, variant_pattern
+from cache import TTLCache
+from search_index import InvertedIndex, SEARCH_WEIGHTS
+from write_buffer import WriteBuffer
+from db_monitoring import CommandMetrics, PoolMetrics, pool_options
+from storage import (
+    Storage, BulkImportError, POST_SORT, MESSAGE_SORT, POST_PROJECTION, POST_SUMMARY_PROJECTION,
+    batched, search_fields, decode_cursor, decode_message_cursor, utcnow, category_key
+)
+
+logger = logging.getLogger(__name__)
+
+# The text index is built on folded copies of the SEARCH_WEIGHTS fields under
+# "search" so queries match the way slugs do
+SEARCH_INDEX_NAME = "post_search"
+
+
+class Database(Storage):
+    """MongoDB storage backend"""
 
-class Database:
     def __init__(self):
+        super().__init__()
         self.client = None
         self.db = None
+        self.cache = TTLCache(ttl=0)
+        self.version_cache = TTLCache(ttl=0)
+        # In-process search fallback, set when MongoDB text search is unavailable.
+        # Like the related posts index it is kept current with this worker's
+        # writes and rebuilt once the blog_posts version shows another
+        # worker has written.
+        self.search_index: Optional[InvertedIndex] = None
+        self.search_index_version: Optional[int] = None
+        self.search_index_changes = 0
+        self.search_index_lock = asyncio.Lock()
+        self.text_search_available = False
+        self.subscribe(self._update_search_index)
+        self.contact_writes: Optional[WriteBuffer] = None
+        self.pool_metrics = PoolMetrics()
+        self.command_metrics = CommandMetrics()
 
     async def connect(self):
         """Connect to MongoDB"""
         mongo_url = os.environ.get('MONGO_URL')
         db_name = os.environ.get('DB_NAME', 'zirvehikayem')
         
-        self.client = AsyncIOMotorClient(mongo_url)
+        # Pool sizing and timeouts come from MONGO_* settings (see db_monitoring)
+        self.client = AsyncIOMotorClient(
+            mongo_url,
+            event_listeners=[self.pool_metrics, self.command_metrics],
+            **pool_options()
+        )
         self.db = self.client[db_name]
         
+        # Read cache for the public queries; CACHE_TTL_SECONDS=0 disables it
+        self.cache = TTLCache(
+            maxsize=int(os.environ.get('CACHE_MAX_ENTRIES', 1024)),
+            ttl=float(os.environ.get('CACHE_TTL_SECONDS', 60))
+        )
+        # Collection versions are re-read often so writes made by other
+        # workers show up quickly
+        self.version_cache = TTLCache(
+            maxsize=16,
+            ttl=float(os.environ.get('VERSION_TTL_SECONDS', 1))
+        )
+        
+        # Contact form submissions are written in batches
+        self.contact_writes = WriteBuffer(
+            self._insert_contact_messages,
+            max_batch=int(os.environ.get('CONTACT_BATCH_SIZE', 100)),
+            max_delay=float(os.environ.get('CONTACT_FLUSH_MS', 20)) / 1000,
+            max_pending=int(os.environ.get('CONTACT_MAX_PENDING', 1000))
+        )
+        self.contact_writes.start()
+        
         # Create indexes
         await self.create_indexes()
+        
+        if not self.text_search_available:
+            await self.build_search_index()
+        
+        if not await self.db.category_stats.find_one({}, {"_id": 1}):
+            await self.rebuild_category_stats()
 
     async def disconnect(self):
         """Disconnect from MongoDB"""
+        if self.contact_writes:
+            # Flush buffered contact messages before the client goes away
+            await self.contact_writes.close()
         if self.client:
             self.client.close()
 
     async def create_indexes(self):
         """Create database indexes for better performance"""
         # Blog posts indexes
+        await self.db.blog_posts.create_index("id", unique=True)
         await self.db.blog_posts.create_index("slug", unique=True)
         await self.db.blog_posts.create_index("category")
         await self.db.blog_posts.create_index("featured")
         await self.db.blog_posts.create_index("publishDate")
+        await self.db.blog_posts.create_index(POST_SORT)
+        await self.db.blog_posts.create_index([("category", 1)] + POST_SORT)
+        await self.db.blog_posts.create_index([("featured", 1)] + POST_SORT)
+        
+        # SEARCH_BACKEND=memory skips MongoDB text search altogether
+        self.text_search_available = os.environ.get('SEARCH_BACKEND', 'mongo') != 'memory'
+        if self.text_search_available:
+            try:
+                await self.db.blog_posts.create_index(
+                    [(f"search.{field}", "text") for field in SEARCH_WEIGHTS],
+                    weights={f"search.{field}": weight for field, weight in SEARCH_WEIGHTS.items()},
+                    default_language="none",
+                    name=SEARCH_INDEX_NAME
+                )
+                await self.backfill_search_fields()
+            except OperationFailure as e:
+                logger.warning(f"Text search unavailable, using in-process index: {str(e)}")
+                self.text_search_available = False
         
         # Contact messages index
         await self.db.contact_messages.create_index("createdAt")
         await self.db.contact_messages.create_index("status")
+        await self.db.contact_messages.create_index(MESSAGE_SORT)
+        await self.db.contact_messages.create_index([("status", 1)] + MESSAGE_SORT)
         
         # About content index
         await self.db.about_content.create_index("key", unique=True)
+        
+        # Category stats indexes
+        await self.db.category_stats.create_index("category", unique=True)
+
+    # Collection Versions
+    async def get_collection_version(self, name: str) -> int:
+        """Get the write counter of a collection, bumped on every write to it"""
+        return await self.version_cache.get_or_load(name, lambda: self._find_version(name))
+
+    async def _find_version(self, name: str) -> int:
+        doc = await self.db.collection_versions.find_one({"_id": name})
+        return doc["version"] if doc else 0
+
+    async def _bump_version(self, name: str) -> None:
+        """Record a write; must run after the write itself has completed"""
+        await self.db.collection_versions.update_one(
+            {"_id": name}, {"$inc": {"version": 1}}, upsert=True
+        )
+        self.version_cache.invalidate(name)
 
     # Blog Posts Methods
-    async def get_posts(self, category: Optional[str] = None, featured_only: bool = False, limit: Optional[int] = None) -> List[dict]:
-        """Get blog posts with optional filtering"""
+    async def get_posts(
+        self,
+        category: Optional[str] = None,
+        featured_only: bool = False,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        projection: Optional[dict] = None
+    ) -> List[dict]:
+        """Get blog posts with optional filtering, newest first.
+
+        ``after`` is a cursor from encode_cursor; only posts that sort strictly
+        after it are returned, so deep pages cost the same as the first one.
+        ``projection`` is passed to MongoDB so omitted fields never leave the
+        database (defaults to POST_PROJECTION, see POST_SUMMARY_PROJECTION).
+        """
+        projection = projection or POST_PROJECTION
+        # Keying on the collection version keeps workers that did not
+        # perform a write from serving lists older than that write
+        version = await self.get_collection_version("blog_posts")
+        key = (
+            "posts", category_key(category), featured_only, limit, after,
+            tuple(sorted(projection.items())) if projection else None, version
+        )
+        return await self.cache.get_or_load(
+            key, lambda: self._find_posts(category, featured_only, limit, after, projection)
+        )
+
+    async def _find_posts(
+        self,
+        category: Optional[str],
+        featured_only: bool,
+        limit: Optional[int],
+        after: Optional[str],
+        projection: Optional[dict]
+    ) -> List[dict]:
         query = {}
         
-        if category and category != "Tümü":
+        if category_key(category):
             query["category"] = category
         
         if featured_only:
             query["featured"] = True
         
-        cursor = self.db.blog_posts.find(query).sort("publishDate", -1)
+        if after:
+            publish_date, post_id = decode_cursor(after)
+            query["$or"] = [
+                {"publishDate": {"$lt": publish_date}},
+                {"publishDate": publish_date, "id": {"$lt": post_id}}
+            ]
+        
+        cursor = self.db.blog_posts.find(query, projection).sort(POST_SORT)
         
         if limit:
             cursor = cursor.limit(limit)
@@ -59,10 +210,95 @@ class Database:
         posts = await cursor.to_list(None)
         return posts
 
+    async def iter_posts(self, projection: Optional[dict] = None) -> AsyncIterator[dict]:
+        """Every post in no particular order, fetched in cursor batches"""
+        async for post in self.db.blog_posts.find({}, projection or POST_PROJECTION):
+            yield post
+
+    async def search_posts(self, query: str, limit: int = 10, skip: int = 0) -> List[dict]:
+        """Full-text search over posts, best matches first.
+
+        Results use the summary projection plus their relevance ``score``.
+        """
+        if self.search_index is not None:
+            await self.sync_search_index()
+            return await self._search_in_process(query, limit, skip)
+        
+        projection = dict(POST_SUMMARY_PROJECTION, score={"$meta": "textScore"})
+        cursor = self.db.blog_posts.find(
+            {"$text": {"$search": fold_turkish(query)}}, projection
+        ).sort([("score", {"$meta": "textScore"}), ("publishDate", -1)]).skip(skip).limit(limit)
+        return await cursor.to_list(None)
+
+    async def _search_in_process(self, query: str, limit: int, skip: int) -> List[dict]:
+        ranked = self.search_index.search(query, limit=limit, offset=skip)
+        if not ranked:
+            return []
+        posts = await self.db.blog_posts.find(
+            {"id": {"$in": [post_id for post_id, _ in ranked]}}, POST_SUMMARY_PROJECTION
+        ).to_list(None)
+        by_id = {post["id"]: post for post in posts}
+        return [dict(by_id[post_id], score=score) for post_id, score in ranked if post_id in by_id]
+
+    async def sync_search_index(self) -> None:
+        """Rebuild the in-process search index if it is behind the stored posts"""
+        version = await self.get_collection_version("blog_posts")
+        if self._search_index_in_sync(version):
+            return
+        async with self.search_index_lock:
+            if self._search_index_in_sync(version):
+                return
+            await self.build_search_index()
+
+    def _search_index_in_sync(self, version: int) -> bool:
+        # Each write bumps the version by one; a version lagging behind the
+        # local writes (version cache TTL) is fine, one ahead of them is not
+        if self.search_index_version is None:
+            return False
+        return version <= self.search_index_version + self.search_index_changes
+
+    async def build_search_index(self) -> None:
+        """Build the in-process search index from all posts (one pass)"""
+        version = await self._find_version("blog_posts")
+        changes = self.search_index_changes
+        index = InvertedIndex()
+        cursor = self.db.blog_posts.find(
+            {}, {"_id": 0, "id": 1, "title": 1, "excerpt": 1, "content": 1, "tags": 1}
+        )
+        async for post in cursor:
+            index.add(post)
+        self.search_index = index
+        # Writes applied while building may be missing from it; rebuild again
+        self.search_index_version = version if self.search_index_changes == changes else None
+        self.search_index_changes = 0
+        logger.info(f"Built in-process search index over {len(index)} posts")
+
+    def _update_search_index(self, event: str, previous: Optional[dict], current: Optional[dict]) -> None:
+        if self.search_index is not None and event in ("post_created", "post_updated", "post_deleted"):
+            self.search_index.on_change(event, previous, current)
+            self.search_index_changes += 1
+
+    async def backfill_search_fields(self) -> None:
+        """Add search fields to posts written before search existed"""
+        cursor = self.db.blog_posts.find(
+            {"search": {"$exists": False}},
+            {"id": 1, "title": 1, "excerpt": 1, "content": 1, "tags": 1}
+        )
+        batch = []
+        async for post in cursor:
+            batch.append(UpdateOne({"_id": post["_id"]}, {"$set": {"search": search_fields(post)}}))
+            if len(batch) >= 500:
+                await self.db.blog_posts.bulk_write(batch, ordered=False)
+                batch = []
+        if batch:
+            await self.db.blog_posts.bulk_write(batch, ordered=False)
+
     async def get_post_by_slug(self, slug: str) -> Optional[dict]:
         """Get a single blog post by slug"""
-        post = await self.db.blog_posts.find_one({"slug": slug})
-        return post
+        version = await self.get_collection_version("blog_posts")
+        return await self.cache.get_or_load(
+            ("post", slug, version), lambda: self.db.blog_posts.find_one({"slug": slug}, POST_PROJECTION)
+        )
 
     async def get_post_by_id(self, post_id: str) -> Optional[dict]:
         """Get a single blog post by ID"""
@@ -71,69 +307,330 @@ class Database:
 
     async def create_post(self, post_data: dict) -> dict:
         """Create a new blog post"""
-        post_data["createdAt"] = datetime.utcnow()
-        post_data["updatedAt"] = datetime.utcnow()
-        
-        result = await self.db.blog_posts.insert_one(post_data)
+        post_data["createdAt"] = post_data["updatedAt"] = utcnow()
+        post_data["search"] = search_fields(post_data)
         
-        # Return the created post
-        created_post = await self.db.blog_posts.find_one({"_id": result.inserted_id})
-        return created_post
+        await self.db.blog_posts.insert_one(post_data)
+        # insert_one only adds _id; the rest is exactly what was written
+        post_data.pop("_id", None)
+        post_data.pop("search", None)
+        await self._update_category_stats(None, post_data)
+        await self._bump_version("blog_posts")
+        self._invalidate_posts(post_data)
+        self._notify("post_created", None, post_data)
+        return post_data
 
     async def update_post(self, post_id: str, update_data: dict) -> Optional[dict]:
         """Update an existing blog post"""
-        update_data["updatedAt"] = datetime.utcnow()
+        if "title" not in update_data or "slug" in update_data:
+            return await self._update_post({"id": post_id}, update_data)
+        base = slugify(update_data["title"])
+        # Matching on the current slug keeps it when it is already the new
+        # title's slug (or a base-N form of it) without reading the post first
+        updated_post = await self._update_post(
+            {"id": post_id, "slug": {"$regex": variant_pattern(base)}}, update_data
+        )
+        if updated_post:
+            return updated_post
+        return await self.allocate_slug(
+            base, lambda slug: self._update_post({"id": post_id}, {**update_data, "slug": slug})
+        )
+
+    async def _update_post(self, query: dict, update_data: dict) -> Optional[dict]:
+        update_data["updatedAt"] = utcnow()
+        update = dict(update_data)
+        for field, value in search_fields(update_data).items():
+            update[f"search.{field}"] = value
         
-        result = await self.db.blog_posts.update_one(
-            {"id": post_id},
-            {"$set": update_data}
+        # The pre-image is needed for cache invalidation and the change
+        # listeners; the updated post is derived from it locally
+        previous_post = await self.db.blog_posts.find_one_and_update(
+            query,
+            {"$set": update},
+            POST_PROJECTION,
+            return_document=ReturnDocument.BEFORE
         )
         
-        if result.modified_count > 0:
-            updated_post = await self.db.blog_posts.find_one({"id": post_id})
+        if previous_post:
+            updated_post = dict(previous_post, **update_data)
+            await self._update_category_stats(previous_post, updated_post)
+            await self._bump_version("blog_posts")
+            self._invalidate_posts(previous_post, updated_post)
+            self._notify("post_updated", previous_post, updated_post)
             return updated_post
         
         return None
 
     async def delete_post(self, post_id: str) -> bool:
         """Delete a blog post"""
-        result = await self.db.blog_posts.delete_one({"id": post_id})
-        return result.deleted_count > 0
+        deleted_post = await self.db.blog_posts.find_one_and_delete(
+            {"id": post_id}, POST_PROJECTION
+        )
+        if deleted_post:
+            await self._update_category_stats(deleted_post, None)
+            await self._bump_version("blog_posts")
+            self._invalidate_posts(deleted_post)
+            self._notify("post_deleted", deleted_post, None)
+        return deleted_post is not None
+
+    async def import_posts(self, batches: AsyncIterable[List[dict]]) -> Dict[str, int]:
+        """Upsert posts by slug with one ordered bulk_write per batch.
+
+        New posts (no slug) are matched on their id as well, so a slug taken
+        between allocation and the write fails on the unique index instead
+        of overwriting the post that took it. Derived data (category stats,
+        the in-process search index, cached reads) is rebuilt once at the end
+        instead of per post.
+        """
+        counts = {"inserted": 0, "updated": 0}
+        position = 0
+        try:
+            async for batch in batches:
+                new = [post["slug"] is None for post in batch]
+                if any(new):
+                    await self.allocate_slugs(
+                        [post for post, is_new in zip(batch, new) if is_new],
+                        {post["slug"] for post in batch if post["slug"] is not None}
+                    )
+                now = utcnow()
+                requests = []
+                for post, is_new in zip(batch, new):
+                    fields = {k: v for k, v in post.items() if k not in ("id", "createdAt")}
+                    fields.update(search=search_fields(post), updatedAt=now)
+                    requests.append(UpdateOne(
+                        {"slug": post["slug"], "id": post["id"]} if is_new else {"slug": post["slug"]},
+                        {"$set": fields, "$setOnInsert": {"id": post["id"], "createdAt": post.get("createdAt", now)}},
+                        upsert=True
+                    ))
+                try:
+                    result = await self.db.blog_posts.bulk_write(requests, ordered=True)
+                except BulkWriteError as e:
+                    counts["inserted"] += e.details.get("nUpserted", 0)
+                    counts["updated"] += e.details.get("nMatched", 0)
+                    error = e.details["writeErrors"][0]
+                    raise BulkImportError(error.get("errmsg", str(e)), position + error["index"], counts)
+                counts["inserted"] += result.upserted_count
+                counts["updated"] += result.matched_count
+                position += len(batch)
+        finally:
+            if counts["inserted"] or counts["updated"]:
+                await self.rebuild_category_stats()
+                await self._bump_version("blog_posts")
+                self.cache.clear()
+                if not self.text_search_available:
+                    await self.build_search_index()
+                self._notify("posts_imported", None, None)
+        return counts
+
+    async def replace_posts(self, posts: Iterable[dict], batch_size: int = 1000, concurrency: int = 4) -> int:
+        """Replace every post, inserting concurrent unordered batches"""
+        def with_search_fields(posts: Iterable[dict]) -> Iterable[dict]:
+            for post in posts:
+                post["search"] = search_fields(post)
+                yield post
+
+        await self.db.blog_posts.delete_many({})
+        try:
+            return await self._insert_batches(self.db.blog_posts, with_search_fields(posts), batch_size, concurrency)
+        finally:
+            await self.rebuild_category_stats()
+            await self._bump_version("blog_posts")
+            self.cache.clear()
+            if not self.text_search_available:
+                await self.build_search_index()
+            self._notify("posts_imported", None, None)
+
+    async def _insert_batches(self, collection, documents: Iterable[dict], batch_size: int, concurrency: int) -> int:
+        """insert_many documents in batches, up to concurrency at a time.
+
+        Stops at the first failed batch and raises its error once the
+        batches already started have finished.
+        """
+        slots = asyncio.Semaphore(concurrency)
+        tasks: List[asyncio.Task] = []
+        count = 0
+
+        async def insert(batch: List[dict]) -> None:
+            try:
+                await collection.insert_many(batch, ordered=False)
+            finally:
+                slots.release()
+
+        try:
+            for batch in batched(documents, batch_size):
+                await slots.acquire()
+                if any(task.done() and task.exception() for task in tasks):
+                    slots.release()
+                    break
+                tasks.append(asyncio.create_task(insert(batch)))
+                count += len(batch)
+        finally:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return count
+
+    async def reserve_slug_suffixes(self, base: str, count: int = 1, above: int = 0) -> int:
+        """Reserve suffixes from the slug_counters document of base"""
+        # "issued" counts the suffixes handed out; suffix N is the (N-1)th
+        if above:
+            await self.db.slug_counters.update_one(
+                {"_id": base}, {"$max": {"issued": above - 1}}, upsert=True
+            )
+        counter = await self.db.slug_counters.find_one_and_update(
+            {"_id": base},
+            {"$inc": {"issued": count}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        return counter["issued"] - count + 2
+
+    async def find_taken_slugs(self, slugs: List[str]) -> Set[str]:
+        cursor = self.db.blog_posts.find({"slug": {"$in": slugs}}, {"_id": 0, "slug": 1})
+        return {post["slug"] async for post in cursor}
+
+    async def max_slug_suffix(self, base: str) -> int:
+        # Anchored prefix regex, served by the slug index
+        cursor = self.db.blog_posts.find({"slug": {"$regex": suffix_pattern(base)}}, {"_id": 0, "slug": 1})
+        return max([slug_suffix(post["slug"], base) async for post in cursor], default=0)
+
+    def _invalidate_posts(self, *posts: Optional[dict]) -> None:
+        """Drop the cached reads a write to these post versions can affect"""
+        posts = [post for post in posts if post]
+        categories = {post.get("category") for post in posts}
+        slugs = {post.get("slug") for post in posts}
+        self.cache.invalidate_where(lambda key: key[0] == "post" and key[1] in slugs)
+        self.cache.invalidate_where(
+            lambda key: key[0] == "posts" and (key[1] is None or key[1] in categories)
+        )
+        self.cache.invalidate_where(lambda key: key[0] == "category_stats")
 
     async def get_categories(self) -> List[str]:
         """Get all unique categories from blog posts"""
-        categories = await self.db.blog_posts.distinct("category")
-        return ["Tümü"] + sorted(categories)
+        stats = await self.get_category_stats()
+        return ["Tümü"] + [entry["category"] for entry in stats]
 
-    async def slug_exists(self, slug: str, exclude_id: Optional[str] = None) -> bool:
-        """Check if a slug already exists"""
-        query = {"slug": slug}
-        if exclude_id:
-            query["id"] = {"$ne": exclude_id}
-        
-        post = await self.db.blog_posts.find_one(query)
-        return post is not None
+    async def get_category_stats(self) -> List[dict]:
+        """Post count and latest publish date per category, by category name"""
+        version = await self.get_collection_version("blog_posts")
+        return await self.cache.get_or_load(("category_stats", version), self._find_category_stats)
+
+    async def _find_category_stats(self) -> List[dict]:
+        cursor = self.db.category_stats.find(
+            {"count": {"$gt": 0}}, {"_id": 0}
+        ).sort("category", 1)
+        return await cursor.to_list(length=None)
+
+    async def rebuild_category_stats(self) -> None:
+        """Recompute the category_stats collection from the posts"""
+        pipeline = [
+            {"$group": {
+                "_id": "$category",
+                "count": {"$sum": 1},
+                "latestPublishDate": {"$max": "$publishDate"}
+            }}
+        ]
+        stats = await self.db.blog_posts.aggregate(pipeline).to_list(length=None)
+        await self.db.category_stats.delete_many({})
+        if stats:
+            await self.db.category_stats.insert_many([
+                {"category": entry["_id"], "count": entry["count"], "latestPublishDate": entry["latestPublishDate"]}
+                for entry in stats if entry["_id"]
+            ])
+
+    async def _update_category_stats(self, previous: Optional[dict], current: Optional[dict]) -> None:
+        """Apply one post write to the category stats"""
+        before = previous.get("category") if previous else None
+        after = current.get("category") if current else None
+        if after and after != before:
+            await self.db.category_stats.update_one(
+                {"category": after},
+                {"$inc": {"count": 1}, "$max": {"latestPublishDate": current.get("publishDate")}},
+                upsert=True
+            )
+        elif after and previous.get("publishDate") != current.get("publishDate"):
+            await self._refresh_latest_publish_date(after)
+        if before and before != after:
+            stats = await self.db.category_stats.find_one_and_update(
+                {"category": before},
+                {"$inc": {"count": -1}},
+                return_document=ReturnDocument.AFTER
+            )
+            if stats and stats["count"] <= 0:
+                await self.db.category_stats.delete_one({"category": before, "count": {"$lte": 0}})
+            elif stats and stats.get("latestPublishDate") == previous.get("publishDate"):
+                await self._refresh_latest_publish_date(before)
+
+    async def _refresh_latest_publish_date(self, category: str) -> None:
+        # Served by the (category, publishDate, id) index
+        latest = await self.db.blog_posts.find_one(
+            {"category": category}, {"_id": 0, "publishDate": 1}, sort=POST_SORT
+        )
+        if latest:
+            await self.db.category_stats.update_one(
+                {"category": category}, {"$set": {"latestPublishDate": latest["publishDate"]}}
+            )
 
     # Contact Messages Methods
     async def create_contact_message(self, message_data: dict) -> dict:
-        """Create a new contact message"""
-        message_data["createdAt"] = datetime.utcnow()
-        
-        result = await self.db.contact_messages.insert_one(message_data)
+        """Create a new contact message.
+
+        The message is written in a batch with other submissions; this
+        returns once that batch has been inserted.
+        """
+        message_data["createdAt"] = utcnow()
         
-        # Return the created message
-        created_message = await self.db.contact_messages.find_one({"_id": result.inserted_id})
-        return created_message
+        await self.contact_writes.submit(message_data)
+        return message_data
+
+    async def _insert_contact_messages(self, messages: List[dict]) -> None:
+        await self.db.contact_messages.insert_many(messages, ordered=True)
 
-    async def get_contact_messages(self, status: Optional[str] = None) -> List[dict]:
-        """Get contact messages with optional status filter"""
+    async def replace_contact_messages(
+        self, messages: Iterable[dict], batch_size: int = 1000, concurrency: int = 4
+    ) -> int:
+        """Replace every contact message, inserting concurrent unordered batches"""
+        await self.db.contact_messages.delete_many({})
+        return await self._insert_batches(self.db.contact_messages, messages, batch_size, concurrency)
+
+    async def get_contact_messages(
+        self,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[str] = None
+    ) -> List[dict]:
+        """Get contact messages with optional status filter, newest first.
+
+        ``after`` is a cursor from encode_cursor, as for get_posts.
+        """
         query = {}
         if status:
             query["status"] = status
         
-        messages = await self.db.contact_messages.find(query).sort("createdAt", -1).to_list(None)
+        if after:
+            created_at, message_id = decode_message_cursor(after)
+            query["$or"] = [
+                {"createdAt": {"$lt": created_at}},
+                {"createdAt": created_at, "id": {"$lt": message_id}}
+            ]
+        
+        cursor = self.db.contact_messages.find(query, {"_id": 0}).sort(MESSAGE_SORT)
+        if limit:
+            cursor = cursor.limit(limit)
+        
+        messages = await cursor.to_list(None)
         return messages
 
+    async def count_contact_messages(self) -> dict:
+        """Count contact messages per status in one aggregation"""
+        counts = {}
+        async for row in self.db.contact_messages.aggregate([
+            {"$group": {"_id": "$status", "count": {"$sum": 1}}}
+        ]):
+            counts[row["_id"]] = row["count"]
+        return counts
+
     async def update_message_status(self, message_id: str, status: str) -> bool:
         """Update contact message status"""
         result = await self.db.contact_messages.update_one(
@@ -145,22 +642,31 @@ class Database:
     # About Content Methods
     async def get_about_content(self) -> Optional[dict]:
         """Get about page content"""
-        content = await self.db.about_content.find_one({"key": "about_content"})
-        return content
+        # Versioned like the post lists, so a write made by another worker is
+        # never answered from this worker's cache
+        version = await self.get_collection_version("about_content")
+        return await self.cache.get_or_load(
+            ("about", version), lambda: self.db.about_content.find_one({"key": "about_content"}, {"_id": 0})
+        )
 
-    async def update_about_content(self, content_data: dict) -> dict:
-        """Update about page content"""
-        content_data["updatedAt"] = datetime.utcnow()
-        content_data["key"] = "about_content"
+    async def update_about_content(self, content_data: dict, defaults: Optional[dict] = None) -> dict:
+        """Update about page content; defaults fill the fields of a new document"""
+        content_data["updatedAt"] = utcnow()
+        update = {"$set": content_data}
+        defaults = {k: v for k, v in (defaults or {}).items() if k not in content_data and k != "key"}
+        if defaults:
+            update["$setOnInsert"] = defaults
         
-        result = await self.db.about_content.update_one(
+        updated_content = await self.db.about_content.find_one_and_update(
             {"key": "about_content"},
-            {"$set": content_data},
-            upsert=True
+            update,
+            {"_id": 0},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
         )
-        
-        # Return the updated content
-        updated_content = await self.db.about_content.find_one({"key": "about_content"})
+        await self._bump_version("about_content")
+        self.cache.invalidate_where(lambda key: key[0] == "about")
+        self._notify("about_updated", None, updated_content)
         return updated_content
 
 # Global database instance
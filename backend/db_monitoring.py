@@ -0,0 +1,158 @@
+"""
+Connection pool settings and monitoring for the MongoDB client
+The listeners are called by PyMongo on Motor's worker threads, so they only
+do constant-time bookkeeping, under a lock: unlike a lost counter increment,
+a lost gauge update would leave the open/in-use counts off for good
+"""
+import os
+import threading
+import time
+from typing import Dict
+
+from pymongo import monitoring
+
+from metrics import Histogram, PrometheusText, record_db_time
+
+# Environment variable -> MongoClient keyword argument
+POOL_SETTINGS = {
+    "MONGO_MAX_POOL_SIZE": "maxPoolSize",
+    "MONGO_MIN_POOL_SIZE": "minPoolSize",
+    "MONGO_MAX_IDLE_TIME_MS": "maxIdleTimeMS",
+    "MONGO_WAIT_QUEUE_TIMEOUT_MS": "waitQueueTimeoutMS",
+    "MONGO_CONNECT_TIMEOUT_MS": "connectTimeoutMS",
+    "MONGO_SOCKET_TIMEOUT_MS": "socketTimeoutMS",
+    "MONGO_SERVER_SELECTION_TIMEOUT_MS": "serverSelectionTimeoutMS",
+}
+
+
+def pool_options() -> Dict[str, int]:
+    """Client pool options set in the environment; unset ones keep the driver default"""
+    return {
+        option: int(os.environ[name])
+        for name, option in POOL_SETTINGS.items()
+        if os.environ.get(name)
+    }
+
+
+class PoolMetrics(monitoring.ConnectionPoolListener):
+    """Connection counts and checkout wait times (CMAP events)"""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.checkout_wait = Histogram()
+        self.open = 0
+        self.in_use = 0
+        self.max_in_use = 0
+        self.checkout_failures: Dict[str, int] = {}
+        self.pool_clears = 0
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self.pool_clears += 1
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        with self._lock:
+            self.open += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        with self._lock:
+            self.open -= 1
+
+    def connection_check_out_started(self, event):
+        # Started and checked-out events of one checkout share a thread
+        self._local.started = time.perf_counter()
+
+    def connection_check_out_failed(self, event):
+        self._local.started = None
+        reason = str(event.reason)
+        with self._lock:
+            self.checkout_failures[reason] = self.checkout_failures.get(reason, 0) + 1
+
+    def connection_checked_out(self, event):
+        started = getattr(self._local, "started", None)
+        self._local.started = None
+        with self._lock:
+            if started is not None:
+                self.checkout_wait.observe(time.perf_counter() - started)
+            self.in_use += 1
+            if self.in_use > self.max_in_use:
+                self.max_in_use = self.in_use
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self.in_use -= 1
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "open": self.open,
+                "inUse": self.in_use,
+                "maxInUse": self.max_in_use,
+                "checkoutWait": self.checkout_wait.snapshot(),
+                "checkoutFailures": dict(self.checkout_failures),
+                "poolClears": self.pool_clears,
+            }
+
+    def write(self, out: PrometheusText) -> None:
+        name = out.metric("mongo_pool_connections", "gauge", "MongoDB pool connections by state")
+        out.sample(name, {"state": "open"}, self.open)
+        out.sample(name, {"state": "in_use"}, self.in_use)
+        name = out.metric("mongo_pool_checkout_wait_seconds", "histogram", "Time spent waiting for a pooled connection")
+        out.histogram(name, {}, self.checkout_wait)
+
+
+class CommandMetrics(monitoring.CommandListener):
+    """Server round-trip latency per command name"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latency: Dict[str, Histogram] = {}
+        self.failures: Dict[str, int] = {}
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        self._observe(event)
+
+    def failed(self, event):
+        self._observe(event)
+        with self._lock:
+            self.failures[event.command_name] = self.failures.get(event.command_name, 0) + 1
+
+    def _observe(self, event):
+        seconds = event.duration_micros / 1e6
+        with self._lock:
+            histogram = self.latency.get(event.command_name)
+            if histogram is None:
+                histogram = self.latency[event.command_name] = Histogram()
+            histogram.observe(seconds)
+        record_db_time(seconds)
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "latency": {name: histogram.snapshot() for name, histogram in sorted(self.latency.items())},
+                "failures": dict(self.failures),
+            }
+
+    def write(self, out: PrometheusText) -> None:
+        name = out.metric("mongo_command_duration_seconds", "histogram", "MongoDB command latency")
+        for command, histogram in sorted(self.latency.items()):
+            out.histogram(name, {"command": command}, histogram)
+        name = out.metric("mongo_command_failures_total", "counter", "Failed MongoDB commands")
+        for command, count in sorted(self.failures.items()):
+            out.sample(name, {"command": command}, count)
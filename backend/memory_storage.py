@@ -0,0 +1,418 @@
+"""
+In-memory storage backend (STORAGE_BACKEND=memory)
+Everything lives in process: posts are indexed by id, slug, (publishDate, id)
+order, category and featured flag, so every read is a hash lookup or an
+ordered walk over a sorted index. Meant for tests, benchmarks of the API
+layer and single-worker deployments; data is only kept across restarts when
+MEMORY_SNAPSHOT_PATH is set (written on shutdown, loaded on startup).
+"""
+import json
+import logging
+import os
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from pymongo.errors import DuplicateKeyError
+
+from cache import TTLCache
+from search_index import InvertedIndex
+from slugs import slugify, slug_suffix
+from storage import (
+    Storage, BulkImportError, POST_PROJECTION, POST_SUMMARY_PROJECTION,
+    decode_cursor, decode_message_cursor, utcnow, category_key
+)
+
+logger = logging.getLogger(__name__)
+
+_DATETIME_FIELDS = ("createdAt", "updatedAt")
+
+
+class SortedKeys:
+    """Ascending list of sort keys, walked newest first"""
+
+    def __init__(self):
+        self._keys: List[tuple] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: tuple) -> None:
+        insort(self._keys, key)
+
+    def remove(self, key: tuple) -> None:
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            del self._keys[i]
+
+    def last(self) -> Optional[tuple]:
+        return self._keys[-1] if self._keys else None
+
+    def descending(self, before: Optional[tuple] = None) -> Iterator[tuple]:
+        """Keys in descending order, only those strictly below ``before``"""
+        i = bisect_left(self._keys, before) if before is not None else len(self._keys)
+        keys = self._keys
+        while i > 0:
+            i -= 1
+            yield keys[i]
+
+
+def project(document: dict, projection: dict) -> dict:
+    """Apply a MongoDB-style inclusion or exclusion projection"""
+    included = [field for field, value in projection.items() if value == 1 and field != "_id"]
+    if included:
+        return {field: document[field] for field in included if field in document}
+    return {field: value for field, value in document.items() if projection.get(field, 1) != 0}
+
+
+def _duplicate_key(field: str, value) -> DuplicateKeyError:
+    # Same shape as the server error, so is_duplicate_key works unchanged
+    return DuplicateKeyError(
+        f"E11000 duplicate key error dup key: {{ {field}: {value!r} }}",
+        11000,
+        {"keyPattern": {field: 1}, "keyValue": {field: value}}
+    )
+
+
+def _post_key(post: dict) -> Tuple[str, str]:
+    return (post["publishDate"], post["id"])
+
+
+def _message_key(message: dict) -> Tuple[datetime, str]:
+    return (message["createdAt"], message["id"])
+
+
+class MemoryDatabase(Storage):
+    """In-process storage backend with secondary indexes"""
+
+    def __init__(self):
+        super().__init__()
+        # Reads are already in memory; disabled caches keep the interface
+        self.cache = TTLCache(ttl=0)
+        self.version_cache = TTLCache(ttl=0)
+        self.snapshot_path: Optional[str] = None
+        self._versions: Dict[str, int] = {}
+        self._reset()
+
+    def _reset(self) -> None:
+        self._posts: Dict[str, dict] = {}
+        self._slugs: Dict[str, str] = {}                 # slug -> post id
+        self._slug_counters: Dict[str, int] = {}         # base -> suffixes issued
+        self._by_date = SortedKeys()
+        self._by_category: Dict[str, SortedKeys] = {}
+        self._featured = SortedKeys()
+        self.search_index = InvertedIndex()
+        self._messages: Dict[str, dict] = {}
+        self._messages_by_date = SortedKeys()
+        self._messages_by_status: Dict[str, SortedKeys] = {}
+        self._about: Optional[dict] = None
+
+    async def connect(self):
+        """Load the snapshot file, if one is configured"""
+        self.snapshot_path = os.environ.get('MEMORY_SNAPSHOT_PATH') or None
+        if self.snapshot_path and os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, encoding="utf-8") as f:
+                self.load(json.load(f))
+            logger.info(f"Loaded {len(self._posts)} posts from {self.snapshot_path}")
+
+    async def disconnect(self):
+        """Write the snapshot file, if one is configured"""
+        if self.snapshot_path:
+            tmp_path = self.snapshot_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.dump(), f, ensure_ascii=False, default=lambda value: value.isoformat())
+            os.replace(tmp_path, self.snapshot_path)
+
+    def dump(self) -> dict:
+        return {
+            "blog_posts": list(self._posts.values()),
+            "contact_messages": list(self._messages.values()),
+            "about_content": self._about,
+            "collection_versions": self._versions,
+        }
+
+    def load(self, data: dict) -> None:
+        """Replace all contents with a dump() result (datetimes may be ISO strings)"""
+        def parse(document: dict) -> dict:
+            document = dict(document)
+            for field in _DATETIME_FIELDS:
+                if isinstance(document.get(field), str):
+                    document[field] = datetime.fromisoformat(document[field])
+            return document
+
+        self._reset()
+        for post in data.get("blog_posts", []):
+            self._index_post(parse(post))
+        for message in data.get("contact_messages", []):
+            self._index_message(parse(message))
+        if data.get("about_content"):
+            self._about = parse(data["about_content"])
+        self._versions = dict(data.get("collection_versions", {}))
+        # Bump so that version-keyed ETags from before the load go stale
+        for name in ("blog_posts", "about_content"):
+            self._bump_version(name)
+
+    # Collection Versions
+    async def get_collection_version(self, name: str) -> int:
+        return self._versions.get(name, 0)
+
+    def _bump_version(self, name: str) -> None:
+        self._versions[name] = self._versions.get(name, 0) + 1
+
+    # Blog Posts Methods
+    def _index_post(self, post: dict) -> None:
+        key = _post_key(post)
+        self._posts[post["id"]] = post
+        self._slugs[post["slug"]] = post["id"]
+        self._by_date.add(key)
+        self._by_category.setdefault(post["category"], SortedKeys()).add(key)
+        if post.get("featured"):
+            self._featured.add(key)
+        self.search_index.add(post)
+
+    def _unindex_post(self, post: dict) -> None:
+        key = _post_key(post)
+        del self._posts[post["id"]]
+        if self._slugs.get(post["slug"]) == post["id"]:
+            del self._slugs[post["slug"]]
+        self._by_date.remove(key)
+        bucket = self._by_category.get(post["category"])
+        if bucket is not None:
+            bucket.remove(key)
+            if not bucket:
+                del self._by_category[post["category"]]
+        self._featured.remove(key)
+        self.search_index.remove(post["id"])
+
+    async def get_posts(
+        self,
+        category: Optional[str] = None,
+        featured_only: bool = False,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        projection: Optional[dict] = None
+    ) -> List[dict]:
+        """Get blog posts with optional filtering, newest first"""
+        projection = projection or POST_PROJECTION
+        category = category_key(category)
+        before = decode_cursor(after) if after else None
+
+        if category:
+            index = self._by_category.get(category)
+            if index is None:
+                return []
+        elif featured_only:
+            index = self._featured
+        else:
+            index = self._by_date
+
+        posts = []
+        for key in index.descending(before):
+            post = self._posts[key[1]]
+            if featured_only and not post.get("featured"):
+                continue
+            posts.append(project(post, projection))
+            if limit and len(posts) >= limit:
+                break
+        return posts
+
+    async def iter_posts(self, projection: Optional[dict] = None) -> AsyncIterator[dict]:
+        """Every post in insertion order"""
+        for post in list(self._posts.values()):
+            yield project(post, projection or POST_PROJECTION)
+
+    async def search_posts(self, query: str, limit: int = 10, skip: int = 0) -> List[dict]:
+        """Full-text search over posts, best matches first"""
+        return [
+            dict(project(self._posts[post_id], POST_SUMMARY_PROJECTION), score=score)
+            for post_id, score in self.search_index.search(query, limit=limit, offset=skip)
+            if post_id in self._posts
+        ]
+
+    async def get_post_by_slug(self, slug: str) -> Optional[dict]:
+        post_id = self._slugs.get(slug)
+        return project(self._posts[post_id], POST_PROJECTION) if post_id else None
+
+    async def get_post_by_id(self, post_id: str) -> Optional[dict]:
+        post = self._posts.get(post_id)
+        return dict(post) if post else None
+
+    async def create_post(self, post_data: dict) -> dict:
+        """Create a new blog post"""
+        if post_data["id"] in self._posts:
+            raise _duplicate_key("id", post_data["id"])
+        if post_data["slug"] in self._slugs:
+            raise _duplicate_key("slug", post_data["slug"])
+        post_data["createdAt"] = post_data["updatedAt"] = utcnow()
+
+        self._index_post(dict(post_data))
+        self._bump_version("blog_posts")
+        self._notify("post_created", None, post_data)
+        return post_data
+
+    async def update_post(self, post_id: str, update_data: dict) -> Optional[dict]:
+        """Update an existing blog post"""
+        previous_post = self._posts.get(post_id)
+        if previous_post is None:
+            return None
+        if "title" in update_data and "slug" not in update_data:
+            base = slugify(update_data["title"])
+            if previous_post["slug"] != base and slug_suffix(previous_post["slug"], base) is None:
+                return await self.allocate_slug(
+                    base, lambda slug: self.update_post(post_id, {**update_data, "slug": slug})
+                )
+        slug_owner = self._slugs.get(update_data.get("slug"))
+        if slug_owner is not None and slug_owner != post_id:
+            raise _duplicate_key("slug", update_data["slug"])
+        update_data["updatedAt"] = utcnow()
+
+        updated_post = dict(previous_post, **update_data)
+        self._unindex_post(previous_post)
+        self._index_post(updated_post)
+        self._bump_version("blog_posts")
+        self._notify("post_updated", previous_post, updated_post)
+        return dict(updated_post)
+
+    async def delete_post(self, post_id: str) -> bool:
+        """Delete a blog post"""
+        deleted_post = self._posts.get(post_id)
+        if deleted_post is None:
+            return False
+        self._unindex_post(deleted_post)
+        self._bump_version("blog_posts")
+        self._notify("post_deleted", deleted_post, None)
+        return True
+
+    async def import_posts(self, batches: AsyncIterable[List[dict]]) -> Dict[str, int]:
+        """Upsert posts by slug, in order"""
+        counts = {"inserted": 0, "updated": 0}
+        position = 0
+        try:
+            async for batch in batches:
+                new = [post for post in batch if post["slug"] is None]
+                if new:
+                    await self.allocate_slugs(new, {post["slug"] for post in batch if post["slug"] is not None})
+                now = utcnow()
+                for post in batch:
+                    previous_id = self._slugs.get(post["slug"])
+                    if previous_id is None:
+                        if post["id"] in self._posts:
+                            raise BulkImportError(f"E11000 duplicate key error dup key: {{ id: {post['id']!r} }}", position, counts)
+                        self._index_post(dict(post, createdAt=post.get("createdAt", now), updatedAt=now))
+                        counts["inserted"] += 1
+                    else:
+                        previous_post = self._posts[previous_id]
+                        self._unindex_post(previous_post)
+                        self._index_post(dict(post, id=previous_id, createdAt=previous_post["createdAt"], updatedAt=now))
+                        counts["updated"] += 1
+                    position += 1
+        finally:
+            if counts["inserted"] or counts["updated"]:
+                self._bump_version("blog_posts")
+                self._notify("posts_imported", None, None)
+        return counts
+
+    async def replace_posts(self, posts: Iterable[dict], batch_size: int = 1000, concurrency: int = 4) -> int:
+        """Replace every post with one bulk load, which also builds the indexes"""
+        data = self.dump()
+        data["blog_posts"] = list(posts)
+        self.load(data)
+        self._notify("posts_imported", None, None)
+        return len(data["blog_posts"])
+
+    async def reserve_slug_suffixes(self, base: str, count: int = 1, above: int = 0) -> int:
+        issued = max(self._slug_counters.get(base, 0), above - 1) + count
+        self._slug_counters[base] = issued
+        return issued - count + 2
+
+    async def find_taken_slugs(self, slugs: List[str]) -> Set[str]:
+        return {slug for slug in slugs if slug in self._slugs}
+
+    async def max_slug_suffix(self, base: str) -> int:
+        suffixes = (slug_suffix(slug, base) for slug in self._slugs)
+        return max((suffix for suffix in suffixes if suffix is not None), default=0)
+
+    async def get_categories(self) -> List[str]:
+        """Get all unique categories from blog posts"""
+        return ["Tümü"] + sorted(self._by_category)
+
+    async def get_category_stats(self) -> List[dict]:
+        """Post count and latest publish date per category, from the buckets"""
+        return [
+            {"category": category, "count": len(bucket), "latestPublishDate": bucket.last()[0]}
+            for category, bucket in sorted(self._by_category.items())
+        ]
+
+    # Contact Messages Methods
+    def _index_message(self, message: dict) -> None:
+        key = _message_key(message)
+        self._messages[message["id"]] = message
+        self._messages_by_date.add(key)
+        self._messages_by_status.setdefault(message["status"], SortedKeys()).add(key)
+
+    async def create_contact_message(self, message_data: dict) -> dict:
+        """Create a new contact message"""
+        if message_data["id"] in self._messages:
+            raise _duplicate_key("id", message_data["id"])
+        message_data["createdAt"] = utcnow()
+        self._index_message(dict(message_data))
+        return message_data
+
+    async def replace_contact_messages(
+        self, messages: Iterable[dict], batch_size: int = 1000, concurrency: int = 4
+    ) -> int:
+        data = self.dump()
+        data["contact_messages"] = list(messages)
+        self.load(data)
+        return len(data["contact_messages"])
+
+    async def get_contact_messages(
+        self,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[str] = None
+    ) -> List[dict]:
+        """Get contact messages with optional status filter, newest first"""
+        before = decode_message_cursor(after) if after else None
+        index = self._messages_by_status.get(status) if status else self._messages_by_date
+        if index is None:
+            return []
+
+        messages = []
+        for key in index.descending(before):
+            messages.append(dict(self._messages[key[1]]))
+            if limit and len(messages) >= limit:
+                break
+        return messages
+
+    async def count_contact_messages(self) -> dict:
+        """Count contact messages per status"""
+        return {status: len(keys) for status, keys in self._messages_by_status.items() if keys}
+
+    async def update_message_status(self, message_id: str, status: str) -> bool:
+        """Update contact message status; False when nothing changed"""
+        message = self._messages.get(message_id)
+        if message is None or message["status"] == status:
+            return False
+        key = _message_key(message)
+        self._messages_by_status[message["status"]].remove(key)
+        self._messages[message_id] = dict(message, status=status)
+        self._messages_by_status.setdefault(status, SortedKeys()).add(key)
+        return True
+
+    # About Content Methods
+    async def get_about_content(self) -> Optional[dict]:
+        return dict(self._about) if self._about else None
+
+    async def update_about_content(self, content_data: dict, defaults: Optional[dict] = None) -> dict:
+        """Update about page content; defaults fill the fields of a new document"""
+        content_data["updatedAt"] = utcnow()
+        if self._about is None:
+            base = {k: v for k, v in (defaults or {}).items() if k != "key"}
+            self._about = dict(base, key="about_content", **content_data)
+        else:
+            self._about = dict(self._about, **content_data)
+        self._bump_version("about_content")
+        updated_content = dict(self._about)
+        self._notify("about_updated", None, updated_content)
+        return updated_content
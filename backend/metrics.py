@@ -0,0 +1,183 @@
+"""
+Minimal in-process metrics primitives and the Prometheus text exposition
+Counters and histograms are plain Python lists and dicts updated without
+locks; a lost increment under thread contention is acceptable for
+monitoring data
+"""
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from fastapi import Request
+from starlette.routing import Match
+
+# Latency buckets in seconds, from 0.5 ms to 10 s
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+class Histogram:
+    """Fixed-bucket histogram; counts[i] holds observations <= buckets[i],
+    the last slot holds everything larger"""
+
+    __slots__ = ("buckets", "counts", "sum")
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th observation"""
+        total = self.count
+        if not total:
+            return None
+        rank = q * total
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> Dict[str, object]:
+        count = self.count
+        return {
+            "count": count,
+            "sum": round(self.sum, 6),
+            "mean": round(self.sum / count, 6) if count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": {str(bound): n for bound, n in zip(self.buckets, self.counts)},
+        }
+
+
+# Per-request accumulator of MongoDB command time; Motor runs commands with
+# a copy of the caller's context, so the command listener sees the request's
+_db_time: ContextVar[Optional[List[float]]] = ContextVar("db_time", default=None)
+
+
+def record_db_time(seconds: float) -> None:
+    """Add command time to the current request, if there is one"""
+    accumulator = _db_time.get()
+    if accumulator is not None:
+        accumulator[0] += seconds
+
+
+class RequestMetrics:
+    """Request counts by (method, route, status) and latency and DB time
+    histograms by (method, route)"""
+
+    def __init__(self):
+        self.requests: Dict[Tuple[str, str, int], int] = {}
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.db_time: Dict[Tuple[str, str], Histogram] = {}
+
+    def observe(self, method: str, route: str, status: int, seconds: float, db_seconds: float) -> None:
+        key = (method, route, status)
+        self.requests[key] = self.requests.get(key, 0) + 1
+        route_key = (method, route)
+        latency = self.latency.get(route_key)
+        if latency is None:
+            latency = self.latency[route_key] = Histogram()
+            self.db_time[route_key] = Histogram()
+        latency.observe(seconds)
+        self.db_time[route_key].observe(db_seconds)
+
+    async def dispatch(self, request: Request, call_next):
+        accumulator = [0.0]
+        token = _db_time.set(accumulator)
+        start = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            elapsed = time.perf_counter() - start
+            self.observe(request.method, route_label(request), status, elapsed, accumulator[0])
+            _db_time.reset(token)
+
+    def write(self, out: "PrometheusText") -> None:
+        name = out.metric("http_requests_total", "counter", "HTTP requests by route and status")
+        for (method, route, status), count in sorted(self.requests.items()):
+            out.sample(name, {"method": method, "route": route, "status": status}, count)
+        name = out.metric("http_request_duration_seconds", "histogram", "HTTP request latency")
+        for (method, route), histogram in sorted(self.latency.items()):
+            out.histogram(name, {"method": method, "route": route}, histogram)
+        name = out.metric("http_request_db_seconds", "histogram", "MongoDB command time per HTTP request")
+        for (method, route), histogram in sorted(self.db_time.items()):
+            out.histogram(name, {"method": method, "route": route}, histogram)
+
+
+def route_label(request: Request) -> str:
+    """Route template of a request, so path parameters do not explode the
+    label set; unmatched paths share one label.
+
+    Responses made before routing (e.g. 429s from the rate limiter) have no
+    route in the scope, so the path is matched against the app routes.
+    """
+    route = request.scope.get("route")
+    app = request.scope.get("app")
+    if route is None and app is not None:
+        partial = None
+        for candidate in app.router.routes:
+            match, _ = candidate.matches(request.scope)
+            if match == Match.FULL:
+                route = candidate
+                break
+            if match == Match.PARTIAL and partial is None:
+                partial = candidate
+        route = route or partial
+    return getattr(route, "path", "unmatched")
+
+
+def _escape(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class PrometheusText:
+    """Builder for the Prometheus text exposition format (version 0.0.4)"""
+
+    content_type = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, prefix: str = "zirve_"):
+        self.prefix = prefix
+        self._lines: List[str] = []
+
+    def metric(self, name: str, kind: str, help_text: str) -> str:
+        name = self.prefix + name
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {kind}")
+        return name
+
+    def sample(self, name: str, labels: Dict[str, object], value: float) -> None:
+        if labels:
+            label_text = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+            self._lines.append(f"{name}{{{label_text}}} {value}")
+        else:
+            self._lines.append(f"{name} {value}")
+
+    def histogram(self, name: str, labels: Dict[str, object], histogram: Histogram) -> None:
+        cumulative = 0
+        for bound, count in zip(histogram.buckets, histogram.counts):
+            cumulative += count
+            self.sample(f"{name}_bucket", dict(labels, le=bound), cumulative)
+        cumulative += histogram.counts[-1]
+        self.sample(f"{name}_bucket", dict(labels, le="+Inf"), cumulative)
+        self.sample(f"{name}_sum", labels, histogram.sum)
+        self.sample(f"{name}_count", labels, cumulative)
+
+    def render(self) -> str:
+        return "\n".join(self._lines) + "\n"
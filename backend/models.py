@@ -1,8 +1,9 @@
 from pydantic import BaseModel, Field, validator
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 import uuid
-import re
+
+from slugs import slugify
 
 # Blog Post Models
 class BlogPostCreate(BaseModel):
@@ -23,6 +24,24 @@ class BlogPostCreate(BaseModel):
     def validate_tags(cls, v):
         return [tag.strip() for tag in v if tag.strip()]
 
+class BlogPostImport(BlogPostCreate):
+    """One line of an NDJSON import: a new post plus the fields an export
+    carries over"""
+    id: Optional[str] = Field(None, max_length=100)
+    slug: Optional[str] = Field(None, max_length=250)
+    author: Optional[str] = Field(None, max_length=100)
+    publishDate: Optional[str] = None
+    createdAt: Optional[datetime] = None
+
+    @validator('publishDate')
+    def validate_publish_date(cls, v):
+        if v is not None:
+            try:
+                datetime.strptime(v, '%Y-%m-%d')
+            except ValueError:
+                raise ValueError('publishDate must be a YYYY-MM-DD date')
+        return v
+
 class BlogPostUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=200)
     excerpt: Optional[str] = Field(None, min_length=1, max_length=500)
@@ -49,20 +68,7 @@ class BlogPost(BaseModel):
     @staticmethod
     def generate_slug(title: str) -> str:
         """Generate URL-friendly slug from title"""
-        # Convert to lowercase and handle Turkish characters
-        slug = title.lower()
-        turkish_chars = {
-            'ç': 'c', 'ğ': 'g', 'ı': 'i', 'ö': 'o', 'ş': 's', 'ü': 'u',
-            'Ç': 'c', 'Ğ': 'g', 'İ': 'i', 'Ö': 'o', 'Ş': 's', 'Ü': 'u'
-        }
-        for turkish, english in turkish_chars.items():
-            slug = slug.replace(turkish, english)
-        
-        # Remove special characters and replace spaces with hyphens
-        slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-        slug = re.sub(r'\s+', '-', slug)
-        slug = re.sub(r'-+', '-', slug)
-        return slug.strip('-')
+        return slugify(title)
 
     @staticmethod
     def calculate_read_time(content: str) -> str:
@@ -72,6 +78,22 @@ class BlogPost(BaseModel):
         minutes = max(1, round(word_count / 200))
         return f"{minutes} dakika"
 
+class PostSummary(BaseModel):
+    """Blog post without its HTML body, used by the listing views"""
+    id: str
+    title: str
+    slug: str
+    excerpt: str
+    author: str = Field(default="Zirve Hikayem")
+    publishDate: str
+    category: str
+    tags: List[str] = Field(default=[])
+    readTime: str
+    featured: bool = Field(default=False)
+
+class PostSearchResult(PostSummary):
+    score: float
+
 # Contact Models
 class ContactMessageCreate(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
@@ -94,6 +116,15 @@ class ContactMessage(BaseModel):
     status: str = Field(default="new")  # new, read, replied
     createdAt: datetime = Field(default_factory=datetime.utcnow)
 
+class CategoryStats(BaseModel):
+    category: str
+    count: int
+    latestPublishDate: str
+
+class ContactMessageStats(BaseModel):
+    total: int
+    byStatus: Dict[str, int]
+
 # About Content Models
 class AboutContent(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -118,6 +149,23 @@ class PostsResponse(BaseModel):
     total: int
     categories: List[str]
 
+class HomeResponse(BaseModel):
+    categories: List[str]
+    featured: List[PostSummary]
+    posts: List[PostSummary]
+    nextCursor: Optional[str] = None
+
+class PostImportIssue(BaseModel):
+    line: int
+    error: str
+
+class PostImportReport(BaseModel):
+    inserted: int
+    updated: int
+    invalid: int
+    aborted: bool
+    errors: List[PostImportIssue]
+
 class MessageResponse(BaseModel):
     message: str
     status: str = "success"
\ No newline at end of file
@@ -0,0 +1,168 @@
+"""
+NDJSON export and import of blog posts
+One post per line, in the shape the API returns posts. Used by the admin
+import/export routes and by posts_cli.py; both stream, so memory use does not
+grow with the number of posts.
+"""
+import asyncio
+import json
+import uuid
+from datetime import datetime
+from typing import AsyncIterable, AsyncIterator, List, Optional, Tuple, Union
+
+from pydantic import ValidationError
+
+from models import BlogPost, BlogPostCreate, BlogPostImport
+from responses import encode_default
+from slugs import slugify
+from storage import Storage, BulkImportError, POST_PROJECTION
+
+IMPORT_BATCH_SIZE = 1000
+# Posts per chunk written to the export stream
+EXPORT_CHUNK_SIZE = 256
+# Invalid lines listed in an import report (all of them are counted)
+MAX_REPORTED_ERRORS = 100
+
+_DEFAULT_AUTHOR = BlogPost.model_fields["author"].default
+
+
+def encode_post(post: dict) -> bytes:
+    return json.dumps(post, ensure_ascii=False, separators=(",", ":"), default=encode_default).encode("utf-8") + b"\n"
+
+
+async def export_ndjson(storage: Storage) -> AsyncIterator[bytes]:
+    """All posts as NDJSON, in chunks of EXPORT_CHUNK_SIZE lines"""
+    chunk: List[bytes] = []
+    async for post in storage.iter_posts(POST_PROJECTION):
+        chunk.append(encode_post(post))
+        if len(chunk) >= EXPORT_CHUNK_SIZE:
+            yield b"".join(chunk)
+            chunk = []
+    if chunk:
+        yield b"".join(chunk)
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Split a byte stream (e.g. a request body) into lines"""
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line
+    if pending:
+        yield pending
+
+
+def prepare_post(data: dict, today: str) -> dict:
+    """Validate an imported post with BlogPostImport and fill in derived fields.
+
+    id, slug, author, publishDate and createdAt are kept when present, so an
+    export imports back unchanged. Without a slug the post is new: slug is
+    left None for storage to allocate a free one from the title.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Expected a JSON object")
+    item = BlogPostImport(**data)
+    post = item.dict(include=set(BlogPostCreate.model_fields))
+    post["id"] = item.id or str(uuid.uuid4())
+    if item.slug:
+        post["slug"] = slugify(item.slug)
+        if not post["slug"]:
+            raise ValueError("Slug has no URL-safe characters")
+    else:
+        post["slug"] = None
+        if not slugify(post["title"]):
+            raise ValueError("Title does not produce a slug")
+    post["author"] = item.author or _DEFAULT_AUTHOR
+    post["publishDate"] = item.publishDate or today
+    post["readTime"] = BlogPost.calculate_read_time(post["content"])
+    if item.createdAt:
+        post["createdAt"] = item.createdAt
+    return post
+
+
+def _describe(error: Exception) -> str:
+    if isinstance(error, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}"
+            for detail in error.errors()
+        )
+    return str(error)
+
+
+def prepare_batch(lines: List[Tuple[int, Union[bytes, str]]]) -> Tuple[List[dict], List[int], List[dict]]:
+    """Posts, their line numbers and the errors of one batch of numbered lines"""
+    today = datetime.now().strftime("%Y-%m-%d")
+    posts, numbers, errors = [], [], []
+    for number, line in lines:
+        try:
+            posts.append(prepare_post(json.loads(line), today))
+            numbers.append(number)
+        except (ValueError, TypeError) as e:
+            errors.append({"line": number, "error": _describe(e)})
+    return posts, numbers, errors
+
+
+async def _numbered_batches(
+    lines: AsyncIterable[Union[bytes, str]], batch_size: int
+) -> AsyncIterator[List[Tuple[int, Union[bytes, str]]]]:
+    batch = []
+    number = 0
+    async for line in lines:
+        number += 1
+        if line.strip():
+            batch.append((number, line))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+async def import_ndjson(
+    storage: Storage,
+    lines: AsyncIterable[Union[bytes, str]],
+    batch_size: int = IMPORT_BATCH_SIZE
+) -> dict:
+    """Import NDJSON lines; invalid lines are skipped and reported.
+
+    Batches are upserted by slug in file order; lines without a slug are
+    inserted as new posts under a free slug. Each batch is validated in a
+    worker thread while the previous one is being written. A post the
+    database rejects stops the import; everything before it stays written.
+    """
+    errors: List[dict] = []
+    invalid = 0
+    line_numbers: List[int] = []   # line of every post handed to storage
+
+    def accept(prepared: Tuple[List[dict], List[int], List[dict]]) -> List[dict]:
+        nonlocal invalid
+        posts, numbers, batch_errors = prepared
+        line_numbers.extend(numbers)
+        invalid += len(batch_errors)
+        errors.extend(batch_errors[:MAX_REPORTED_ERRORS - len(errors)])
+        return posts
+
+    async def batches() -> AsyncIterator[List[dict]]:
+        pending: Optional[asyncio.Future] = None
+        async for raw in _numbered_batches(lines, batch_size):
+            prepared = asyncio.ensure_future(asyncio.to_thread(prepare_batch, raw))
+            if pending is not None:
+                posts = accept(await pending)
+                if posts:
+                    yield posts
+            pending = prepared
+        if pending is not None:
+            posts = accept(await pending)
+            if posts:
+                yield posts
+
+    aborted = False
+    try:
+        counts = await storage.import_posts(batches())
+    except BulkImportError as e:
+        counts = e.counts
+        aborted = True
+        errors.append({"line": line_numbers[e.position], "error": str(e)})
+    return {**counts, "invalid": invalid, "aborted": aborted, "errors": errors}
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Import and export blog posts as NDJSON from the command line
+
+    python posts_cli.py export posts.ndjson
+    python posts_cli.py import posts.ndjson --batch-size 2000
+
+Works on the storage configured in .env (STORAGE_BACKEND, MONGO_URL, ...)
+directly, without going through the API; "-" reads stdin / writes stdout.
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import AsyncIterator
+
+import typer
+from dotenv import load_dotenv
+
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+from post_transfer import IMPORT_BATCH_SIZE, export_ndjson, import_ndjson
+from storage import Storage, create_storage
+
+app = typer.Typer(help="Bulk import/export of blog posts as NDJSON")
+
+
+async def _with_storage(run) -> None:
+    storage = create_storage()
+    await storage.connect()
+    try:
+        await run(storage)
+    finally:
+        await storage.disconnect()
+
+
+@app.command("export")
+def export_posts(
+    path: str = typer.Argument("-", help="Output file, or - for stdout")
+):
+    """Write every post as one JSON line"""
+    async def run(storage: Storage) -> None:
+        out = sys.stdout.buffer if path == "-" else open(path, "wb")
+        count = 0
+        start = time.perf_counter()
+        try:
+            async for chunk in export_ndjson(storage):
+                out.write(chunk)
+                count += chunk.count(b"\n")
+        finally:
+            if out is not sys.stdout.buffer:
+                out.close()
+        typer.echo(f"📤 Exported {count} posts in {time.perf_counter() - start:.1f}s", err=True)
+
+    asyncio.run(_with_storage(run))
+
+
+@app.command("import")
+def import_posts(
+    path: str = typer.Argument(..., help="NDJSON file, or - for stdin"),
+    batch_size: int = typer.Option(IMPORT_BATCH_SIZE, min=1, help="Posts per bulk write")
+):
+    """Upsert posts by slug (new posts without one); invalid lines are skipped and reported"""
+    async def lines() -> AsyncIterator[bytes]:
+        source = sys.stdin.buffer if path == "-" else open(path, "rb")
+        try:
+            for line in source:
+                yield line
+        finally:
+            if source is not sys.stdin.buffer:
+                source.close()
+
+    async def run(storage: Storage) -> None:
+        start = time.perf_counter()
+        report = await import_ndjson(storage, lines(), batch_size)
+        for error in report["errors"]:
+            typer.echo(f"⚠️  line {error['line']}: {error['error']}", err=True)
+        typer.echo(
+            f"📥 {report['inserted']} inserted, {report['updated']} updated, "
+            f"{report['invalid']} invalid in {time.perf_counter() - start:.1f}s",
+            err=True
+        )
+        if report["aborted"] or report["invalid"]:
+            raise typer.Exit(code=1)
+
+    asyncio.run(_with_storage(run))
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,230 @@
+"""
+Opt-in per-request profiling
+An admin request carrying ``X-Profile: cprofile`` or ``X-Profile: sample``
+(or one request in PROFILE_SAMPLE_RATE, picked at random) runs under a
+profiler. Results are kept in a small ring buffer and served as pstats,
+text or collapsed stacks (for flamegraph.pl / speedscope).
+
+Both profilers watch the event loop thread, so work of other requests
+interleaved with the profiled one is included; profile on a quiet worker
+when the numbers need to be exact. Time spent awaiting MongoDB shows up as
+the event loop's selector wait.
+"""
+import cProfile
+import io
+import itertools
+import logging
+import marshal
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+from collections import Counter, deque
+from typing import Callable, Deque, Dict, List, NamedTuple, Optional
+
+from fastapi import Request
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODES = ("cprofile", "sample")
+
+
+class RequestProfile(NamedTuple):
+    id: int
+    method: str
+    path: str
+    route: str
+    mode: str
+    started: float       # wall clock
+    duration: float      # seconds
+    status: int
+    stats: Optional[dict]                # cProfile: pstats stats dict
+    stacks: Optional[Dict[str, int]]     # sample: collapsed stack -> samples
+
+    def summary(self) -> dict:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "mode": self.mode,
+            "started": self.started,
+            "durationMs": round(self.duration * 1000, 3),
+            "status": self.status,
+            "samples": sum(self.stacks.values()) if self.stacks is not None else None,
+        }
+
+    def pstats_bytes(self) -> bytes:
+        """Marshalled stats, the format written by pstats.Stats.dump_stats"""
+        return marshal.dumps(self.stats)
+
+    def text(self, limit: int = 60) -> str:
+        if self.stats is not None:
+            out = io.StringIO()
+            stats = pstats.Stats(stream=out)
+            stats.stats = self.stats
+            stats.get_top_level_stats()
+            stats.sort_stats("cumulative").print_stats(limit)
+            return out.getvalue()
+        return self.collapsed()
+
+    def collapsed(self) -> str:
+        """One 'frame;frame;frame count' line per distinct stack"""
+        if self.stacks is None:
+            return _collapse_stats(self.stats)
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.stacks.items()))
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _collapse_stats(stats: dict) -> str:
+    """Caller;callee edges with their cumulative time in microseconds.
+
+    cProfile does not record full stacks, so this only gives a two-level
+    flame graph; use sample mode for real stacks.
+    """
+    lines = []
+    for (filename, line, name), (_, _, total, cumulative, callers) in stats.items():
+        callee = f"{name} ({os.path.basename(filename)}:{line})"
+        if not callers:
+            lines.append(f"{callee} {int(cumulative * 1e6)}")
+        for (caller_file, caller_line, caller_name), caller_stats in callers.items():
+            caller = f"{caller_name} ({os.path.basename(caller_file)}:{caller_line})"
+            lines.append(f"{caller};{callee} {int(caller_stats[3] * 1e6)}")
+    return "\n".join(line for line in lines if not line.endswith(" 0")) + "\n"
+
+
+class StackSampler:
+    """Samples the stack of one thread from a background thread"""
+
+    def __init__(self, thread_id: int, interval: float = 0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> Dict[str, int]:
+        self._stop.set()
+        self._thread.join()
+        return dict(self.stacks)
+
+    def _run(self) -> None:
+        labels: Dict[object, str] = {}
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack: List[str] = []
+            while frame is not None:
+                code = frame.f_code
+                label = labels.get(code)
+                if label is None:
+                    label = labels[code] = _frame_label(code)
+                stack.append(label)
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+
+class Profiler:
+    """HTTP middleware running selected requests under a profiler"""
+
+    def __init__(
+        self,
+        authorize: Callable[[Request], bool],
+        sample_rate: int = 0,
+        sample_mode: str = "sample",
+        buffer_size: int = 20,
+        interval: float = 0.001
+    ):
+        self.authorize = authorize
+        self.sample_rate = sample_rate
+        self.sample_mode = sample_mode
+        self.interval = interval
+        self.profiles: Deque[RequestProfile] = deque(maxlen=buffer_size)
+        self._ids = itertools.count(1)
+        # cProfile and the sampler both watch the whole loop thread, so only
+        # one request is profiled at a time
+        self._active = False
+
+    @classmethod
+    def from_env(cls, authorize: Callable[[Request], bool]) -> "Profiler":
+        sample_mode = os.environ.get('PROFILE_SAMPLE_MODE', 'sample')
+        if sample_mode not in PROFILE_MODES:
+            raise ValueError(f"PROFILE_SAMPLE_MODE must be one of {', '.join(PROFILE_MODES)}")
+        return cls(
+            authorize,
+            sample_rate=int(os.environ.get('PROFILE_SAMPLE_RATE', 0)),
+            sample_mode=sample_mode,
+            buffer_size=int(os.environ.get('PROFILE_BUFFER_SIZE', 20)),
+            interval=float(os.environ.get('PROFILE_INTERVAL_MS', 1)) / 1000
+        )
+
+    def get(self, profile_id: int) -> Optional[RequestProfile]:
+        for profile in self.profiles:
+            if profile.id == profile_id:
+                return profile
+        return None
+
+    def _requested_mode(self, request: Request) -> Optional[str]:
+        mode = request.headers.get("x-profile")
+        if mode:
+            mode = mode.strip().lower()
+            if mode in PROFILE_MODES and self.authorize(request):
+                return mode
+            return None
+        if self.sample_rate > 0 and random.randrange(self.sample_rate) == 0:
+            return self.sample_mode
+        return None
+
+    async def dispatch(self, request: Request, call_next):
+        mode = None if self._active else self._requested_mode(request)
+        if mode is None:
+            return await call_next(request)
+
+        self._active = True
+        profile = sampler = None
+        status = 500
+        started = time.time()
+        start = time.perf_counter()
+        if mode == "cprofile":
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError as e:
+                # Another profiler owns the interpreter (e.g. a debugger)
+                logger.error(f"Could not start cProfile: {str(e)}")
+                self._active = False
+                return await call_next(request)
+        else:
+            sampler = StackSampler(threading.get_ident(), self.interval)
+            sampler.start()
+        try:
+            response = await call_next(request)
+            status = response.status_code
+        finally:
+            duration = time.perf_counter() - start
+            stats = stacks = None
+            if profile is not None:
+                profile.disable()
+                profile.create_stats()
+                stats = profile.stats
+            else:
+                stacks = sampler.stop()
+            self._active = False
+            route = getattr(request.scope.get("route"), "path", "unmatched")
+            record = RequestProfile(
+                next(self._ids), request.method, request.url.path, route, mode,
+                started, duration, status, stats, stacks
+            )
+            self.profiles.append(record)
+            logger.info(f"Profiled {request.method} {request.url.path} ({mode}, {duration * 1000:.1f} ms) as #{record.id}")
+
+        response.headers["X-Profile-Id"] = str(record.id)
+        return response
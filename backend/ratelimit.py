@@ -0,0 +1,167 @@
+"""
+Per-client token-bucket rate limiting for the public write endpoints
+Buckets live in process by default (bounded LRU of client keys); the SQLite
+backend lets several uvicorn workers on one host share the same buckets
+"""
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimit(NamedTuple):
+    burst: int      # bucket capacity
+    period: float   # seconds to refill a full bucket
+
+    @property
+    def rate(self) -> float:
+        return self.burst / self.period
+
+    @classmethod
+    def parse(cls, value: str) -> "RateLimit":
+        """Parse '<requests>/<seconds>', e.g. '5/600'"""
+        burst, period = value.split("/")
+        return cls(int(burst), float(period))
+
+
+def take_token(tokens: float, updated: float, now: float, limit: RateLimit) -> Tuple[float, float]:
+    """Refill a bucket and take one token; returns (tokens left, retry after)"""
+    tokens = min(float(limit.burst), tokens + (now - updated) * limit.rate)
+    if tokens >= 1:
+        return tokens - 1, 0.0
+    return tokens, (1 - tokens) / limit.rate
+
+
+class RateLimitBackend:
+    """Bucket storage; consume() returns 0 when allowed, else seconds to wait"""
+
+    async def consume(self, key: str, limit: RateLimit) -> float:
+        raise NotImplementedError
+
+
+class MemoryBackend(RateLimitBackend):
+    """Buckets in an LRU; evicted clients simply start with a full bucket"""
+
+    def __init__(self, max_keys: int = 10000, timer=time.monotonic):
+        self.max_keys = max_keys
+        self.timer = timer
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def consume(self, key: str, limit: RateLimit) -> float:
+        now = self.timer()
+        tokens, updated = self._buckets.get(key, (float(limit.burst), now))
+        tokens, retry_after = take_token(tokens, updated, now, limit)
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+
+class SQLiteBackend(RateLimitBackend):
+    """Buckets in a local SQLite file shared by the workers of one host"""
+
+    def __init__(self, path: str, max_idle: float = 3600):
+        self.path = path
+        self.max_idle = max_idle
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._connection = sqlite3.connect(path, timeout=5, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL, updated REAL)"
+        )
+
+    async def consume(self, key: str, limit: RateLimit) -> float:
+        return await asyncio.to_thread(self._consume, key, limit)
+
+    def _consume(self, key: str, limit: RateLimit) -> float:
+        # Wall clock, since the buckets are shared between processes
+        now = time.time()
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute(
+                    "SELECT tokens, updated FROM buckets WHERE key = ?", (key,)
+                ).fetchone()
+                tokens, updated = row if row else (float(limit.burst), now)
+                tokens, retry_after = take_token(tokens, updated, now, limit)
+                connection.execute(
+                    "INSERT OR REPLACE INTO buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                    (key, tokens, now)
+                )
+                self._calls += 1
+                if self._calls % 1000 == 0:
+                    # Idle buckets are full again; dropping them bounds the table
+                    connection.execute("DELETE FROM buckets WHERE updated < ?", (now - self.max_idle,))
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+        return retry_after
+
+
+class RateLimiter:
+    """HTTP middleware applying a RateLimit per (method, path) and client.
+
+    ``proxy_hops`` is the number of reverse proxies in front of the app
+    (0: X-Forwarded-For is ignored). Each proxy appends the address it saw,
+    so the client is the entry that many places from the right; anything
+    further left was sent by the client and cannot be trusted.
+    """
+
+    def __init__(self, limits: Dict[Tuple[str, str], RateLimit], backend: RateLimitBackend, proxy_hops: int = 0):
+        self.limits = limits
+        self.backend = backend
+        self.proxy_hops = proxy_hops
+
+    @classmethod
+    def from_env(cls) -> "RateLimiter":
+        limits = {
+            ("POST", "/api/contact"): RateLimit.parse(os.environ.get('RATE_LIMIT_CONTACT', '5/600')),
+            ("POST", "/api/auth/login"): RateLimit.parse(os.environ.get('RATE_LIMIT_LOGIN', '10/300')),
+        }
+        sqlite_path = os.environ.get('RATE_LIMIT_SQLITE_PATH')
+        backend = SQLiteBackend(sqlite_path) if sqlite_path else MemoryBackend(
+            max_keys=int(os.environ.get('RATE_LIMIT_MAX_KEYS', 10000))
+        )
+        return cls(limits, backend, proxy_hops=int(os.environ.get('TRUST_PROXY_HEADERS') or 0))
+
+    def client_key(self, request: Request) -> str:
+        if self.proxy_hops:
+            forwarded = [address.strip() for address in request.headers.get("x-forwarded-for", "").split(",")]
+            forwarded = [address for address in forwarded if address]
+            if forwarded:
+                return forwarded[-min(self.proxy_hops, len(forwarded))]
+        return request.client.host if request.client else "unknown"
+
+    async def dispatch(self, request: Request, call_next):
+        limit: Optional[RateLimit] = self.limits.get((request.method, request.url.path))
+        if limit is None:
+            return await call_next(request)
+
+        key = f"{request.method}:{request.url.path}:{self.client_key(request)}"
+        try:
+            retry_after = await self.backend.consume(key, limit)
+        except Exception as e:
+            # Fail open: a broken limiter must not take the endpoint down
+            logger.error(f"Rate limiter error: {str(e)}")
+            retry_after = 0.0
+
+        if retry_after > 0:
+            return JSONResponse(
+                status_code=429,
+                content={"detail": "Too many requests, please try again later"},
+                headers={"Retry-After": str(max(1, int(retry_after + 0.999)))},
+            )
+        return await call_next(request)
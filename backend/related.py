@@ -0,0 +1,249 @@
+"""
+Related posts from a precomputed TF-IDF similarity index
+Posts are vectors over the terms of their title, tags and excerpt; each
+post keeps its top neighbors by cosine similarity, so serving related
+posts is a dictionary lookup. Writes update the neighbor lists of the
+posts they touch instead of recomputing everything.
+"""
+import logging
+import math
+from array import array
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from models import PostSummary
+from slugs import fold_turkish
+from search_index import tokenize
+
+logger = logging.getLogger(__name__)
+
+# Term weight of each field; tags are matched as whole tags
+RELATED_WEIGHTS = {"title": 2.0, "tags": 3.0, "excerpt": 1.0}
+
+Neighbors = List[Tuple[float, str]]  # (similarity, post id), best first
+
+
+def post_terms(post: dict) -> Dict[str, float]:
+    """Weighted term frequencies of a post"""
+    terms: Dict[str, float] = {}
+    for token in tokenize(post.get("title") or ""):
+        terms[token] = terms.get(token, 0.0) + RELATED_WEIGHTS["title"]
+    for token in tokenize(post.get("excerpt") or ""):
+        terms[token] = terms.get(token, 0.0) + RELATED_WEIGHTS["excerpt"]
+    for tag in post.get("tags") or []:
+        term = "#" + fold_turkish(tag).strip()
+        terms[term] = terms.get(term, 0.0) + RELATED_WEIGHTS["tags"]
+    # Sublinear term frequency, so a repeated word does not dominate
+    return {term: 1.0 + math.log(weight) for term, weight in terms.items()}
+
+
+class RelatedPostsIndex:
+    """Incrementally maintained top-``max_k`` cosine neighbors per post.
+
+    Rows are never reused: a removed or updated post leaves a dead row
+    behind and the index is rebuilt once dead rows outnumber live ones.
+    IDF weights change as posts come and go; lists untouched by a write keep
+    the weights they were computed with until the next rebuild.
+
+    Each worker keeps its own index, updated by on_change for its own writes.
+    ``version`` is the blog_posts version the index was built at and
+    ``changes`` the writes applied since, so in_sync can tell when another
+    worker has written and the index needs a rebuild.
+    """
+
+    def __init__(self, max_k: int = 10):
+        self.max_k = max_k
+        self.version: Optional[int] = None
+        self.changes = 0
+        self._reset()
+
+    @classmethod
+    def build(cls, posts: Iterable[dict], max_k: int = 10) -> "RelatedPostsIndex":
+        """A new index over posts (safe to run in a worker thread)"""
+        index = cls(max_k)
+        index.rebuild(posts)
+        return index
+
+    def replace(self, other: "RelatedPostsIndex", version: Optional[int]) -> None:
+        """Take over the contents of an index built at ``version``"""
+        state = dict(vars(other))
+        state.update(max_k=self.max_k, version=version, changes=0)
+        vars(self).update(state)
+
+    def in_sync(self, version: int) -> bool:
+        """Whether every write up to ``version`` is reflected in the index"""
+        if self.version is None:
+            return False
+        # Each write bumps the version by one; a version lagging behind the
+        # local writes (version cache TTL) is fine, one ahead of them is not
+        return version <= self.version + self.changes
+
+    def _reset(self) -> None:
+        self._post_ids: List[Optional[str]] = []         # row -> post id (None when dead)
+        self._rows: Dict[str, int] = {}                   # post id -> row
+        self._summaries: Dict[str, dict] = {}
+        self._vectors: List[Tuple[np.ndarray, np.ndarray]] = []   # row -> (term ids, tf)
+        self._norms = np.zeros(0, dtype=np.float64)
+        # Score a post must beat to enter each row's list (0 while not full)
+        self._thresholds = np.zeros(0, dtype=np.float64)
+        self._term_ids: Dict[str, int] = {}
+        self._posting_rows: List[array] = []              # term id -> rows
+        self._posting_tf: List[array] = []                # term id -> tf per row
+        self._df = np.zeros(0, dtype=np.int32)
+        self._neighbors: Dict[str, Neighbors] = {}
+        self._referrers: Dict[str, Set[str]] = {}         # post id -> posts listing it
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def related(self, post_id: str, k: int) -> List[dict]:
+        """Summaries of the k most similar posts"""
+        return [self._summaries[other_id] for _, other_id in self._neighbors.get(post_id, [])[:k]]
+
+    # Building
+    def rebuild(self, posts: Iterable[dict]) -> None:
+        """Index all posts and compute every neighbor list from scratch"""
+        self._reset()
+        for post in posts:
+            self._insert(post)
+        self._refresh_norms()
+        for post_id in list(self._rows):
+            self._set_neighbors(post_id, self._top(self._scores(self._rows[post_id]), self._rows[post_id]))
+        logger.info(f"Built related posts index over {len(self._rows)} posts")
+
+    def add(self, post: dict) -> None:
+        """Index a new or updated post and update the lists it belongs in"""
+        self.remove(post["id"])
+        row = self._insert(post)
+        self._norms[row] = self._norm(row)
+        scores = self._scores(row)
+        self._set_neighbors(post["id"], self._top(scores, row))
+
+        # Similarity is symmetric: the new post joins every list it now beats
+        for other_row in np.flatnonzero(scores > self._thresholds[:len(scores)]):
+            other_id = self._post_ids[other_row]
+            if other_row == row or other_id is None:
+                continue
+            neighbors = self._neighbors.get(other_id, [])
+            neighbors = sorted(neighbors + [(float(scores[other_row]), post["id"])], reverse=True)
+            self._set_neighbors(other_id, neighbors[:self.max_k])
+
+    def remove(self, post_id: str) -> None:
+        row = self._rows.pop(post_id, None)
+        if row is None:
+            return
+        self._post_ids[row] = None
+        self._norms[row] = 0.0  # dead rows score 0
+        self._thresholds[row] = np.inf
+        self._summaries.pop(post_id, None)
+        term_ids, _ = self._vectors[row]
+        self._df[term_ids] -= 1
+        self._set_neighbors(post_id, [])
+        self._neighbors.pop(post_id, None)
+
+        if len(self._post_ids) > 64 and len(self._rows) * 2 < len(self._post_ids):
+            self.rebuild(list(self._summaries.values()))
+            return
+        # Lists that held the post lost an entry; recompute them
+        for other_id in self._referrers.pop(post_id, set()):
+            other_row = self._rows.get(other_id)
+            if other_row is not None:
+                self._set_neighbors(other_id, self._top(self._scores(other_row), other_row))
+
+    def on_change(self, event: str, previous: Optional[dict], current: Optional[dict]) -> None:
+        """Storage change listener"""
+        if event == "post_deleted" and previous:
+            self.remove(previous["id"])
+        elif event in ("post_created", "post_updated") and current:
+            self.add(current)
+        else:
+            return
+        self.changes += 1
+
+    # Internals
+    def _insert(self, post: dict) -> int:
+        row = len(self._post_ids)
+        self._post_ids.append(post["id"])
+        self._rows[post["id"]] = row
+        self._summaries[post["id"]] = {field: post[field] for field in PostSummary.model_fields if field in post}
+
+        terms = post_terms(post)
+        term_ids = np.empty(len(terms), dtype=np.int32)
+        tfs = np.empty(len(terms), dtype=np.float32)
+        for i, (term, tf) in enumerate(terms.items()):
+            term_id = self._term_ids.get(term)
+            if term_id is None:
+                term_id = self._term_ids[term] = len(self._posting_rows)
+                self._posting_rows.append(array('i'))
+                self._posting_tf.append(array('f'))
+            self._posting_rows[term_id].append(row)
+            self._posting_tf[term_id].append(tf)
+            term_ids[i] = term_id
+            tfs[i] = tf
+        self._vectors.append((term_ids, tfs))
+
+        if len(self._df) < len(self._posting_rows):
+            self._df = np.concatenate([self._df, np.zeros(max(1024, len(self._df)), dtype=np.int32)])
+        self._df[term_ids] += 1
+        if len(self._norms) <= row:
+            grow = max(1024, len(self._norms))
+            self._norms = np.concatenate([self._norms, np.zeros(grow)])
+            self._thresholds = np.concatenate([self._thresholds, np.zeros(grow)])
+        self._thresholds[row] = 0.0
+        return row
+
+    def _idf(self, term_ids: np.ndarray) -> np.ndarray:
+        return np.log((1 + len(self._rows)) / (1 + self._df[term_ids])) + 1.0
+
+    def _norm(self, row: int) -> float:
+        term_ids, tfs = self._vectors[row]
+        return float(np.sqrt(np.sum((tfs * self._idf(term_ids)) ** 2)))
+
+    def _refresh_norms(self) -> None:
+        for row, post_id in enumerate(self._post_ids):
+            if post_id is not None:
+                self._norms[row] = self._norm(row)
+
+    def _scores(self, row: int) -> np.ndarray:
+        """Cosine similarity of one row against every row"""
+        term_ids, tfs = self._vectors[row]
+        size = len(self._post_ids)
+        if not len(term_ids) or not self._norms[row]:
+            return np.zeros(size)
+        idf = self._idf(term_ids)
+        query = tfs * idf
+        rows = [np.frombuffer(self._posting_rows[t], dtype=np.int32) for t in term_ids]
+        weights = [
+            np.frombuffer(self._posting_tf[t], dtype=np.float32) * (w * i)
+            for t, w, i in zip(term_ids, query, idf)
+        ]
+        dots = np.bincount(np.concatenate(rows), weights=np.concatenate(weights), minlength=size)
+        norms = self._norms[:size] * self._norms[row]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(norms > 0, dots / norms, 0.0)
+        scores[row] = 0.0
+        return scores
+
+    def _top(self, scores: np.ndarray, row: int) -> Neighbors:
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > self.max_k:
+            candidates = candidates[np.argpartition(-scores[candidates], self.max_k)[:self.max_k]]
+        neighbors = [
+            (float(scores[i]), self._post_ids[i]) for i in candidates
+            if i != row and self._post_ids[i] is not None
+        ]
+        neighbors.sort(reverse=True)
+        return neighbors
+
+    def _set_neighbors(self, post_id: str, neighbors: Neighbors) -> None:
+        for _, other_id in self._neighbors.get(post_id, []):
+            referrers = self._referrers.get(other_id)
+            if referrers is not None:
+                referrers.discard(post_id)
+        self._neighbors[post_id] = neighbors
+        row = self._rows.get(post_id)
+        if row is not None:
+            self._thresholds[row] = neighbors[-1][0] if len(neighbors) >= self.max_k else 0.0
+        for _, other_id in neighbors:
+            self._referrers.setdefault(other_id, set()).add(post_id)
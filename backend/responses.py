@@ -0,0 +1,34 @@
+"""
+Fast JSON responses for documents that are already known to match their model
+"""
+import json
+from datetime import datetime
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+
+def encode_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        # Same format Pydantic uses for naive datetimes
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class DocumentJSONResponse(JSONResponse):
+    """JSON response rendered straight from MongoDB documents.
+
+    Returning a Response from a route skips FastAPI's response_model
+    validation, so only use this for documents written through the models
+    (projected without ``_id``).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+            default=encode_default,
+        ).encode("utf-8")
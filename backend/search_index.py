@@ -0,0 +1,199 @@
+"""
+In-process inverted index for post search
+Used when MongoDB text search is not available (tests, the serverless entry
+point or SEARCH_BACKEND=memory). Tokens are folded like slugs, documents are
+ranked with BM25 over field-weighted term frequencies and the last query
+term also matches as a prefix, for autocomplete.
+"""
+import math
+import re
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+from slugs import fold_turkish
+
+_TOKEN = re.compile(r'[a-z0-9]+')
+_HTML_TAG = re.compile(r'<[^>]+>')
+
+# Postings pack (internal doc id << 8 | weighted tf) into one unsigned int,
+# so each term costs a single array and each posting four bytes
+_TF_BITS = 8
+_TF_MAX = (1 << _TF_BITS) - 1
+_MAX_DOCS = 1 << (32 - _TF_BITS)
+
+# Relevance weight of each searchable field, shared with the MongoDB text index
+SEARCH_WEIGHTS = {"title": 10, "tags": 5, "excerpt": 3, "content": 1}
+
+
+def tokenize(text: str) -> List[str]:
+    """Fold and split text into index terms"""
+    return [token for token in _TOKEN.findall(fold_turkish(text)) if len(token) > 1]
+
+
+def _field_text(post: dict, field: str) -> str:
+    value = post.get(field) or ""
+    if field == "tags":
+        return " ".join(value)
+    if field == "content":
+        return _HTML_TAG.sub(" ", value)
+    return value
+
+
+class InvertedIndex:
+    """Incrementally maintained BM25 index of posts keyed by post id.
+
+    Updates give a document a fresh internal id and leave the old postings
+    behind as garbage; the postings are compacted once garbage dominates.
+    Document frequencies are kept per term over live documents only, so
+    garbage postings never skew the IDF.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, prefix_expansion: int = 20):
+        self.k1 = k1
+        self.b = b
+        self.prefix_expansion = prefix_expansion
+        self._postings: Dict[str, array] = {}
+        self._post_ids: List[Optional[str]] = []  # internal id -> post id
+        self._doc_terms: List[Optional[Tuple[str, ...]]] = []  # internal id -> terms
+        self._df: Dict[str, int] = {}  # term -> live documents containing it
+        self._doc_lengths = array('f')
+        self._internal_ids: Dict[str, int] = {}  # post id -> internal id
+        self._total_length = 0.0
+        self._sorted_terms: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self._internal_ids)
+
+    def add(self, post: dict) -> None:
+        """Index a post, replacing any previous version"""
+        self.remove(post["id"])
+        if len(self._post_ids) >= _MAX_DOCS:
+            self.compact()
+
+        frequencies: Dict[str, int] = {}
+        length = 0
+        for field, weight in SEARCH_WEIGHTS.items():
+            for token in tokenize(_field_text(post, field)):
+                frequencies[token] = frequencies.get(token, 0) + weight
+                length += weight
+
+        internal_id = len(self._post_ids)
+        self._post_ids.append(post["id"])
+        self._doc_terms.append(tuple(frequencies))
+        self._doc_lengths.append(length)
+        self._internal_ids[post["id"]] = internal_id
+        self._total_length += length
+
+        for term, frequency in frequencies.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = array('I')
+                self._sorted_terms = None
+            postings.append(internal_id << _TF_BITS | min(frequency, _TF_MAX))
+            self._df[term] = self._df.get(term, 0) + 1
+
+    def remove(self, post_id: str) -> None:
+        internal_id = self._internal_ids.pop(post_id, None)
+        if internal_id is None:
+            return
+        self._post_ids[internal_id] = None
+        self._total_length -= self._doc_lengths[internal_id]
+        for term in self._doc_terms[internal_id]:
+            if self._df[term] == 1:
+                del self._df[term]
+            else:
+                self._df[term] -= 1
+        self._doc_terms[internal_id] = None
+        # Compact once more than half of the postings belong to dead documents
+        if len(self._post_ids) > 64 and len(self._internal_ids) * 2 < len(self._post_ids):
+            self.compact()
+
+    def compact(self) -> None:
+        """Drop postings of removed documents and renumber the live ones"""
+        remap = array('i', [-1]) * len(self._post_ids)
+        post_ids: List[Optional[str]] = []
+        doc_terms: List[Optional[Tuple[str, ...]]] = []
+        doc_lengths = array('f')
+        for old_id, post_id in enumerate(self._post_ids):
+            if post_id is not None:
+                remap[old_id] = len(post_ids)
+                post_ids.append(post_id)
+                doc_terms.append(self._doc_terms[old_id])
+                doc_lengths.append(self._doc_lengths[old_id])
+
+        postings = {}
+        for term, entries in self._postings.items():
+            kept = array('I')
+            for entry in entries:
+                new_id = remap[entry >> _TF_BITS]
+                if new_id >= 0:
+                    kept.append(new_id << _TF_BITS | (entry & _TF_MAX))
+            if kept:
+                postings[term] = kept
+
+        self._postings = postings
+        self._post_ids = post_ids
+        self._doc_terms = doc_terms
+        self._doc_lengths = doc_lengths
+        self._internal_ids = {post_id: i for i, post_id in enumerate(post_ids)}
+        self._sorted_terms = None
+
+    def complete(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """Indexed terms starting with prefix, most frequent first"""
+        prefix = fold_turkish(prefix)
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        terms = []
+        for term in self._sorted_terms[bisect_left(self._sorted_terms, prefix):]:
+            if not term.startswith(prefix):
+                break
+            if term in self._df:
+                terms.append(term)
+        terms.sort(key=lambda term: self._df[term], reverse=True)
+        return terms[:limit or self.prefix_expansion]
+
+    def search(self, query: str, limit: int = 10, offset: int = 0, prefix: bool = True) -> List[Tuple[str, float]]:
+        """Return (post id, score) pairs, best first"""
+        tokens = tokenize(query)
+        if not tokens or not self._internal_ids:
+            return []
+
+        # Each query position is a group of terms; the last one may be a prefix
+        groups = [[token] for token in tokens]
+        if prefix:
+            groups[-1] = self.complete(tokens[-1]) or groups[-1]
+
+        doc_count = len(self._internal_ids)
+        average_length = self._total_length / doc_count or 1.0
+        scores: Dict[int, float] = {}
+        for group in groups:
+            group_scores: Dict[int, float] = {}
+            for term in group:
+                df = self._df.get(term)
+                if not df:
+                    continue
+                postings = self._postings[term]
+                idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+                for entry in postings:
+                    internal_id = entry >> _TF_BITS
+                    if self._post_ids[internal_id] is None:
+                        continue
+                    frequency = entry & _TF_MAX
+                    norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[internal_id] / average_length)
+                    score = idf * frequency * (self.k1 + 1) / (frequency + norm)
+                    # A prefix group counts its best expansion only
+                    if score > group_scores.get(internal_id, 0.0):
+                        group_scores[internal_id] = score
+            for internal_id, score in group_scores.items():
+                scores[internal_id] = scores.get(internal_id, 0.0) + score
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return [(self._post_ids[i], score) for i, score in ranked[offset:offset + limit]]
+
+    def on_change(self, event: str, previous: Optional[dict], current: Optional[dict]) -> None:
+        """Database change listener keeping the index in step with post writes"""
+        if event == "post_deleted" and previous:
+            self.remove(previous["id"])
+        elif event in ("post_created", "post_updated") and current:
+            self.add(current)
@@ -1,149 +1,434 @@
 #!/usr/bin/env python3
 """
-Seed script to populate database with initial blog posts
+Seed script to populate the database with blog posts
+
+    python seed_data.py                                  # the sample posts below
+    python seed_data.py --posts 100000 --messages 20000  # synthetic corpus
+
+The synthetic corpus is deterministic for a given --seed (and the first N
+documents of a larger corpus are the same as those of a smaller one): Turkish
+text, Zipf-skewed categories, tags and vocabulary, log-normal content length.
+Batches are bulk-inserted concurrently. Seeded collections are replaced.
 """
 import asyncio
 import os
 import sys
-sys.path.append('/app/backend')
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
 
-from datetime import datetime
-from motor.motor_asyncio import AsyncIOMotorClient
+import numpy as np
+import typer
 from dotenv import load_dotenv
-from pathlib import Path
 
 # Load environment variables
 ROOT_DIR = Path(__file__).parent
+sys.path.insert(0, str(ROOT_DIR))
 load_dotenv(ROOT_DIR / '.env')
 
-async def seed_database():
-    """Seed database with mock blog posts"""
-    
-    # Connect to MongoDB
-    mongo_url = os.environ.get('MONGO_URL')
-    db_name = os.environ.get('DB_NAME', 'zirvehikayem')
-    
-    client = AsyncIOMotorClient(mongo_url)
-    db = client[db_name]
-    
-    print("🔗 Connected to MongoDB")
-    
-    def generate_slug(title: str) -> str:
-        """Generate URL-friendly slug from title"""
-        import re
-        slug = title.lower()
-        turkish_chars = {
-            'ç': 'c', 'ğ': 'g', 'ı': 'i', 'ö': 'o', 'ş': 's', 'ü': 'u',
-            'Ç': 'c', 'Ğ': 'g', 'İ': 'i', 'Ö': 'o', 'Ş': 's', 'Ü': 'u'
-        }
-        for turkish, english in turkish_chars.items():
-            slug = slug.replace(turkish, english)
-        
-        slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-        slug = re.sub(r'\s+', '-', slug)
-        slug = re.sub(r'-+', '-', slug)
-        return slug.strip('-')
-
-    def calculate_read_time(content: str) -> str:
-        """Calculate estimated reading time"""
-        word_count = len(content.split())
-        minutes = max(1, round(word_count / 200))
-        return f"{minutes} dakika"
-    
-    # Mock blog posts data
-    mock_posts = [
-        {
-            'title': 'Hayatımın Dönüm Noktası: İlk Girişimim',
-            'excerpt': '25 yaşında kurduğum ilk şirketin hikayesi ve bu süreçte öğrendiklerimi paylaşıyorum.',
-            'content': '''<p>Merhaba değerli okuyucularım,</p>
+from models import BlogPost
+from slugs import fold_turkish, slugify
+from storage import Storage, create_storage
+
+# Sample posts seeded when no synthetic corpus is requested
+MOCK_POSTS = [
+    {
+        'title': 'Hayatımın Dönüm Noktası: İlk Girişimim',
+        'excerpt': '25 yaşında kurduğum ilk şirketin hikayesi ve bu süreçte öğrendiklerimi paylaşıyorum.',
+        'content': '''<p>Merhaba değerli okuyucularım,</p>
 <p>Bugün sizlerle hayatımın en önemli dönüm noktalarından birini paylaşmak istiyorum. 25 yaşında kurduğum ilk şirketin hikayesi...</p>
 <p>O dönemde üniversiteden yeni mezun olmuştum ve klasik kariyer yolunu takip etmek yerine kendi işimi kurmaya karar verdim. Bu karar kolay olmadı tabii ki.</p>
 <p>İlk günlerde karşılaştığım zorluklar, başarısızlıklar ve nihayetinde elde ettiğim başarılar bu yazının konusu.</p>
 <h3>Başlangıç</h3>
 <p>Girişimcilik yolculuğum aslında bir hayal ile başladı. Üniversite yıllarımda hep farklı fikirler üretir, bunları arkadaşlarımla paylaşırdım...</p>''',
-            'category': 'Girişimcilik',
-            'tags': ['girişimcilik', 'başarı', 'motivasyon'],
-            'featured': True
-        },
-        {
-            'title': 'Başarısızlıktan Öğrendiklerim',
-            'excerpt': 'Her başarısızlık aslında bir ders. İşte benim en büyük hatalarımdan çıkardığım dersler.',
-            'content': '''<p>Başarısızlık kelimesi çoğumuz için korkutucu. Ancak benim deneyimlerime göre, en büyük öğretmenimiz aslında başarısızlıklarımız.</p>
+        'category': 'Girişimcilik',
+        'tags': ['girişimcilik', 'başarı', 'motivasyon'],
+        'featured': True
+    },
+    {
+        'title': 'Başarısızlıktan Öğrendiklerim',
+        'excerpt': 'Her başarısızlık aslında bir ders. İşte benim en büyük hatalarımdan çıkardığım dersler.',
+        'content': '''<p>Başarısızlık kelimesi çoğumuz için korkutucu. Ancak benim deneyimlerime göre, en büyük öğretmenimiz aslında başarısızlıklarımız.</p>
 <p>Bu yazıda, girişimcilik yolculuğumda yaptığım en büyük hataları ve bunlardan çıkardığım dersleri paylaşacağım.</p>
 <h3>İlk Büyük Hatam</h3>
 <p>İlk şirketimi kurarken yaptığım en büyük hata, müşteri araştırması yapmadan ürün geliştirmeye başlamaktı...</p>''',
-            'category': 'Kişisel Gelişim',
-            'tags': ['başarısızlık', 'ders', 'deneyim'],
-            'featured': False
-        },
-        {
-            'title': 'Motivasyonu Yüksek Tutmanın 5 Yolu',
-            'excerpt': 'Zor günlerde motivasyonumu nasıl yüksek tuttuğuma dair pratik öneriler.',
-            'content': '''<p>Motivasyon, başarıya giden yolda en önemli yakıtımız. Ancak her zaman yüksek seviyede tutmak kolay değil.</p>
+        'category': 'Kişisel Gelişim',
+        'tags': ['başarısızlık', 'ders', 'deneyim'],
+        'featured': False
+    },
+    {
+        'title': 'Motivasyonu Yüksek Tutmanın 5 Yolu',
+        'excerpt': 'Zor günlerde motivasyonumu nasıl yüksek tuttuğuma dair pratik öneriler.',
+        'content': '''<p>Motivasyon, başarıya giden yolda en önemli yakıtımız. Ancak her zaman yüksek seviyede tutmak kolay değil.</p>
 <p>İşte benim yıllar içinde geliştirdiğim 5 etkili yöntem:</p>
 <h3>1. Günlük Rutinler</h3>
 <p>Her sabah aynı rutinle güne başlamak, zihninizi hazır hale getirir...</p>''',
-            'category': 'Motivasyon',
-            'tags': ['motivasyon', 'rutinler', 'başarı'],
-            'featured': True
-        },
-        {
-            'title': 'Teknoloji ve İnsan İlişkileri',
-            'excerpt': 'Dijital çağda insan ilişkilerini nasıl koruyabiliriz? Deneyimlerim ve önerilerim.',
-            'content': '''<p>Teknolojinin hayatımıza bu kadar hızlı girmesiyle birlikte insan ilişkilerimiz de değişti.</p>
+        'category': 'Motivasyon',
+        'tags': ['motivasyon', 'rutinler', 'başarı'],
+        'featured': True
+    },
+    {
+        'title': 'Teknoloji ve İnsan İlişkileri',
+        'excerpt': 'Dijital çağda insan ilişkilerini nasıl koruyabiliriz? Deneyimlerim ve önerilerim.',
+        'content': '''<p>Teknolojinin hayatımıza bu kadar hızlı girmesiyle birlikte insan ilişkilerimiz de değişti.</p>
 <p>Bu değişimin olumlu ve olumsuz yönlerini ele alıp, sağlıklı bir denge kurmanın yollarını paylaşıyorum.</p>''',
-            'category': 'Yaşam Tarzı',
-            'tags': ['teknoloji', 'ilişkiler', 'denge'],
-            'featured': False
-        },
-        {
-            'title': '2024 Hedeflerim ve Stratejilerim',
-            'excerpt': 'Yeni yıl için belirlediğim hedefler ve bunlara ulaşmak için geliştirdiğim stratejiler.',
-            'content': '''<p>2024 yılına girerken belirlediğim hedefleri ve bu hedeflere ulaşmak için oluşturduğum stratejileri sizlerle paylaşmak istiyorum.</p>
+        'category': 'Yaşam Tarzı',
+        'tags': ['teknoloji', 'ilişkiler', 'denge'],
+        'featured': False
+    },
+    {
+        'title': '2024 Hedeflerim ve Stratejilerim',
+        'excerpt': 'Yeni yıl için belirlediğim hedefler ve bunlara ulaşmak için geliştirdiğim stratejiler.',
+        'content': '''<p>2024 yılına girerken belirlediğim hedefleri ve bu hedeflere ulaşmak için oluşturduğum stratejileri sizlerle paylaşmak istiyorum.</p>
 <p>Belki siz de kendi hedeflerinizi belirlerken ilham alabilirsiniz.</p>''',
-            'category': 'Planlama',
-            'tags': ['hedefler', 'planlama', 'strateji'],
-            'featured': False
+        'category': 'Planlama',
+        'tags': ['hedefler', 'planlama', 'strateji'],
+        'featured': False
+    }
+]
+
+# Synthetic corpus vocabulary, most frequent first (sampled with Zipf weights)
+CATEGORIES = [
+    "Girişimcilik", "Kişisel Gelişim", "Motivasyon", "Kariyer", "Yaşam Tarzı",
+    "Liderlik", "Planlama", "Teknoloji", "Finans", "Sağlık", "Eğitim", "Seyahat"
+]
+CATEGORY_TAGS = {
+    "Girişimcilik": ["girişimcilik", "startup", "yatırım", "iş fikri", "müşteri", "ürün", "büyüme"],
+    "Kişisel Gelişim": ["kişisel gelişim", "alışkanlıklar", "öz disiplin", "farkındalık", "okuma"],
+    "Motivasyon": ["motivasyon", "başarı", "ilham", "hedefler", "cesaret", "azim"],
+    "Kariyer": ["kariyer", "iş hayatı", "mülakat", "terfi", "yetenek", "network"],
+    "Yaşam Tarzı": ["yaşam", "denge", "spor", "sabah rutini", "minimalizm"],
+    "Liderlik": ["liderlik", "ekip", "yönetim", "iletişim", "kültür"],
+    "Planlama": ["planlama", "strateji", "zaman yönetimi", "verimlilik", "öncelikler"],
+    "Teknoloji": ["teknoloji", "yazılım", "yapay zeka", "dijital dönüşüm", "veri"],
+    "Finans": ["finans", "bütçe", "tasarruf", "yatırım", "borsa"],
+    "Sağlık": ["sağlık", "uyku", "beslenme", "stres", "meditasyon"],
+    "Eğitim": ["eğitim", "öğrenme", "üniversite", "kurs", "mentorluk"],
+    "Seyahat": ["seyahat", "kültür", "keşif", "yurt dışı", "macera"],
+}
+GENERAL_TAGS = [
+    "deneyim", "hikaye", "ders", "başarısızlık", "değişim", "aile", "dostluk",
+    "sabır", "risk", "karar", "gelecek", "geçmiş", "hayal", "umut", "korku"
+]
+ADJECTIVES = [
+    "yeni", "büyük", "zor", "güzel", "önemli", "küçük", "uzun", "farklı", "doğru", "gerçek",
+    "sessiz", "cesur", "sabırlı", "yorucu", "değerli", "beklenmedik", "basit", "karmaşık",
+    "heyecanlı", "sakin", "unutulmaz", "kritik", "verimli", "sürdürülebilir"
+]
+NOUNS = [
+    "hayat", "iş", "gün", "zaman", "yol", "insan", "fikir", "karar", "hedef", "ekip",
+    "müşteri", "şirket", "proje", "deneyim", "hata", "başarı", "süreç", "yolculuk", "plan",
+    "ürün", "pazar", "yatırımcı", "lider", "alışkanlık", "motivasyon", "strateji", "sabah",
+    "kriz", "fırsat", "toplantı", "sunum", "rakip", "bütçe", "vizyon", "kültür", "mentor"
+]
+OBJECTS = [
+    "bu kararı", "ilk adımı", "yeni bir yolu", "hatalarımı", "ekibimi", "müşterileri",
+    "planımı", "zamanımı", "hedeflerimi", "fikirlerimi", "bu süreci", "geri bildirimleri",
+    "riskleri", "önceliklerimi", "alışkanlıklarımı", "bütçemi", "rakiplerimi", "sonuçları"
+]
+VERBS = [
+    "değiştirdi", "öğrendim", "gördüm", "anladım", "başardım", "kaybettim", "yeniden kurdum",
+    "sorguladım", "paylaşmak istiyorum", "hiç unutmadım", "ciddiye aldım", "erteledim",
+    "tekrar denedim", "sadeleştirdim", "büyüttüm", "ölçmeye başladım"
+]
+CONNECTORS = ["Ama", "Çünkü", "Bu yüzden", "Sonra", "Aslında", "Yine de", "Üstelik", "Bugün"]
+FIRST_NAMES = [
+    "Ahmet", "Mehmet", "Ayşe", "Fatma", "Emre", "Zeynep", "Can", "Elif", "Burak", "Selin",
+    "Murat", "Deniz", "Cem", "Ece", "Oğuz", "İrem", "Kerem", "Gül", "Serkan", "Şule"
+]
+LAST_NAMES = [
+    "Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Yıldız", "Öztürk", "Aydın", "Özdemir",
+    "Arslan", "Doğan", "Kılıç", "Aslan", "Çetin", "Kocatürk", "Koç", "Kurt", "Özkan"
+]
+EMAIL_DOMAINS = ["gmail.com", "hotmail.com", "outlook.com", "yandex.com", "icloud.com"]
+MESSAGE_SUBJECTS = [
+    "Teşekkürler", "İş birliği", "Soru", "Konuşma daveti", "Yazınız hakkında", "Öneri", None
+]
+MESSAGE_STATUSES = ["new", "read", "replied"]
+MESSAGE_STATUS_WEIGHTS = [0.6, 0.3, 0.1]
+
+# Documents generated per RNG stream; streams are seeded by (seed, kind, block)
+# so a corpus does not depend on the batch size
+GENERATOR_BLOCK = 1000
+_POSTS, _MESSAGES = 1, 2
+
+
+def zipf_cdf(count: int, exponent: float = 1.1) -> np.ndarray:
+    """Cumulative Zipf weights over ranks 1..count"""
+    weights = 1.0 / np.arange(1, count + 1) ** exponent
+    return np.cumsum(weights / weights.sum())
+
+
+def capitalize(text: str) -> str:
+    """Uppercase the first letter the Turkish way (i -> İ, ı -> I)"""
+    first = {"i": "İ", "ı": "I"}.get(text[0]) or text[0].upper()
+    return first + text[1:]
+
+
+def pick(rng: np.random.Generator, cdf: np.ndarray, size: Optional[int] = None):
+    """Indices drawn from a cumulative distribution"""
+    return np.minimum(np.searchsorted(cdf, rng.random(size), side="right"), len(cdf) - 1)
+
+
+class CorpusGenerator:
+    """Deterministic synthetic posts and contact messages"""
+
+    def __init__(self, seed: int = 42, end: datetime = datetime(2025, 1, 1), years: int = 6):
+        self.seed = seed
+        self.end = end
+        self.span_seconds = years * 365 * 86400
+        self._category_cdf = zipf_cdf(len(CATEGORIES))
+        self._noun_cdf = zipf_cdf(len(NOUNS))
+        self._adjective_cdf = zipf_cdf(len(ADJECTIVES))
+        self._general_tag_cdf = zipf_cdf(len(GENERAL_TAGS))
+        self._category_tag_cdfs = {category: zipf_cdf(len(tags)) for category, tags in CATEGORY_TAGS.items()}
+        self._status_cdf = np.cumsum(MESSAGE_STATUS_WEIGHTS)
+
+    def _rng(self, kind: int, block: int) -> np.random.Generator:
+        return np.random.default_rng([self.seed, kind, block])
+
+    # Text
+    def _sentences(self, rng: np.random.Generator, count: int) -> List[str]:
+        """Subject-object-verb sentences, drawn in one vectorized pass"""
+        subjects = pick(rng, self._noun_cdf, count).tolist()
+        adjectives = pick(rng, self._adjective_cdf, count).tolist()
+        described = (rng.random(count) < 0.6).tolist()
+        objects = rng.integers(len(OBJECTS), size=count).tolist()
+        verbs = rng.integers(len(VERBS), size=count).tolist()
+        # One sentence in four opens with a connector
+        connectors = rng.integers(len(CONNECTORS) * 4, size=count).tolist()
+        sentences = []
+        for subject, adjective, has_adjective, obj, verb, connector in zip(
+            subjects, adjectives, described, objects, verbs, connectors
+        ):
+            subject = f"{ADJECTIVES[adjective]} {NOUNS[subject]}" if has_adjective else NOUNS[subject]
+            sentence = f"{subject} {OBJECTS[obj]} {VERBS[verb]}"
+            if connector < len(CONNECTORS):
+                sentence = f"{CONNECTORS[connector]} {sentence}"
+            sentences.append(capitalize(sentence) + ".")
+        return sentences
+
+    def _paragraphs(self, rng: np.random.Generator, count: int) -> str:
+        sentences = self._sentences(rng, count)
+        sizes = rng.integers(3, 8, size=count // 3 + 1).tolist()
+        parts = []
+        start = 0
+        for size in sizes:
+            if start >= count:
+                break
+            if parts and rng.random() < 0.15:
+                parts.append(f"<h3>{self._title(rng)}</h3>")
+            parts.append("<p>" + " ".join(sentences[start:start + size]) + "</p>")
+            start += size
+        return "\n".join(parts)
+
+    def _title(self, rng: np.random.Generator) -> str:
+        noun = NOUNS[pick(rng, self._noun_cdf)]
+        other, third = (NOUNS[i] for i in rng.integers(len(NOUNS), size=2).tolist())
+        adjective = ADJECTIVES[rng.integers(len(ADJECTIVES))]
+        number = rng.integers(3, 11)
+        template = rng.integers(8)
+        if template == 0:
+            title = f"{adjective} {noun} ve {other} üzerine"
+        elif template == 1:
+            title = f"{noun} ve {other}: {adjective} bir yolculuk"
+        elif template == 2:
+            title = f"{number} adımda {adjective} {noun}"
+        elif template == 3:
+            title = f"{adjective} {noun} hakkında öğrendiklerim"
+        elif template == 4:
+            title = f"Neden {adjective} bir {noun}?"
+        elif template == 5:
+            title = f"{OBJECTS[rng.integers(len(OBJECTS))]} nasıl {VERBS[rng.integers(len(VERBS))]}"
+        elif template == 6:
+            title = f"{adjective} bir {noun} için {number} öneri"
+        else:
+            title = f"{noun}, {other} ve {third}"
+        return capitalize(title)
+
+    def _tags(self, rng: np.random.Generator, category: str) -> List[str]:
+        # Mostly the category's own tags, so tags cluster by category
+        count = int(rng.integers(1, 6))
+        own = pick(rng, self._category_tag_cdfs[category], count).tolist()
+        general = pick(rng, self._general_tag_cdf, count).tolist()
+        tags = []
+        for use_own, i, j in zip((rng.random(count) < 0.6).tolist(), own, general):
+            tag = CATEGORY_TAGS[category][i] if use_own else GENERAL_TAGS[j]
+            if tag not in tags:
+                tags.append(tag)
+        return tags
+
+    def _timestamp(self, rng: np.random.Generator) -> datetime:
+        created = self.end - timedelta(seconds=int(rng.integers(self.span_seconds)))
+        # MongoDB keeps milliseconds
+        return created.replace(microsecond=created.microsecond // 1000 * 1000)
+
+    @staticmethod
+    def _uuid(rng: np.random.Generator) -> str:
+        return str(uuid.UUID(bytes=rng.bytes(16), version=4))
+
+    # Documents
+    def post(self, rng: np.random.Generator) -> dict:
+        category = CATEGORIES[pick(rng, self._category_cdf)]
+        # Log-normal length: most posts are a few hundred words, a few are long reads
+        sentences = int(np.clip(rng.lognormal(np.log(45), 0.7), 4, 1500))
+        content = self._paragraphs(rng, sentences)
+        created = self._timestamp(rng)
+        updated = created + timedelta(days=int(rng.integers(0, 30))) if rng.random() < 0.2 else created
+        return {
+            "id": self._uuid(rng),
+            "title": self._title(rng),
+            "excerpt": " ".join(self._sentences(rng, int(rng.integers(1, 3))))[:500],
+            "content": content,
+            "author": "Zirve Hikayem",
+            "publishDate": created.strftime("%Y-%m-%d"),
+            "category": category,
+            "tags": self._tags(rng, category),
+            "readTime": BlogPost.calculate_read_time(content),
+            "featured": bool(rng.random() < 0.03),
+            "createdAt": created,
+            "updatedAt": updated,
         }
-    ]
-    
-    print('🌱 Seeding database with mock posts...')
-    
-    # Clear existing posts
-    await db.blog_posts.delete_many({})
-    
-    # Insert mock posts
-    for i, post_data in enumerate(mock_posts, 1):
-        # Generate slug and read time
-        slug = generate_slug(post_data['title'])
-        read_time = calculate_read_time(post_data['content'])
-        
-        # Create complete post document
-        post_doc = {
-            'id': f'post_{i}',
-            'title': post_data['title'],
-            'slug': slug,
-            'excerpt': post_data['excerpt'],
-            'content': post_data['content'],
-            'author': 'Zirve Hikayem',
-            'publishDate': datetime.now().strftime('%Y-%m-%d'),
-            'category': post_data['category'],
-            'tags': post_data['tags'],
-            'readTime': read_time,
-            'featured': post_data['featured'],
-            'createdAt': datetime.utcnow(),
-            'updatedAt': datetime.utcnow()
+
+    def message(self, rng: np.random.Generator) -> dict:
+        first = FIRST_NAMES[rng.integers(len(FIRST_NAMES))]
+        last = LAST_NAMES[rng.integers(len(LAST_NAMES))]
+        email = f"{fold_turkish(first)}.{fold_turkish(last)}{rng.integers(1, 1000)}@{EMAIL_DOMAINS[rng.integers(len(EMAIL_DOMAINS))]}"
+        return {
+            "id": self._uuid(rng),
+            "name": f"{first} {last}",
+            "email": email,
+            "subject": MESSAGE_SUBJECTS[rng.integers(len(MESSAGE_SUBJECTS))],
+            "message": " ".join(self._sentences(rng, int(rng.integers(1, 7))))[:2000],
+            "status": MESSAGE_STATUSES[pick(rng, self._status_cdf)],
+            "createdAt": self._timestamp(rng),
         }
-        
-        # Insert into database
-        await db.blog_posts.insert_one(post_doc)
-        print(f'✅ Inserted: {post_doc["title"]}')
-    
-    print(f'🎉 Successfully seeded {len(mock_posts)} blog posts')
-    
-    # Close connection
-    client.close()
-    print("🔒 Database connection closed")
+
+    def _post_block(self, block: int, count: int) -> List[dict]:
+        rng = self._rng(_POSTS, block)
+        return [self.post(rng) for _ in range(count)]
+
+    def _message_block(self, block: int, count: int) -> List[dict]:
+        rng = self._rng(_MESSAGES, block)
+        return [self.message(rng) for _ in range(count)]
+
+    def _blocks(self, make_block, count: int, workers: int) -> Iterator[dict]:
+        """Documents of consecutive blocks, generated in worker processes
+        when workers > 1 (a few blocks ahead of the consumer, in order)"""
+        blocks = [(block, min(GENERATOR_BLOCK, count - block * GENERATOR_BLOCK))
+                  for block in range((count + GENERATOR_BLOCK - 1) // GENERATOR_BLOCK)]
+        if workers <= 1 or len(blocks) <= 1:
+            for block, size in blocks:
+                yield from make_block(block, size)
+            return
+        with ProcessPoolExecutor(workers) as executor:
+            pending = deque()
+            for block, size in blocks:
+                pending.append(executor.submit(make_block, block, size))
+                if len(pending) >= workers * 2:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    def posts(self, count: int, workers: int = 1) -> Iterator[dict]:
+        """count posts with unique slugs (-2, -3, ... on repeated titles)"""
+        slugs = set()
+        repeats: Dict[str, int] = {}
+        for post in self._blocks(self._post_block, count, workers):
+            base = slug = slugify(post["title"])
+            while slug in slugs:
+                repeats[base] = repeats.get(base, 1) + 1
+                slug = f"{base}-{repeats[base]}"
+            slugs.add(slug)
+            post["slug"] = slug
+            yield post
+
+    def messages(self, count: int, workers: int = 1) -> Iterator[dict]:
+        return self._blocks(self._message_block, count, workers)
+
+
+def mock_posts() -> List[dict]:
+    """The sample posts as complete documents"""
+    now = datetime.utcnow()
+    return [{
+        'id': f'post_{i}',
+        'title': post_data['title'],
+        'slug': slugify(post_data['title']),
+        'excerpt': post_data['excerpt'],
+        'content': post_data['content'],
+        'author': 'Zirve Hikayem',
+        'publishDate': now.strftime('%Y-%m-%d'),
+        'category': post_data['category'],
+        'tags': post_data['tags'],
+        'readTime': BlogPost.calculate_read_time(post_data['content']),
+        'featured': post_data['featured'],
+        'createdAt': now,
+        'updatedAt': now
+    } for i, post_data in enumerate(MOCK_POSTS, 1)]
+
+
+async def seed_storage(
+    database: Storage,
+    posts: Optional[Iterator[dict]] = None,
+    messages: Optional[Iterator[dict]] = None,
+    batch_size: int = 1000,
+    concurrency: int = 4
+) -> dict:
+    """Replace the posts and/or contact messages of a connected storage.
+
+    On MongoDB, batches are written up to ``concurrency`` at a time while
+    the next batch is generated; see Storage.replace_posts.
+    """
+    counts = {"posts": 0, "messages": 0}
+    if posts is not None:
+        counts["posts"] = await database.replace_posts(posts, batch_size, concurrency)
+    if messages is not None:
+        counts["messages"] = await database.replace_contact_messages(messages, batch_size, concurrency)
+    return counts
+
+
+async def seed_database(posts: int, messages: int, seed: int, batch_size: int, concurrency: int, workers: int):
+    """Seed the configured storage with the sample posts or a synthetic corpus"""
+    database = create_storage()
+    await database.connect()
+    print(f"🔗 Connected to {type(database).__name__} storage")
+
+    try:
+        start = time.perf_counter()
+        if posts or messages:
+            generator = CorpusGenerator(seed)
+            print(f'🌱 Generating {posts} posts and {messages} messages (seed {seed})...')
+            counts = await seed_storage(
+                database,
+                posts=generator.posts(posts, workers) if posts else None,
+                messages=generator.messages(messages, workers) if messages else None,
+                batch_size=batch_size,
+                concurrency=concurrency
+            )
+        else:
+            print('🌱 Seeding database with mock posts...')
+            counts = await seed_storage(database, posts=iter(mock_posts()))
+        elapsed = time.perf_counter() - start
+        print(f'🎉 Successfully seeded {counts["posts"]} blog posts and {counts["messages"]} messages in {elapsed:.1f}s')
+    finally:
+        await database.disconnect()
+        print("🔒 Database connection closed")
+
+
+def main(
+    posts: int = typer.Option(0, help="Synthetic posts to generate (0 with no --messages seeds the sample posts)"),
+    messages: int = typer.Option(0, help="Synthetic contact messages to generate"),
+    seed: int = typer.Option(42, help="Random seed; the same seed gives the same corpus"),
+    batch_size: int = typer.Option(1000, min=1, help="Documents per insert_many"),
+    concurrency: int = typer.Option(4, min=1, help="Batches written concurrently"),
+    workers: int = typer.Option(min(4, os.cpu_count() or 1), min=1, help="Processes generating documents")
+):
+    asyncio.run(seed_database(posts, messages, seed, batch_size, concurrency, workers))
+
 
 if __name__ == "__main__":
-    asyncio.run(seed_database())
\ No newline at end of file
+    typer.run(main)
@@ -1,28 +1,44 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Query, Depends, Header
+from fastapi import FastAPI, APIRouter, HTTPException, Query, Depends, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from pathlib import Path
 import os
+import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import List, Optional, Union
 
-from database import database
+from db_monitoring import pool_options
+from storage import create_storage, encode_cursor, InvalidCursorError, POST_SUMMARY_PROJECTION
+from write_buffer import WriteBufferFull, WriteBufferClosed
 from models import (
-    BlogPost, BlogPostCreate, BlogPostUpdate,
-    ContactMessage, ContactMessageCreate,
+    BlogPost, BlogPostCreate, BlogPostUpdate, PostSummary, PostSearchResult,
+    CategoryStats, ContactMessage, ContactMessageCreate, ContactMessageStats,
     AboutContent, AboutContentUpdate,
-    PostsResponse, MessageResponse
+    HomeResponse, PostImportReport, PostsResponse, MessageResponse
 )
+from http_cache import make_etag, cache_headers, is_not_modified, not_modified
+from responses import DocumentJSONResponse
+from snapshots import SnapshotStore
+from ratelimit import RateLimiter
+from metrics import PrometheusText, RequestMetrics
+from profiling import Profiler
+from related import RelatedPostsIndex
+from post_transfer import IMPORT_BATCH_SIZE, export_ndjson, import_ndjson, iter_lines
 from auth import (
-    authenticate_user, create_access_token, get_current_user, require_admin_role,
+    authenticate_user, create_access_token, get_current_user, require_admin_role, PasswordPoolBusy,
+    revoke_token, verify_token,
     UserLogin, Token, UserResponse, ACCESS_TOKEN_EXPIRE_MINUTES
 )
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
+# MongoDB by default; STORAGE_BACKEND=memory keeps everything in process
+database = create_storage()
+
 # Create the main app
 app = FastAPI(title="Zirve Hikayem API", version="1.0.0")
 
@@ -31,6 +47,37 @@ api_router = APIRouter(prefix="/api")
 
 # Security
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+
+# Opt-in profiling of single requests (X-Profile header from an admin, or
+# one request in PROFILE_SAMPLE_RATE)
+def is_admin_request(request: Request) -> bool:
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    user = verify_token(token)
+    return user is not None and user.get("role") == "admin"
+
+profiler = Profiler.from_env(is_admin_request)
+
+@app.middleware("http")
+async def profile_request(request, call_next):
+    return await profiler.dispatch(request, call_next)
+
+# Rate limiting for the public write endpoints (registered before CORS so
+# that 429 responses still carry CORS headers)
+rate_limiter = RateLimiter.from_env()
+
+@app.middleware("http")
+async def rate_limit(request, call_next):
+    return await rate_limiter.dispatch(request, call_next)
+
+# Request counts, latency and DB time per route, served at /api/metrics
+request_metrics = RequestMetrics()
+
+@app.middleware("http")
+async def record_request_metrics(request, call_next):
+    return await request_metrics.dispatch(request, call_next)
 
 # CORS middleware
 app.add_middleware(
@@ -39,6 +86,7 @@ app.add_middleware(
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Next-Page", "ETag", "Last-Modified", "X-Profile-Id"],
 )
 
 # Configure logging
@@ -48,16 +96,41 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Pre-rendered bodies for the hot public payloads, rebuilt after writes
+snapshots = SnapshotStore(database.get_collection_version)
+database.subscribe(snapshots.refresh_on_change)
+
+# Related posts index, kept current with this worker's writes and rebuilt
+# when another worker has written
+related_posts = RelatedPostsIndex(max_k=int(os.environ.get('RELATED_MAX_K', 10)))
+database.subscribe(related_posts.on_change)
+related_posts_lock = asyncio.Lock()
+
+async def sync_related_posts():
+    """Rebuild the related posts index if it is behind the stored posts"""
+    version = await database.get_collection_version("blog_posts")
+    if related_posts.in_sync(version):
+        return
+    async with related_posts_lock:
+        if related_posts.in_sync(version):
+            return
+        changes = related_posts.changes
+        posts = [post async for post in database.iter_posts(POST_SUMMARY_PROJECTION)]
+        index = await asyncio.to_thread(RelatedPostsIndex.build, posts, related_posts.max_k)
+        # Writes applied while building may be missing from it; rebuild again
+        related_posts.replace(index, version if related_posts.changes == changes else None)
+
 # Database connection events
 @app.on_event("startup")
 async def startup_db_client():
     await database.connect()
-    logger.info("Connected to MongoDB")
+    logger.info(f"Connected to {type(database).__name__} storage")
+    await sync_related_posts()
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
     await database.disconnect()
-    logger.info("Disconnected from MongoDB")
+    logger.info(f"Disconnected from {type(database).__name__} storage")
 
 # Authentication dependency
 async def get_current_admin_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
@@ -75,7 +148,14 @@ async def root():
 @api_router.post("/auth/login", response_model=Token)
 async def login(user_login: UserLogin):
     """Admin login endpoint"""
-    user = authenticate_user(user_login.username, user_login.password)
+    try:
+        user = await authenticate_user(user_login.username, user_login.password)
+    except PasswordPoolBusy:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many login attempts, please try again shortly",
+            headers={"Retry-After": "1"},
+        )
     if not user:
         raise HTTPException(
             status_code=401,
@@ -113,42 +193,108 @@ async def verify_auth(current_user: dict = Depends(get_current_admin_user)):
     return {"user": user_response, "message": "Token is valid"}
 
 @api_router.post("/auth/logout")
-async def logout():
-    """Logout endpoint (client should remove token)"""
+async def logout(credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)):
+    """Logout endpoint; revokes the bearer token (client should still remove it)"""
+    if credentials:
+        revoke_token(credentials.credentials)
     return {"message": "Successfully logged out"}
 
 # Blog Posts Endpoints (Protected)
-@api_router.get("/posts", response_model=List[BlogPost])
+@api_router.get("/posts", response_model=Union[List[BlogPost], List[PostSummary]])
 async def get_posts(
+    request: Request,
     category: Optional[str] = None,
-    featured: Optional[bool] = None
+    featured: Optional[bool] = None,
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    after: Optional[str] = None,
+    fields: Optional[str] = Query(None, pattern="^(full|summary)$")
 ):
-    """Get all blog posts with optional filtering (Public endpoint)"""
+    """Get blog posts with optional filtering (Public endpoint)
+
+    When ``limit`` is given the result is paged; the cursor for the next page
+    is returned in the ``X-Next-Cursor`` header and passed back as ``after``.
+    ``fields=summary`` leaves out the post content.
+    """
+    summary = fields == "summary"
     try:
+        # Conditional requests are answered from the collection version
+        # alone, before the query runs
+        version = await database.get_collection_version("blog_posts")
+        etag = make_etag("posts", version, category, featured, limit, after, fields)
+        headers = cache_headers(etag)
+        if is_not_modified(request, etag):
+            return not_modified(headers)
+        
         posts_data = await database.get_posts(
             category=category,
-            featured_only=featured or False
+            featured_only=featured or False,
+            limit=limit + 1 if limit else None,
+            after=after,
+            projection=POST_SUMMARY_PROJECTION if summary else None
         )
         
-        posts = []
-        for post_data in posts_data:
-            post_dict = dict(post_data)
-            if '_id' in post_dict:
-                del post_dict['_id']
-            posts.append(BlogPost(**post_dict))
+        if limit and len(posts_data) > limit:
+            posts_data = posts_data[:limit]
+            last = posts_data[-1]
+            headers["X-Next-Cursor"] = encode_cursor(last["publishDate"], last["id"])
         
-        return posts
+        # Stored posts were validated by BlogPost on write
+        return DocumentJSONResponse(posts_data, headers=headers)
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
     except Exception as e:
         logger.error(f"Error getting posts: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@api_router.get("/posts/featured", response_model=List[BlogPost])
-async def get_featured_posts():
+async def render_featured_posts(summary: bool) -> bytes:
+    posts_data = await database.get_posts(
+        featured_only=True,
+        projection=POST_SUMMARY_PROJECTION if summary else None
+    )
+    return DocumentJSONResponse(posts_data).body
+
+snapshots.register("featured:full", "blog_posts", lambda: render_featured_posts(False))
+snapshots.register("featured:summary", "blog_posts", lambda: render_featured_posts(True))
+
+@api_router.get("/posts/featured", response_model=Union[List[BlogPost], List[PostSummary]])
+async def get_featured_posts(
+    request: Request,
+    fields: Optional[str] = Query(None, pattern="^(full|summary)$")
+):
     """Get only featured blog posts (Public endpoint)"""
-    return await get_posts(featured=True)
+    try:
+        snapshot = await snapshots.get(f"featured:{fields or 'full'}")
+        return snapshots.response(snapshot, request)
+    except Exception as e:
+        logger.error(f"Error getting featured posts: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@api_router.get("/posts/search", response_model=List[PostSearchResult])
+async def search_posts(
+    q: str = Query(..., min_length=2, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+    page: int = Query(1, ge=1, le=100)
+):
+    """Full-text search over posts, best matches first (Public endpoint)
+
+    If there are more results the next page number is returned in the
+    ``X-Next-Page`` header.
+    """
+    try:
+        results = await database.search_posts(q, limit=limit + 1, skip=(page - 1) * limit)
+        
+        headers = {}
+        if len(results) > limit:
+            results = results[:limit]
+            headers["X-Next-Page"] = str(page + 1)
+        
+        return DocumentJSONResponse(results, headers=headers)
+    except Exception as e:
+        logger.error(f"Error searching posts for {q!r}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
 
 @api_router.get("/posts/{slug}", response_model=BlogPost)
-async def get_post_by_slug(slug: str):
+async def get_post_by_slug(slug: str, request: Request):
     """Get a single blog post by slug (Public endpoint)"""
     try:
         post_data = await database.get_post_by_slug(slug)
@@ -156,17 +302,44 @@ async def get_post_by_slug(slug: str):
         if not post_data:
             raise HTTPException(status_code=404, detail="Post not found")
         
-        post_dict = dict(post_data)
-        if '_id' in post_dict:
-            del post_dict['_id']
+        etag = make_etag("post", post_data["id"], post_data["slug"], post_data["updatedAt"])
+        headers = cache_headers(etag, post_data["updatedAt"])
+        if is_not_modified(request, etag, post_data["updatedAt"]):
+            return not_modified(headers)
         
-        return BlogPost(**post_dict)
+        return DocumentJSONResponse(post_data, headers=headers)
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error getting post by slug {slug}: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@api_router.get("/posts/{slug}/related", response_model=List[PostSummary])
+async def get_related_posts(
+    slug: str,
+    request: Request,
+    k: int = Query(3, ge=1, le=10)
+):
+    """Posts most similar to a post by title, tags and excerpt (Public endpoint)"""
+    try:
+        await sync_related_posts()
+        version = await database.get_collection_version("blog_posts")
+        etag = make_etag("related", version, slug, k)
+        headers = cache_headers(etag)
+        if is_not_modified(request, etag):
+            return not_modified(headers)
+        
+        post_data = await database.get_post_by_slug(slug)
+        if not post_data:
+            raise HTTPException(status_code=404, detail="Post not found")
+        
+        return DocumentJSONResponse(related_posts.related(post_data["id"], k), headers=headers)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting related posts for {slug}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
 @api_router.post("/posts", response_model=BlogPost)
 async def create_post(
     post_create: BlogPostCreate, 
@@ -177,9 +350,6 @@ async def create_post(
         slug = BlogPost.generate_slug(post_create.title)
         read_time = BlogPost.calculate_read_time(post_create.content)
         
-        if await database.slug_exists(slug):
-            slug = f"{slug}-{int(datetime.now().timestamp())}"
-        
         post_data = post_create.dict()
         post_data.update({
             "slug": slug,
@@ -188,13 +358,13 @@ async def create_post(
         })
         
         blog_post = BlogPost(**post_data)
-        created_post_data = await database.create_post(blog_post.dict())
-        
-        post_dict = dict(created_post_data)
-        if '_id' in post_dict:
-            del post_dict['_id']
+        # Taken slugs are caught by the unique index instead of a pre-check;
+        # a repeated title gets the next free slug-2, slug-3, ...
+        created_post_data = await database.allocate_slug(
+            slug, lambda candidate: database.create_post({**blog_post.dict(), "slug": candidate})
+        )
         
-        return BlogPost(**post_dict)
+        return BlogPost(**created_post_data)
     except Exception as e:
         logger.error(f"Error creating post: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -207,31 +377,18 @@ async def update_post(
 ):
     """Update an existing blog post (Admin only)"""
     try:
-        current_post = await database.get_post_by_id(post_id)
-        if not current_post:
-            raise HTTPException(status_code=404, detail="Post not found")
-        
         update_data = {k: v for k, v in post_update.dict().items() if v is not None}
         
-        if "title" in update_data:
-            new_slug = BlogPost.generate_slug(update_data["title"])
-            if await database.slug_exists(new_slug, exclude_id=post_id):
-                new_slug = f"{new_slug}-{int(datetime.now().timestamp())}"
-            update_data["slug"] = new_slug
-        
         if "content" in update_data:
             update_data["readTime"] = BlogPost.calculate_read_time(update_data["content"])
         
+        # A new title also moves the slug; storage allocates a free one
         updated_post_data = await database.update_post(post_id, update_data)
         
         if not updated_post_data:
             raise HTTPException(status_code=404, detail="Post not found")
         
-        post_dict = dict(updated_post_data)
-        if '_id' in post_dict:
-            del post_dict['_id']
-        
-        return BlogPost(**post_dict)
+        return BlogPost(**updated_post_data)
     except HTTPException:
         raise
     except Exception as e:
@@ -257,17 +414,98 @@ async def delete_post(
         logger.error(f"Error deleting post {post_id}: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+# Bulk Import/Export Endpoints (Admin)
+@api_router.get("/admin/posts/export")
+async def export_posts(current_user: dict = Depends(get_current_admin_user)):
+    """Stream all posts as NDJSON, one post per line (Admin only)"""
+    filename = f"posts-{datetime.now().strftime('%Y%m%d-%H%M%S')}.ndjson"
+    return StreamingResponse(
+        export_ndjson(database),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@api_router.post("/admin/posts/import", response_model=PostImportReport)
+async def import_posts(
+    request: Request,
+    batch_size: int = Query(IMPORT_BATCH_SIZE, ge=1, le=10000),
+    current_user: dict = Depends(get_current_admin_user)
+):
+    """Upsert posts by slug from an NDJSON request body (Admin only)
+
+    Lines are validated like new posts; invalid ones are skipped and listed
+    in the report. Lines without a slug become new posts under a free slug.
+    The body is read as a stream, batch by batch.
+    """
+    try:
+        report = await import_ndjson(database, iter_lines(request.stream()), batch_size)
+        logger.info(
+            f"Imported posts: {report['inserted']} inserted, {report['updated']} updated, "
+            f"{report['invalid']} invalid"
+        )
+        return report
+    except Exception as e:
+        logger.error(f"Error importing posts: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
 # Categories Endpoint (Public)
-@api_router.get("/categories", response_model=List[str])
-async def get_categories():
-    """Get all unique categories"""
+async def render_categories() -> bytes:
+    categories = await database.get_categories()
+    return DocumentJSONResponse(categories).body
+
+async def render_category_stats() -> bytes:
+    stats = await database.get_category_stats()
+    return DocumentJSONResponse(stats).body
+
+snapshots.register("categories", "blog_posts", render_categories)
+snapshots.register("categories:counts", "blog_posts", render_category_stats)
+
+@api_router.get("/categories", response_model=Union[List[str], List[CategoryStats]])
+async def get_categories(request: Request, with_counts: bool = False):
+    """Get all unique categories, optionally with post counts"""
     try:
-        categories = await database.get_categories()
-        return categories
+        snapshot = await snapshots.get("categories:counts" if with_counts else "categories")
+        return snapshots.response(snapshot, request)
     except Exception as e:
         logger.error(f"Error getting categories: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+# Homepage Endpoint (Public)
+HOME_POSTS_LIMIT = int(os.environ.get('HOME_POSTS_LIMIT', 10))
+
+async def render_home() -> bytes:
+    categories, featured, posts = await asyncio.gather(
+        database.get_categories(),
+        database.get_posts(featured_only=True, projection=POST_SUMMARY_PROJECTION),
+        database.get_posts(limit=HOME_POSTS_LIMIT + 1, projection=POST_SUMMARY_PROJECTION)
+    )
+    next_cursor = None
+    if len(posts) > HOME_POSTS_LIMIT:
+        posts = posts[:HOME_POSTS_LIMIT]
+        next_cursor = encode_cursor(posts[-1]["publishDate"], posts[-1]["id"])
+    return DocumentJSONResponse({
+        "categories": categories,
+        "featured": featured,
+        "posts": posts,
+        "nextCursor": next_cursor
+    }).body
+
+snapshots.register("home", "blog_posts", render_home)
+
+@api_router.get("/home", response_model=HomeResponse)
+async def get_home(request: Request):
+    """Everything the homepage renders first, in one response (Public endpoint)
+
+    ``posts`` is the first page of recent summaries; ``nextCursor`` continues
+    it through ``/api/posts?limit=...&after=...``.
+    """
+    try:
+        snapshot = await snapshots.get("home")
+        return snapshots.response(snapshot, request)
+    except Exception as e:
+        logger.error(f"Error getting homepage data: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
 # Contact Endpoints
 @api_router.post("/contact", response_model=MessageResponse)
 async def create_contact_message(message_create: ContactMessageCreate):
@@ -277,6 +515,12 @@ async def create_contact_message(message_create: ContactMessageCreate):
         await database.create_contact_message(contact_message.dict())
         
         return MessageResponse(message="Mesajınız başarıyla gönderildi! En kısa sürede size dönüş yapacağım.")
+    except (WriteBufferFull, WriteBufferClosed):
+        raise HTTPException(
+            status_code=503,
+            detail="Service busy, please try again shortly",
+            headers={"Retry-After": "1"},
+        )
     except Exception as e:
         logger.error(f"Error creating contact message: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -284,24 +528,42 @@ async def create_contact_message(message_create: ContactMessageCreate):
 @api_router.get("/contact", response_model=List[ContactMessage])
 async def get_contact_messages(
     status: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    after: Optional[str] = None,
     current_user: dict = Depends(get_current_admin_user)
 ):
-    """Get all contact messages (Admin only)"""
+    """Get contact messages, newest first, one page at a time (Admin only)
+
+    The cursor for the next page is returned in the ``X-Next-Cursor`` header.
+    """
     try:
-        messages_data = await database.get_contact_messages(status=status)
+        messages_data = await database.get_contact_messages(
+            status=status, limit=limit + 1, after=after
+        )
         
-        messages = []
-        for message_data in messages_data:
-            message_dict = dict(message_data)
-            if '_id' in message_dict:
-                del message_dict['_id']
-            messages.append(ContactMessage(**message_dict))
+        headers = {}
+        if len(messages_data) > limit:
+            messages_data = messages_data[:limit]
+            last = messages_data[-1]
+            headers["X-Next-Cursor"] = encode_cursor(last["createdAt"], last["id"])
         
-        return messages
+        return DocumentJSONResponse(messages_data, headers=headers)
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
     except Exception as e:
         logger.error(f"Error getting contact messages: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@api_router.get("/contact/stats", response_model=ContactMessageStats)
+async def get_contact_message_stats(current_user: dict = Depends(get_current_admin_user)):
+    """Get message counts per status for the inbox badges (Admin only)"""
+    try:
+        counts = await database.count_contact_messages()
+        return ContactMessageStats(total=sum(counts.values()), byStatus=counts)
+    except Exception as e:
+        logger.error(f"Error counting contact messages: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
 @api_router.put("/contact/{message_id}/status", response_model=MessageResponse)
 async def update_message_status(
     message_id: str, 
@@ -323,37 +585,40 @@ async def update_message_status(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 # About Content Endpoints
-@api_router.get("/about", response_model=AboutContent)
-async def get_about_content():
-    """Get about page content (Public endpoint)"""
-    try:
-        content_data = await database.get_about_content()
-        
-        if not content_data:
-            default_content = AboutContent(
-                description="""
+def default_about_content() -> AboutContent:
+    """About page content shown until an admin saves one"""
+    return AboutContent(
+        description="""
                     Merhaba, ben Aydın Kocatürk! Bu platformda hayatımın farklı dönemlerinde yaşadığım deneyimleri, 
                     girişimcilik yolculuğumda karşılaştığım zorlukları ve başarıları, kişisel gelişim serüvenimde 
                     öğrendiklerimi sizlerle paylaşıyorum.
                     
                     Amacım, kendi hikayelerim aracılığıyla sizlere ilham vermek ve belki de benzer yollardan geçenler 
                     için rehber olmak. Çünkü inanıyorum ki her deneyim bir ders, her ders ise yeni bir başlangıç.
-                """,
-                mission="İnsanların kendi potansiyellerini keşfetmelerine yardımcı olmak ve başarı yolculuklarında yanlarında olmak.",
-                values=[
-                    "Samimi ve dürüst paylaşımlar",
-                    "Sürekli öğrenme ve gelişim",
-                    "Topluma değer katma",
-                    "İlham verici içerik üretimi"
-                ]
-            )
-            return default_content
-        
-        content_dict = dict(content_data)
-        if '_id' in content_dict:
-            del content_dict['_id']
-        
-        return AboutContent(**content_dict)
+        """,
+        mission="İnsanların kendi potansiyellerini keşfetmelerine yardımcı olmak ve başarı yolculuklarında yanlarında olmak.",
+        values=[
+            "Samimi ve dürüst paylaşımlar",
+            "Sürekli öğrenme ve gelişim",
+            "Topluma değer katma",
+            "İlham verici içerik üretimi"
+        ]
+    )
+
+async def render_about_content() -> bytes:
+    content_data = await database.get_about_content()
+    if not content_data:
+        content_data = default_about_content().dict()
+    return DocumentJSONResponse(content_data).body
+
+snapshots.register("about", "about_content", render_about_content)
+
+@api_router.get("/about", response_model=AboutContent)
+async def get_about_content(request: Request):
+    """Get about page content (Public endpoint)"""
+    try:
+        snapshot = await snapshots.get("about")
+        return snapshots.response(snapshot, request)
     except Exception as e:
         logger.error(f"Error getting about content: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -365,29 +630,79 @@ async def update_about_content(
 ):
     """Update about page content (Admin only)"""
     try:
-        current_content = await database.get_about_content()
-        
         update_data = {k: v for k, v in content_update.dict().items() if v is not None}
         
-        if current_content:
-            current_dict = dict(current_content)
-            current_dict.update(update_data)
-            if '_id' in current_dict:
-                del current_dict['_id']
-        else:
-            current_dict = AboutContent().dict()
-            current_dict.update(update_data)
-        
-        updated_content_data = await database.update_about_content(current_dict)
-        
-        content_dict = dict(updated_content_data)
-        if '_id' in content_dict:
-            del content_dict['_id']
+        # Defaults only apply when the document does not exist yet
+        updated_content_data = await database.update_about_content(
+            update_data, defaults=default_about_content().dict()
+        )
         
-        return AboutContent(**content_dict)
+        return AboutContent(**updated_content_data)
     except Exception as e:
         logger.error(f"Error updating about content: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+# Admin Metrics Endpoints
+@api_router.get("/admin/metrics/db")
+async def get_db_metrics(current_user: dict = Depends(get_current_admin_user)):
+    """Connection pool and command latency metrics of this worker (Admin only)"""
+    if database.pool_metrics is None:
+        raise HTTPException(status_code=404, detail="No database metrics for this storage backend")
+    
+    return {
+        "poolOptions": pool_options(),
+        "pool": database.pool_metrics.snapshot(),
+        "commands": database.command_metrics.snapshot(),
+    }
+
+@api_router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics(authorization: Optional[str] = Header(None)):
+    """Prometheus metrics of this worker; set METRICS_TOKEN to require a bearer token"""
+    metrics_token = os.environ.get('METRICS_TOKEN')
+    if metrics_token and authorization != f"Bearer {metrics_token}":
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    
+    out = PrometheusText()
+    request_metrics.write(out)
+    caches = {"query": database.cache, "version": database.version_cache, "snapshot": snapshots.cache}
+    hits = out.metric("cache_hits_total", "counter", "Cache lookups served from memory")
+    for name, cache in caches.items():
+        out.sample(hits, {"cache": name}, cache.hits)
+    misses = out.metric("cache_misses_total", "counter", "Cache lookups that had to load")
+    for name, cache in caches.items():
+        out.sample(misses, {"cache": name}, cache.misses)
+    if database.pool_metrics is not None:
+        database.pool_metrics.write(out)
+        database.command_metrics.write(out)
+    return PlainTextResponse(out.render(), media_type=PrometheusText.content_type)
+
+@api_router.get("/admin/profiles")
+async def list_profiles(current_user: dict = Depends(get_current_admin_user)):
+    """Profiles captured by this worker, newest first (Admin only)"""
+    return [profile.summary() for profile in reversed(profiler.profiles)]
+
+@api_router.get("/admin/profiles/{profile_id}")
+async def get_profile(
+    profile_id: int,
+    format: str = Query("collapsed", pattern="^(collapsed|pstats|text)$"),
+    current_user: dict = Depends(get_current_admin_user)
+):
+    """Download a captured profile as collapsed stacks, pstats or text (Admin only)"""
+    profile = profiler.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    
+    if format == "pstats":
+        if profile.stats is None:
+            raise HTTPException(status_code=400, detail="pstats output needs a cprofile profile")
+        return Response(
+            content=profile.pstats_bytes(),
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": f'attachment; filename="profile-{profile_id}.pstats"'}
+        )
+    if format == "text":
+        return PlainTextResponse(profile.text())
+    return PlainTextResponse(profile.collapsed())
+
 # Include the router in the main app
 app.include_router(api_router)
\ No newline at end of file
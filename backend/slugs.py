@@ -0,0 +1,57 @@
+"""
+Slugs and Turkish text folding
+Shared by post slugs, the search fields and the related posts index, so a
+title, its slug and a search query fold the same way. Suffixes that keep
+slugs unique (base-2, base-3, ...) are handed out by Storage.allocate_slug.
+"""
+import re
+from typing import Optional
+
+# Turkish letters folded to ASCII
+TURKISH_CHAR_MAP = {
+    'ç': 'c', 'ğ': 'g', 'ı': 'i', 'ö': 'o', 'ş': 's', 'ü': 'u',
+    'Ç': 'c', 'Ğ': 'g', 'İ': 'i', 'Ö': 'o', 'Ş': 's', 'Ü': 'u'
+}
+
+# What is left to fold after lower(): the lowercase letters, plus the
+# combining dot 'İ'.lower() leaves behind. Chained str.replace beats
+# str.translate here; translate takes a slow per-character path on
+# non-ASCII text.
+_FOLDS = tuple((turkish, plain) for turkish, plain in TURKISH_CHAR_MAP.items() if turkish.islower()) + (('\u0307', ''),)
+_UNSLUGGABLE = re.compile(r'[^a-z0-9\s-]')
+# Numeric suffixes up to 6 digits; longer ones are the timestamps older
+# versions appended on collisions and are not counted
+_SUFFIX = re.compile(r'-([0-9]{1,6})')
+
+
+def fold_turkish(text: str) -> str:
+    """Lowercase text and fold Turkish letters to ASCII"""
+    folded = text.lower()
+    if folded.isascii():
+        return folded
+    for turkish, plain in _FOLDS:
+        folded = folded.replace(turkish, plain)
+    return folded
+
+
+def slugify(text: str) -> str:
+    """URL-friendly slug: folded, punctuation dropped, words joined by hyphens"""
+    return '-'.join(_UNSLUGGABLE.sub('', fold_turkish(text)).replace('-', ' ').split())
+
+
+def slug_suffix(slug: str, base: str) -> Optional[int]:
+    """The N of a base-N slug, None when slug is not a suffixed form of base"""
+    if not slug.startswith(base):
+        return None
+    match = _SUFFIX.fullmatch(slug, len(base))
+    return int(match.group(1)) if match else None
+
+
+def suffix_pattern(base: str) -> str:
+    """Regular expression matching the suffixed forms of base"""
+    return f"^{re.escape(base)}{_SUFFIX.pattern}$"
+
+
+def variant_pattern(base: str) -> str:
+    """Regular expression matching base and its suffixed forms"""
+    return f"^{re.escape(base)}(?:{_SUFFIX.pattern})?$"
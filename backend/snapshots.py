@@ -0,0 +1,126 @@
+"""
+Pre-rendered response bodies for hot public payloads
+Each snapshot is encoded (and compressed) once per collection version and
+served as bytes until the next write
+"""
+import asyncio
+import gzip
+import hashlib
+from typing import Awaitable, Callable, Dict, NamedTuple, Optional, Set
+
+from fastapi import Request, Response
+
+from cache import TTLCache
+from http_cache import cache_headers, is_not_modified, not_modified
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+
+class Snapshot(NamedTuple):
+    body: bytes
+    etag: str
+    gzip_body: bytes
+    br_body: Optional[bytes]
+
+
+class SnapshotSpec(NamedTuple):
+    # Collection whose version decides when the snapshot is stale
+    collection: str
+    build: Callable[[], Awaitable[bytes]]
+
+
+def accepted_encodings(request: Request) -> Set[str]:
+    """Content codings the client accepts (ignoring q=0)"""
+    encodings = set()
+    for item in request.headers.get("accept-encoding", "").split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if coding and quality > 0:
+            encodings.add(coding.lower())
+    return encodings
+
+
+class SnapshotStore:
+    def __init__(self, get_version: Callable[[str], Awaitable[int]]):
+        self._get_version = get_version
+        self._specs: Dict[str, SnapshotSpec] = {}
+        # Keyed by (name, version); the TTL only bounds memory for names
+        # that stop being requested
+        self.cache = TTLCache(maxsize=64, ttl=3600)
+        self._rebuilds: Set[asyncio.Task] = set()
+
+    def register(self, name: str, collection: str, build: Callable[[], Awaitable[bytes]]) -> None:
+        self._specs[name] = SnapshotSpec(collection, build)
+
+    async def get(self, name: str) -> Snapshot:
+        """Current snapshot for name, built on first use after a write"""
+        spec = self._specs[name]
+        version = await self._get_version(spec.collection)
+        return await self.cache.get_or_load((name, version), lambda: self._render(spec))
+
+    async def _render(self, spec: SnapshotSpec) -> Snapshot:
+        body = await spec.build()
+        etag = '"' + hashlib.sha1(body).hexdigest()[:32] + '"'
+        return Snapshot(
+            body=body,
+            etag=etag,
+            gzip_body=gzip.compress(body, compresslevel=9),
+            br_body=brotli.compress(body) if brotli else None
+        )
+
+    def refresh(self, collection: str) -> None:
+        """Drop snapshots of a collection and rebuild them in the background"""
+        names = [name for name, spec in self._specs.items() if spec.collection == collection]
+        self.cache.invalidate_where(lambda key: key[0] in names)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        for name in names:
+            task = loop.create_task(self._rebuild(name))
+            self._rebuilds.add(task)
+            task.add_done_callback(self._rebuilds.discard)
+
+    async def _rebuild(self, name: str) -> None:
+        try:
+            await self.get(name)
+        except Exception:
+            # The next request retries the build and reports the error
+            pass
+
+    def refresh_on_change(self, event: str, previous: Optional[dict], current: Optional[dict]) -> None:
+        """Database change listener"""
+        self.refresh("about_content" if event == "about_updated" else "blog_posts")
+
+    @staticmethod
+    def response(snapshot: Snapshot, request: Request) -> Response:
+        """Serve the best encoding of a snapshot the client accepts, or a 304
+
+        Each encoding is its own representation with its own strong ETag,
+        and every response, 304s included, varies on Accept-Encoding so
+        shared caches keep the encodings apart.
+        """
+        encodings = accepted_encodings(request)
+        if snapshot.br_body is not None and "br" in encodings:
+            body, coding = snapshot.br_body, "br"
+        elif "gzip" in encodings:
+            body, coding = snapshot.gzip_body, "gzip"
+        else:
+            body, coding = snapshot.body, None
+
+        etag = snapshot.etag if coding is None else f'{snapshot.etag[:-1]}-{coding}"'
+        headers = dict(cache_headers(etag), Vary="Accept-Encoding")
+        if is_not_modified(request, etag):
+            return not_modified(headers)
+        if coding is not None:
+            headers["Content-Encoding"] = coding
+        return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,371 @@
+"""
+Storage interface shared by the MongoDB and in-memory backends
+STORAGE_BACKEND selects the implementation: "mongo" (default, database.py)
+or "memory" (memory_storage.py)
+"""
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
+import base64
+import json
+import logging
+import os
+import re
+
+from pymongo.errors import DuplicateKeyError
+
+from models import PostSummary
+from slugs import fold_turkish, slugify
+
+logger = logging.getLogger(__name__)
+
+# Sort order shared by the post listing queries and their keyset cursors
+POST_SORT = [("publishDate", -1), ("id", -1)]
+# Same for the contact inbox
+MESSAGE_SORT = [("createdAt", -1), ("id", -1)]
+
+# Read projections; documents come back without _id or the search fields,
+# ready to serialize
+POST_PROJECTION = {"_id": 0, "search": 0}
+# Listing views: the PostSummary fields, i.e. no HTML body
+POST_SUMMARY_PROJECTION = {"_id": 0, **{field: 1 for field in PostSummary.model_fields}}
+
+# Tries before giving up on a free slug; each one after the first takes a
+# fresh counter suffix, so only pre-existing suffixed slugs cost retries
+SLUG_ATTEMPTS = 10
+
+_HTML_TAG = re.compile(r'<[^>]+>')
+
+T = TypeVar("T")
+
+
+def search_fields(post: dict) -> dict:
+    """Folded copies of the searchable fields present in a post or update"""
+    fields = {}
+    for name in ("title", "excerpt", "content"):
+        if name in post:
+            text = post[name]
+            if name == "content":
+                text = _HTML_TAG.sub(" ", text)
+            fields[name] = fold_turkish(text)
+    if "tags" in post:
+        fields["tags"] = [fold_turkish(tag) for tag in post["tags"]]
+    return fields
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+def encode_cursor(sort_value, doc_id: str) -> str:
+    """Encode the sort key of the last document on a page into an opaque cursor.
+
+    ``sort_value`` is the publishDate of a post or the createdAt of a message.
+    """
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, doc_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, doc_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception:
+        raise InvalidCursorError("Invalid cursor")
+    if not isinstance(sort_value, str) or not isinstance(doc_id, str):
+        raise InvalidCursorError("Invalid cursor")
+    return sort_value, doc_id
+
+
+def decode_message_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a contact inbox cursor, whose sort value is a createdAt datetime"""
+    created_at, message_id = decode_cursor(cursor)
+    try:
+        return datetime.fromisoformat(created_at), message_id
+    except ValueError:
+        raise InvalidCursorError("Invalid cursor")
+
+
+def utcnow() -> datetime:
+    """Current UTC time at MongoDB's millisecond precision.
+
+    Documents returned straight from a write then match what a later read
+    of the same document gives back.
+    """
+    now = datetime.utcnow()
+    return now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+
+def is_duplicate_key(error: DuplicateKeyError, field: str) -> bool:
+    """Whether a duplicate key error was raised by the unique index on field"""
+    details = error.details or {}
+    if "keyPattern" in details:
+        return field in details["keyPattern"]
+    return f"{field}_1" in str(error)
+
+
+def batched(documents: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    """Split documents into lists of up to size"""
+    batch = []
+    for document in documents:
+        batch.append(document)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def category_key(category: Optional[str]) -> Optional[str]:
+    """Normalize a category filter; "Tümü" (all) and empty mean no filter"""
+    return category if category and category != "Tümü" else None
+
+
+class BulkImportError(Exception):
+    """Raised when an import stops at a post the database rejected.
+
+    ``position`` is the index of that post in the import and ``counts`` the
+    inserted/updated totals written before it.
+    """
+
+    def __init__(self, message: str, position: int, counts: Dict[str, int]):
+        super().__init__(message)
+        self.position = position
+        self.counts = counts
+
+
+# Called as listener(event, previous, current) after a write has completed.
+# Events: post_created, post_updated, post_deleted, about_updated, and
+# posts_imported (previous and current are None; any post may have changed)
+ChangeListener = Callable[[str, Optional[dict], Optional[dict]], None]
+
+
+class Storage(ABC):
+    """Operations the API needs from a storage backend.
+
+    Post and message documents are plain dicts shaped like the models, read
+    without ``_id``. A slug collision on create/update raises pymongo's
+    DuplicateKeyError (see is_duplicate_key) on every backend; allocate_slug
+    turns that into the next free base-N slug.
+    """
+
+    # MongoDB pool and command listeners; None on backends without them
+    pool_metrics = None
+    command_metrics = None
+
+    def __init__(self):
+        self._listeners: List[ChangeListener] = []
+
+    # Change Notifications
+    def subscribe(self, listener: ChangeListener) -> None:
+        """Register a listener for completed writes"""
+        self._listeners.append(listener)
+
+    def _notify(self, event: str, previous: Optional[dict], current: Optional[dict]) -> None:
+        for listener in self._listeners:
+            try:
+                listener(event, previous, current)
+            except Exception:
+                logger.exception(f"Change listener failed for {event}")
+
+    @abstractmethod
+    async def connect(self) -> None:
+        ...
+
+    @abstractmethod
+    async def disconnect(self) -> None:
+        ...
+
+    @abstractmethod
+    async def get_collection_version(self, name: str) -> int:
+        """Write counter of a collection, bumped on every write to it"""
+
+    # Blog Posts
+    @abstractmethod
+    async def get_posts(
+        self,
+        category: Optional[str] = None,
+        featured_only: bool = False,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        projection: Optional[dict] = None
+    ) -> List[dict]:
+        ...
+
+    @abstractmethod
+    def iter_posts(self, projection: Optional[dict] = None) -> AsyncIterator[dict]:
+        """Every post in no particular order, streamed rather than loaded at once"""
+
+    @abstractmethod
+    async def search_posts(self, query: str, limit: int = 10, skip: int = 0) -> List[dict]:
+        ...
+
+    @abstractmethod
+    async def get_post_by_slug(self, slug: str) -> Optional[dict]:
+        ...
+
+    @abstractmethod
+    async def get_post_by_id(self, post_id: str) -> Optional[dict]:
+        ...
+
+    @abstractmethod
+    async def create_post(self, post_data: dict) -> dict:
+        ...
+
+    @abstractmethod
+    async def update_post(self, post_id: str, update_data: dict) -> Optional[dict]:
+        """Apply a partial update; None when the post does not exist.
+
+        A new title without an explicit slug also moves the post to the
+        title's first free slug (see allocate_slug), unless the post already
+        holds that slug or one of its base-N forms.
+        """
+
+    @abstractmethod
+    async def delete_post(self, post_id: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def import_posts(self, batches: AsyncIterable[List[dict]]) -> Dict[str, int]:
+        """Upsert complete post documents by slug, batch by batch, in order.
+
+        Posts whose slug is None are new: they get a free slug of their title
+        from allocate_slugs and are only ever inserted. Returns the inserted
+        and updated counts; raises BulkImportError at the first post that
+        cannot be written (e.g. an id owned by another slug).
+        """
+
+    @abstractmethod
+    async def replace_posts(self, posts: Iterable[dict], batch_size: int = 1000, concurrency: int = 4) -> int:
+        """Replace every post with complete post documents (seeding).
+
+        Writes up to ``concurrency`` batches at a time where the backend
+        can; derived data is rebuilt once at the end. Returns the number of
+        posts written.
+        """
+
+    # Slugs
+    @abstractmethod
+    async def reserve_slug_suffixes(self, base: str, count: int = 1, above: int = 0) -> int:
+        """Reserve count consecutive suffixes of base and return the first.
+
+        Suffixes start at 2 and come from a per-base counter, so concurrent
+        writers never get the same one; ``above`` moves the counter past
+        suffixes already in use.
+        """
+
+    @abstractmethod
+    async def find_taken_slugs(self, slugs: List[str]) -> Set[str]:
+        """The given slugs that belong to a post"""
+
+    @abstractmethod
+    async def max_slug_suffix(self, base: str) -> int:
+        """Highest N among existing base-N slugs (0 if none)"""
+
+    async def allocate_slug(self, base: str, write: Callable[[str], Awaitable[T]]) -> T:
+        """Run write(slug) with the first slug of base the unique index accepts.
+
+        base itself is tried first; each DuplicateKeyError on the slug moves
+        to a newly reserved base-N. A reserved suffix can only be taken by a
+        slug that predates the counter, in which case the counter is moved
+        past the existing ones.
+        """
+        slug = base
+        for _ in range(SLUG_ATTEMPTS):
+            try:
+                return await write(slug)
+            except DuplicateKeyError as e:
+                if not is_duplicate_key(e, "slug"):
+                    raise
+                error = e
+            above = await self.max_slug_suffix(base) if slug != base else 0
+            slug = f"{base}-{await self.reserve_slug_suffixes(base, 1, above)}"
+        raise error
+
+    async def allocate_slugs(self, posts: List[dict], claimed: Set[str]) -> None:
+        """Set a free slug of its title on each post, with one lookup per round.
+
+        ``claimed`` holds slugs already used by the same write (e.g. the rest
+        of an import batch); it is extended with the allocated ones.
+        """
+        pending = []
+        for post in posts:
+            base = slugify(post["title"])
+            pending.append((post, base, base))
+        for _ in range(SLUG_ATTEMPTS):
+            taken = await self.find_taken_slugs([slug for _, _, slug in pending])
+            colliding: Dict[str, List[Tuple[dict, bool]]] = {}
+            for post, base, slug in pending:
+                if slug in taken or slug in claimed:
+                    colliding.setdefault(base, []).append((post, slug != base))
+                else:
+                    post["slug"] = slug
+                    claimed.add(slug)
+            if not colliding:
+                return
+            pending = []
+            for base, group in colliding.items():
+                above = await self.max_slug_suffix(base) if any(suffixed for _, suffixed in group) else 0
+                first = await self.reserve_slug_suffixes(base, len(group), above)
+                pending.extend((post, base, f"{base}-{first + i}") for i, (post, _) in enumerate(group))
+        raise RuntimeError(f"No free slug found for {len(pending)} posts")
+
+    @abstractmethod
+    async def get_categories(self) -> List[str]:
+        ...
+
+    @abstractmethod
+    async def get_category_stats(self) -> List[dict]:
+        ...
+
+    # Contact Messages
+    @abstractmethod
+    async def create_contact_message(self, message_data: dict) -> dict:
+        ...
+
+    @abstractmethod
+    async def replace_contact_messages(
+        self, messages: Iterable[dict], batch_size: int = 1000, concurrency: int = 4
+    ) -> int:
+        """Replace every contact message (seeding); returns the number written"""
+
+    @abstractmethod
+    async def get_contact_messages(
+        self,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[str] = None
+    ) -> List[dict]:
+        ...
+
+    @abstractmethod
+    async def count_contact_messages(self) -> dict:
+        ...
+
+    @abstractmethod
+    async def update_message_status(self, message_id: str, status: str) -> bool:
+        ...
+
+    # About Content
+    @abstractmethod
+    async def get_about_content(self) -> Optional[dict]:
+        ...
+
+    @abstractmethod
+    async def update_about_content(self, content_data: dict, defaults: Optional[dict] = None) -> dict:
+        ...
+
+
+def create_storage() -> Storage:
+    """The storage backend selected by STORAGE_BACKEND"""
+    backend = os.environ.get('STORAGE_BACKEND', 'mongo')
+    if backend == 'memory':
+        from memory_storage import MemoryDatabase
+        return MemoryDatabase()
+    if backend == 'mongo':
+        from database import database
+        return database
+    raise ValueError(f"Unknown STORAGE_BACKEND: {backend}")
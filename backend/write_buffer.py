@@ -0,0 +1,141 @@
+"""
+Batched insert path for high-volume public writes (contact form submissions)
+Documents are grouped and written with one ordered insert_many; each caller
+is answered once the batch holding its document has been written
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from pymongo.errors import BulkWriteError
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBufferFull(Exception):
+    """Raised when the buffer stays full for longer than the submit timeout"""
+
+
+class WriteBufferClosed(Exception):
+    """Raised when submitting to a buffer that is shutting down"""
+
+
+class WriteBuffer:
+    """Group-commit buffer in front of ``insert_many``.
+
+    A batch is flushed when it reaches ``max_batch`` documents or when its
+    oldest document has waited ``max_delay`` seconds. A single flusher keeps
+    batches in submission order. At most ``max_pending`` documents can wait;
+    beyond that submit() blocks for up to ``submit_timeout`` seconds.
+    """
+
+    def __init__(
+        self,
+        insert_many: Callable[[List[dict]], Awaitable[None]],
+        max_batch: int = 100,
+        max_delay: float = 0.02,
+        max_pending: int = 1000,
+        submit_timeout: float = 1.0
+    ):
+        self._insert_many = insert_many
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+        self.submit_timeout = submit_timeout
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._closing = False
+
+    def start(self) -> None:
+        """Start the flusher on the running event loop"""
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._closing = False
+        self._flusher = asyncio.get_running_loop().create_task(self._run())
+
+    async def submit(self, document: dict) -> None:
+        """Queue a document and wait until it has been written"""
+        if self._closing or self._queue is None:
+            raise WriteBufferClosed()
+        future = asyncio.get_running_loop().create_future()
+        item = (document, future)
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            try:
+                await asyncio.wait_for(self._queue.put(item), timeout=self.submit_timeout)
+            except asyncio.TimeoutError:
+                raise WriteBufferFull()
+            if self._flusher.done():
+                # Closed while we waited for room; nobody else will write it
+                await self._drain()
+        await future
+
+    async def close(self) -> None:
+        """Stop accepting documents and flush everything already queued"""
+        if self._queue is None or self._closing:
+            return
+        self._closing = True
+        await self._queue.put(None)
+        await self._flusher
+        await self._drain()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = loop.time() + self.max_delay
+            stop = False
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            await self._flush(batch)
+            if stop:
+                return
+
+    async def _drain(self) -> None:
+        """Write whatever is still queued once the flusher has stopped"""
+        batch = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not None:
+                batch.append(item)
+            if len(batch) >= self.max_batch:
+                await self._flush(batch)
+                batch = []
+        if batch:
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Tuple[dict, asyncio.Future]]) -> None:
+        written = 0
+        error: Optional[BaseException] = None
+        try:
+            await self._insert_many([document for document, _ in batch])
+            written = len(batch)
+        except BulkWriteError as e:
+            # Ordered inserts stop at the first failure; earlier ones landed
+            written = e.details.get("nInserted", 0)
+            error = e
+            logger.error(f"Batched insert failed after {written} of {len(batch)} documents: {str(e)}")
+        except Exception as e:
+            error = e
+            logger.error(f"Batched insert of {len(batch)} documents failed: {str(e)}")
+
+        for i, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            if i < written:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
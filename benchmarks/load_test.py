@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Load test for the API routes
+Runs the FastAPI app in-process (httpx ASGITransport, no network), seeds a
+synthetic corpus, drives each route with concurrent clients and reports
+throughput, latency percentiles and memory. Results are written as JSON so
+two commits can be compared:
+
+    python benchmarks/load_test.py --output before.json
+    python benchmarks/load_test.py --output after.json --compare before.json
+
+By default the database is mongomock, with the in-process search index
+since mongomock has no $text; set MONGO_URL and pass --mongo to run against
+a real server (use a throwaway DB_NAME, the collections are dropped), or
+pass --memory to use the in-memory storage backend and measure the API
+layer alone. Extra dependencies: pip install -r benchmarks/requirements.txt
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "backend"))
+
+# Limits and profiling must not interfere with the measurements; set before
+# the app is imported
+os.environ.setdefault("RATE_LIMIT_CONTACT", "1000000000/1")
+os.environ.setdefault("RATE_LIMIT_LOGIN", "1000000000/1")
+os.environ.setdefault("PROFILE_SAMPLE_RATE", "0")
+
+try:
+    import httpx
+except ImportError:  # optional dependency
+    httpx = None
+
+class Scenario(NamedTuple):
+    name: str
+    method: str
+    # Builds (path, json body) for the i-th request
+    build: Callable[[int], tuple]
+    admin: bool = False
+
+
+async def seed(database, posts: int, messages: int, seed_value: int) -> dict:
+    """Replace the data with the seed_data.py synthetic corpus"""
+    from seed_data import NOUNS, CorpusGenerator, seed_storage
+
+    generator = CorpusGenerator(seed_value)
+    post_docs = list(generator.posts(posts))
+    await seed_storage(database, posts=iter(post_docs), messages=generator.messages(messages))
+    return {
+        "slugs": [post["slug"] for post in post_docs],
+        "categories": sorted({post["category"] for post in post_docs}),
+        "terms": NOUNS[:20],
+    }
+
+
+def build_scenarios(corpus: dict) -> List[Scenario]:
+    slugs, categories, terms = corpus["slugs"], corpus["categories"], corpus["terms"]
+    contact = {"name": "Yük Testi", "email": "load@example.com", "subject": "Merhaba", "message": "Yük testi mesajı"}
+    return [
+        Scenario("posts", "GET", lambda i: ("/api/posts", None)),
+        Scenario("posts_summary", "GET", lambda i: ("/api/posts?fields=summary", None)),
+        Scenario("posts_category", "GET", lambda i: (f"/api/posts?category={categories[i % len(categories)]}", None)),
+        Scenario("posts_featured", "GET", lambda i: ("/api/posts/featured", None)),
+        Scenario("post_by_slug", "GET", lambda i: (f"/api/posts/{slugs[i * 7919 % len(slugs)]}", None)),
+        Scenario("related", "GET", lambda i: (f"/api/posts/{slugs[i * 7919 % len(slugs)]}/related", None)),
+        Scenario("search", "GET", lambda i: (f"/api/posts/search?q={terms[i % len(terms)]}", None)),
+        Scenario("categories", "GET", lambda i: ("/api/categories", None)),
+        Scenario("categories_counts", "GET", lambda i: ("/api/categories?with_counts=1", None)),
+        Scenario("home", "GET", lambda i: ("/api/home", None)),
+        Scenario("about", "GET", lambda i: ("/api/about", None)),
+        Scenario("contact_create", "POST", lambda i: ("/api/contact", contact)),
+        Scenario("contact_list", "GET", lambda i: ("/api/contact", None), admin=True),
+        Scenario("contact_stats", "GET", lambda i: ("/api/contact/stats", None), admin=True),
+    ]
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+async def run_scenario(client, scenario: Scenario, requests: int, concurrency: int, headers: dict) -> dict:
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    counter = iter(range(requests))
+
+    async def worker():
+        for i in counter:
+            path, body = scenario.build(i)
+            start = time.perf_counter()
+            response = await client.request(scenario.method, path, json=body, headers=headers)
+            latencies.append(time.perf_counter() - start)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    # Warm caches and snapshots the way a running server would be
+    for i in range(min(10, requests)):
+        path, body = scenario.build(i)
+        await client.request(scenario.method, path, json=body, headers=headers)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": sum(count for status, count in statuses.items() if status >= 400),
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+        "rps": round(requests / elapsed, 1),
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+    }
+
+
+async def measure_memory(client, scenario: Scenario, requests: int, headers: dict) -> dict:
+    """Peak and retained traced memory over sequential requests (separate
+    pass, tracemalloc slows everything down)"""
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    for i in range(requests):
+        path, body = scenario.build(i)
+        await client.request(scenario.method, path, json=body, headers=headers)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "peak_kib": round((peak - baseline) / 1024, 1),
+        "retained_kib": round((current - baseline) / 1024, 1),
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> int:
+    """Print throughput and p95 changes; returns the number of regressions"""
+    regressions = 0
+    print(f"\n📈 Compared with {baseline['meta'].get('commit') or 'baseline'}")
+    for name, current in results["routes"].items():
+        previous = baseline["routes"].get(name)
+        if not previous:
+            print(f"{name:<20} (new)")
+            continue
+        rps_change = (current["rps"] - previous["rps"]) / previous["rps"] * 100 if previous["rps"] else 0.0
+        p95_change = (current["p95_ms"] - previous["p95_ms"]) / previous["p95_ms"] * 100 if previous["p95_ms"] else 0.0
+        regressed = rps_change < -threshold or p95_change > threshold
+        regressions += regressed
+        print(f"{name:<20} rps {rps_change:+7.1f}%  p95 {p95_change:+7.1f}%{'  ⚠️  regression' if regressed else ''}")
+    return regressions
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--posts", type=int, default=1000)
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=500, help="requests per route")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--memory-requests", type=int, default=50, help="requests per route under tracemalloc (0 skips)")
+    parser.add_argument("--routes", help="comma-separated scenario names to run")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--mongo", action="store_true", help="use MONGO_URL instead of mongomock")
+    parser.add_argument("--memory", action="store_true", help="use the in-memory storage backend")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0, help="regression threshold in percent")
+    args = parser.parse_args()
+
+    if httpx is None:
+        sys.exit("httpx is required: pip install -r benchmarks/requirements.txt")
+
+    if args.memory:
+        os.environ["STORAGE_BACKEND"] = "memory"
+    elif not args.mongo:
+        import database as database_module
+        try:
+            from mongomock_motor import AsyncMongoMockClient
+        except ImportError:
+            sys.exit("mongomock-motor is required without --mongo or --memory: pip install -r benchmarks/requirements.txt")
+        database_module.AsyncIOMotorClient = AsyncMongoMockClient
+        os.environ["SEARCH_BACKEND"] = "memory"
+
+    from auth import create_access_token
+    from server import app, database
+
+    # ASGITransport does not run the lifespan events
+    await database.connect()
+    try:
+        print(f"🌱 Seeding {args.posts} posts and {args.messages} messages")
+        corpus = await seed(database, args.posts, args.messages, args.seed)
+        admin_headers = {"Authorization": f"Bearer {create_access_token({'sub': 'admin'})}"}
+
+        scenarios = build_scenarios(corpus)
+        if args.routes:
+            selected = set(args.routes.split(","))
+            scenarios = [scenario for scenario in scenarios if scenario.name in selected]
+
+        results = {
+            "meta": {
+                "commit": git_commit(),
+                "timestamp": datetime.utcnow().isoformat(),
+                "python": platform.python_version(),
+                "backend": "memory" if args.memory else "mongo" if args.mongo else "mongomock",
+                "posts": args.posts,
+                "messages": args.messages,
+                "requests": args.requests,
+                "concurrency": args.concurrency,
+            },
+            "routes": {},
+        }
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            print(f"🚀 {args.requests} requests per route, concurrency {args.concurrency}")
+            print(f"{'route':<20} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'peak KiB':>9} {'errors':>7}")
+            for scenario in scenarios:
+                headers = admin_headers if scenario.admin else {}
+                result = await run_scenario(client, scenario, args.requests, args.concurrency, headers)
+                if args.memory_requests:
+                    result.update(await measure_memory(client, scenario, args.memory_requests, headers))
+                results["routes"][scenario.name] = result
+                print(
+                    f"{scenario.name:<20} {result['rps']:>9.1f} {result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f} "
+                    f"{result['p99_ms']:>9.2f} {result.get('peak_kib', 0):>9.1f} {result['errors']:>7}"
+                )
+    finally:
+        await database.disconnect()
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2, ensure_ascii=False))
+        print(f"💾 Results written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
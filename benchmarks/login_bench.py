@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Event loop latency during a login burst
+Runs concurrent password checks while a ticker measures how late the event
+loop wakes up, first with bcrypt called inline (the old login handler) and
+then through auth.authenticate_user and its bounded bcrypt pool
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from auth import ADMIN_USERS, PasswordPoolBusy, authenticate_user, verify_password
+
+TICK = 0.005
+
+
+async def ticker(stop: asyncio.Event, delays: list):
+    """Stand-in for public reads: records how late each wakeup is"""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        delays.append((time.perf_counter() - start - TICK) * 1000)
+
+
+async def inline_login(password: str):
+    # What the handler did before: bcrypt on the event loop thread
+    user = ADMIN_USERS["admin"]
+    verify_password(password, user["hashed_password"])
+
+
+async def pooled_login(password: str):
+    try:
+        await authenticate_user("admin", password)
+    except PasswordPoolBusy:
+        pass
+
+
+async def run(label: str, login, attempts: int):
+    delays = []
+    stop = asyncio.Event()
+    tick_task = asyncio.create_task(ticker(stop, delays))
+    await asyncio.sleep(0.05)
+    start = time.perf_counter()
+    await asyncio.gather(*[login("wrong-password") for _ in range(attempts)])
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await tick_task
+    delays.sort()
+    p99 = delays[min(len(delays) - 1, int(len(delays) * 0.99))]
+    print(
+        f"{label:<8} logins={attempts} wall={elapsed:6.2f}s "
+        f"loop lag p50={statistics.median(delays):7.2f} ms p99={p99:7.2f} ms max={delays[-1]:7.2f} ms"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--attempts", type=int, default=8)
+    args = parser.parse_args()
+
+    print("🔐 Event loop lag while bcrypt runs")
+    await run("inline", inline_login, args.attempts)
+    await run("pooled", pooled_login, args.attempts)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
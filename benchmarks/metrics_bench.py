@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Overhead of the request metrics middleware
+Times RequestMetrics.observe on its own and the full dispatch() wrapper
+around a no-op handler, so the per-request cost of /api/metrics recording
+can be checked against the empty baseline
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from metrics import PrometheusText, RequestMetrics, record_db_time
+
+ROUTES = ["/api/posts", "/api/posts/{slug}", "/api/categories", "/api/posts/featured", "/api/about"]
+
+
+def bench_observe(rounds: int) -> float:
+    metrics = RequestMetrics()
+    samples = [(random.choice(ROUTES), random.random() / 10) for _ in range(1024)]
+    start = time.perf_counter()
+    for i in range(rounds):
+        route, seconds = samples[i & 1023]
+        metrics.observe("GET", route, 200, seconds, seconds / 4)
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+async def bench_dispatch(rounds: int, with_metrics: bool) -> float:
+    metrics = RequestMetrics()
+    route = SimpleNamespace(path="/api/posts/{slug}")
+    request = SimpleNamespace(method="GET", scope={"route": route})
+    response = SimpleNamespace(status_code=200)
+
+    async def call_next(_request):
+        record_db_time(0.001)  # what the command listener does per command
+        return response
+
+    start = time.perf_counter()
+    if with_metrics:
+        for _ in range(rounds):
+            await metrics.dispatch(request, call_next)
+    else:
+        for _ in range(rounds):
+            await call_next(request)
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def bench_render(routes: int) -> float:
+    metrics = RequestMetrics()
+    for i in range(routes):
+        for status in (200, 304, 404):
+            metrics.observe("GET", f"/api/route/{i}", status, 0.01, 0.002)
+    start = time.perf_counter()
+    out = PrometheusText()
+    metrics.write(out)
+    body = out.render()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{'render ' + str(routes) + ' routes':<24} {elapsed:8.2f} ms ({len(body) // 1024} KiB)")
+    return elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=200000)
+    args = parser.parse_args()
+
+    print(f"📊 Request metrics overhead, {args.rounds} rounds")
+    observe = bench_observe(args.rounds)
+    print(f"{'observe()':<24} {observe:8.2f} µs / request")
+    baseline = await bench_dispatch(args.rounds, with_metrics=False)
+    wrapped = await bench_dispatch(args.rounds, with_metrics=True)
+    print(f"{'no-op handler':<24} {baseline:8.2f} µs / request")
+    print(f"{'dispatch() + handler':<24} {wrapped:8.2f} µs / request")
+    print(f"🚀 Middleware adds {wrapped - baseline:.2f} µs per request")
+    bench_render(30)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
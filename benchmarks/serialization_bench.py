@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Serialization benchmark for GET /api/posts
+Compares the old handler path (copy document, drop _id, build BlogPost, then
+FastAPI response_model validation and encoding) with DocumentJSONResponse
+"""
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from models import BlogPost
+from responses import DocumentJSONResponse
+
+
+def make_documents(count: int) -> List[dict]:
+    """Documents shaped like the ones Database.get_posts returns"""
+    base = datetime(2024, 1, 1)
+    docs = []
+    for i in range(count):
+        created = base + timedelta(hours=i)
+        docs.append({
+            "_id": ObjectId(),
+            "id": str(uuid.uuid4()),
+            "title": f"Başarı Hikayesi {i}: Yeniden Başlamak",
+            "slug": f"basari-hikayesi-{i}-yeniden-baslamak",
+            "excerpt": "Zor günlerde motivasyonumu nasıl yüksek tuttuğuma dair pratik öneriler.",
+            "content": "<p>" + "Girişimcilik yolculuğumda öğrendiklerim. " * 60 + "</p>",
+            "author": "Zirve Hikayem",
+            "publishDate": created.strftime("%Y-%m-%d"),
+            "category": ["Girişimcilik", "Motivasyon", "Kişisel Gelişim"][i % 3],
+            "tags": ["girişimcilik", "başarı", "motivasyon"],
+            "readTime": "2 dakika",
+            "featured": i % 7 == 0,
+            "createdAt": created,
+            "updatedAt": created,
+        })
+    return docs
+
+
+async def legacy_path(docs: List[dict], field) -> bytes:
+    posts = []
+    for post_data in docs:
+        post_dict = dict(post_data)
+        if '_id' in post_dict:
+            del post_dict['_id']
+        posts.append(BlogPost(**post_dict))
+    content = await serialize_response(field=field, response_content=posts)
+    return JSONResponse(content).body
+
+
+async def fast_path(docs: List[dict], field) -> bytes:
+    return DocumentJSONResponse(docs).body
+
+
+async def measure(label: str, path, docs: List[dict], field, rounds: int) -> float:
+    await path(docs, field)  # warm up
+    start = time.process_time()
+    for _ in range(rounds):
+        await path(docs, field)
+    per_request = (time.process_time() - start) / rounds * 1000
+    print(f"{label:<24} {per_request:8.2f} ms CPU / request")
+    return per_request
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--posts", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    field = create_response_field(name="Response_get_posts", type_=List[BlogPost])
+    legacy_docs = make_documents(args.posts)
+    # The fast path reads with a projection that already drops _id
+    fast_docs = [{k: v for k, v in doc.items() if k != "_id"} for doc in legacy_docs]
+
+    print(f"📊 Serializing {args.posts} posts, {args.rounds} rounds")
+    legacy = await measure("BlogPost + response_model", legacy_path, legacy_docs, field, args.rounds)
+    fast = await measure("DocumentJSONResponse", fast_path, fast_docs, field, args.rounds)
+    print(f"🚀 {legacy / fast:.1f}x less CPU per request ({legacy - fast:.2f} ms saved)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -32,11 +32,8 @@ const BlogPost = () => {
       // Track blog post read
       trackBlogRead(postData.title, postData.category, postData.readTime);
       
-      // Load related posts (same category, excluding current post)
-      const allPosts = await blogAPI.getPosts(postData.category);
-      const related = allPosts
-        .filter(p => p.id !== postData.id)
-        .slice(0, 2);
+      // Load related posts (most similar by title, tags and excerpt)
+      const related = await blogAPI.getRelatedPosts(slug, 2);
       setRelatedPosts(related);
       
     } catch (error) {
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { Link } from 'react-router-dom';
-import { blogAPI, categoriesAPI, handleAPIError } from '../services/api';
+import { blogAPI, handleAPIError } from '../services/api';
 import { Button } from '../components/ui/button';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '../components/ui/card';
 import { Badge } from '../components/ui/badge';
@@ -8,13 +8,17 @@ import { Clock, ArrowRight, Star, Loader2 } from 'lucide-react';
 import { toast } from 'sonner';
 import SEOHead from '../components/SEOHead';
 
+const POSTS_PAGE_SIZE = 10;
+
 const HomePage = () => {
   const [selectedCategory, setSelectedCategory] = useState('Tümü');
   const [posts, setPosts] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [featuredPosts, setFeaturedPosts] = useState([]);
   const [categories, setCategories] = useState(['Tümü']);
   const [loading, setLoading] = useState(true);
   const [postsLoading, setPostsLoading] = useState(false);
+  const [moreLoading, setMoreLoading] = useState(false);
 
   // Load initial data
   useEffect(() => {
@@ -32,18 +36,13 @@ const HomePage = () => {
     try {
       setLoading(true);
       
-      // Load categories and featured posts in parallel
-      const [categoriesData, featuredData] = await Promise.all([
-        categoriesAPI.getCategories(),
-        blogAPI.getFeaturedPosts()
-      ]);
+      // Categories, featured posts and the first page of posts in one request
+      const homeData = await blogAPI.getHome();
 
-      setCategories(categoriesData);
-      setFeaturedPosts(featuredData);
-      
-      // Load all posts for initial view
-      const allPosts = await blogAPI.getPosts();
-      setPosts(allPosts);
+      setCategories(homeData.categories);
+      setFeaturedPosts(homeData.featured);
+      setPosts(homeData.posts);
+      setNextCursor(homeData.nextCursor);
       
     } catch (error) {
       console.error('Error loading initial data:', error);
@@ -56,8 +55,9 @@ const HomePage = () => {
   const loadPosts = async () => {
     try {
       setPostsLoading(true);
-      const postsData = await blogAPI.getPosts(selectedCategory);
-      setPosts(postsData);
+      const page = await blogAPI.getPostsPage(selectedCategory, null, POSTS_PAGE_SIZE);
+      setPosts(page.posts);
+      setNextCursor(page.nextCursor);
     } catch (error) {
       console.error('Error loading posts:', error);
       toast.error(handleAPIError(error, 'Yazılar yüklenirken bir hata oluştu'));
@@ -66,6 +66,20 @@ const HomePage = () => {
     }
   };
 
+  const loadMorePosts = async () => {
+    try {
+      setMoreLoading(true);
+      const page = await blogAPI.getPostsPage(selectedCategory, nextCursor, POSTS_PAGE_SIZE);
+      setPosts((current) => [...current, ...page.posts]);
+      setNextCursor(page.nextCursor);
+    } catch (error) {
+      console.error('Error loading more posts:', error);
+      toast.error(handleAPIError(error, 'Yazılar yüklenirken bir hata oluştu'));
+    } finally {
+      setMoreLoading(false);
+    }
+  };
+
   if (loading) {
     return (
       <div className="min-h-screen bg-gray-50 flex items-center justify-center">
@@ -297,6 +311,20 @@ const HomePage = () => {
                 <p className="text-slate-600 text-lg">Bu kategoride henüz yazı bulunmuyor.</p>
               </div>
             )}
+
+            {!postsLoading && nextCursor && (
+              <div className="flex justify-center mt-12">
+                <Button
+                  variant="outline"
+                  onClick={loadMorePosts}
+                  disabled={moreLoading}
+                  className="border-purple-300 text-purple-700 hover:bg-purple-50"
+                >
+                  {moreLoading && <Loader2 className="h-4 w-4 mr-2 animate-spin" />}
+                  Daha Fazla Yazı
+                </Button>
+              </div>
+            )}
           </div>
         </section>
       </div>
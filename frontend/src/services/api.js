@@ -38,11 +38,12 @@ api.interceptors.response.use(
 
 // Blog Posts API
 export const blogAPI = {
-  // Get all posts with optional filtering
-  getPosts: async (category = null, featured = null) => {
+  // Get all posts with optional filtering ('summary' fields omit the content)
+  getPosts: async (category = null, featured = null, fields = null) => {
     const params = new URLSearchParams();
     if (category && category !== 'Tümü') params.append('category', category);
     if (featured !== null) params.append('featured', featured.toString());
+    if (fields) params.append('fields', fields);
     
     const queryString = params.toString();
     const url = queryString ? `/posts?${queryString}` : '/posts';
@@ -51,9 +52,32 @@ export const blogAPI = {
     return response.data;
   },
 
+  // Get a page of post summaries; nextCursor is null on the last page
+  getPostsPage: async (category = null, after = null, limit = 10) => {
+    const params = new URLSearchParams({ limit: limit.toString(), fields: 'summary' });
+    if (category && category !== 'Tümü') params.append('category', category);
+    if (after) params.append('after', after);
+    const response = await api.get(`/posts?${params.toString()}`);
+    return { posts: response.data, nextCursor: response.headers['x-next-cursor'] || null };
+  },
+
+  // Homepage data in one request: categories, featured and recent summaries
+  getHome: async () => {
+    const response = await api.get('/home');
+    return response.data;
+  },
+
   // Get featured posts only
-  getFeaturedPosts: async () => {
-    const response = await api.get('/posts/featured');
+  getFeaturedPosts: async (fields = null) => {
+    const url = fields ? `/posts/featured?fields=${fields}` : '/posts/featured';
+    const response = await api.get(url);
+    return response.data;
+  },
+
+  // Full-text search (summaries with a relevance score)
+  searchPosts: async (query, page = 1) => {
+    const params = new URLSearchParams({ q: query, page: page.toString() });
+    const response = await api.get(`/posts/search?${params.toString()}`);
     return response.data;
   },
 
@@ -63,6 +87,12 @@ export const blogAPI = {
     return response.data;
   },
 
+  // Most similar posts (summaries)
+  getRelatedPosts: async (slug, k = 2) => {
+    const response = await api.get(`/posts/${slug}/related?k=${k}`);
+    return response.data;
+  },
+
   // Create new post (admin)
   createPost: async (postData) => {
     const response = await api.post('/posts', postData);
@@ -89,6 +119,12 @@ export const categoriesAPI = {
     const response = await api.get('/categories');
     return response.data;
   },
+
+  // Get categories with post counts and latest publish date
+  getCategoryStats: async () => {
+    const response = await api.get('/categories', { params: { with_counts: 1 } });
+    return response.data;
+  },
 };
 
 // Contact API
@@ -99,10 +135,19 @@ export const contactAPI = {
     return response.data;
   },
 
-  // Get all messages (admin)
-  getMessages: async (status = null) => {
-    const params = status ? `?status=${status}` : '';
-    const response = await api.get(`/contact${params}`);
+  // Get a page of messages (admin); nextCursor is null on the last page
+  getMessages: async (status = null, after = null) => {
+    const params = new URLSearchParams();
+    if (status) params.append('status', status);
+    if (after) params.append('after', after);
+    const queryString = params.toString();
+    const response = await api.get(queryString ? `/contact?${queryString}` : '/contact');
+    return { messages: response.data, nextCursor: response.headers['x-next-cursor'] || null };
+  },
+
+  // Get message counts per status (admin)
+  getMessageStats: async () => {
+    const response = await api.get('/contact/stats');
     return response.data;
   },
 
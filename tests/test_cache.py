@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+
+from cache import TTLCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Loader:
+    """Counts its calls and returns once released"""
+
+    def __init__(self, value="deger"):
+        self.value = value
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        return self.value
+
+
+def test_concurrent_misses_share_one_load():
+    async def run():
+        cache = TTLCache(ttl=60)
+        loader = Loader()
+        callers = [asyncio.create_task(cache.get_or_load("post", loader)) for _ in range(5)]
+        await asyncio.sleep(0)
+        loader.release.set()
+        values = await asyncio.gather(*callers)
+        return loader.calls, values, len(cache)
+
+    calls, values, size = asyncio.run(run())
+    assert calls == 1
+    assert values == ["deger"] * 5
+    assert size == 1
+
+
+def test_cancelled_first_caller_does_not_fail_the_waiters():
+    async def run():
+        cache = TTLCache(ttl=60)
+        loader = Loader()
+        first = asyncio.create_task(cache.get_or_load("post", loader))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(cache.get_or_load("post", loader)) for _ in range(2)]
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        loader.release.set()
+        values = await asyncio.gather(*waiters)
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return loader.calls, values, await cache.get_or_load("post", loader)
+
+    calls, values, cached = asyncio.run(run())
+    assert calls == 1
+    assert values == ["deger", "deger"]
+    assert cached == "deger"
+
+
+def test_failed_load_is_shared_and_not_cached():
+    async def run():
+        cache = TTLCache(ttl=60)
+        calls = 0
+
+        async def failing():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            raise RuntimeError("veritabani")
+
+        results = await asyncio.gather(
+            cache.get_or_load("post", failing), cache.get_or_load("post", failing), return_exceptions=True
+        )
+        return calls, results, len(cache)
+
+    calls, results, size = asyncio.run(run())
+    assert calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert size == 0
+
+
+def test_invalidation_during_a_load_discards_its_value():
+    async def run():
+        cache = TTLCache(ttl=60)
+        stale = Loader("eski")
+        pending = asyncio.create_task(cache.get_or_load("post", stale))
+        await asyncio.sleep(0)
+        cache.invalidate("post")
+        stale.release.set()
+        fresh = Loader("yeni")
+        fresh.release.set()
+        return await pending, await cache.get_or_load("post", fresh)
+
+    assert asyncio.run(run()) == ("eski", "yeni")
+
+
+def test_entries_expire_after_the_ttl():
+    async def run():
+        clock = Clock()
+        cache = TTLCache(ttl=10, timer=clock)
+        loader = Loader()
+        loader.release.set()
+        await cache.get_or_load("post", loader)
+        clock.now = 9.9
+        await cache.get_or_load("post", loader)
+        clock.now = 10.0
+        await cache.get_or_load("post", loader)
+        return loader.calls, cache.hits, cache.misses
+
+    assert asyncio.run(run()) == (2, 1, 2)
+
+
+def test_least_recently_used_entry_is_evicted():
+    async def run():
+        cache = TTLCache(maxsize=2, ttl=60)
+
+        async def load(key):
+            return await cache.get_or_load(key, lambda: asyncio.sleep(0, result=key))
+
+        await load("a")
+        await load("b")
+        await load("a")
+        await load("c")
+        return list(cache._entries)
+
+    assert asyncio.run(run()) == ["a", "c"]
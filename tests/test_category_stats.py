@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+import database
+from memory_storage import MemoryDatabase
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+
+def make_post(post_id, category, publish_date):
+    return {
+        "id": post_id, "title": f"Yazı {post_id}", "slug": f"yazi-{post_id}", "excerpt": "ozet",
+        "content": "icerik", "author": "Zirve Hikayem", "publishDate": publish_date, "category": category,
+        "tags": [], "readTime": "1 dakika", "featured": False,
+    }
+
+
+async def apply_writes(storage):
+    await storage.create_post(make_post("1", "Girişim", "2024-01-01"))
+    await storage.create_post(make_post("2", "Girişim", "2024-03-01"))
+    await storage.create_post(make_post("3", "Kariyer", "2024-02-01"))
+    # Moving the newest post out lowers the old category's latest date
+    await storage.update_post("2", {"category": "Kariyer"})
+    await storage.update_post("3", {"publishDate": "2023-12-01"})
+    await storage.create_post(make_post("4", "Liderlik", "2024-04-01"))
+    # Deleting the only post of a category removes the category
+    await storage.delete_post("4")
+
+
+@pytest.fixture
+def mongo(monkeypatch):
+    client = mongomock_motor.AsyncMongoMockClient()
+    monkeypatch.setattr(database, "AsyncIOMotorClient", lambda *args, **kwargs: client)
+    monkeypatch.setenv("SEARCH_BACKEND", "memory")
+    monkeypatch.setenv("CACHE_TTL_SECONDS", "600")
+
+
+def test_writes_keep_category_stats_current(mongo):
+    async def run():
+        storage = database.Database()
+        await storage.connect()
+        await storage.get_category_stats()
+        await apply_writes(storage)
+        maintained = await storage.get_category_stats()
+        categories = await storage.get_categories()
+        await storage.rebuild_category_stats()
+        rebuilt = await storage._find_category_stats()
+        await storage.disconnect()
+        return maintained, categories, rebuilt
+
+    maintained, categories, rebuilt = asyncio.run(run())
+    assert maintained == [
+        {"category": "Girişim", "count": 1, "latestPublishDate": "2024-01-01"},
+        {"category": "Kariyer", "count": 2, "latestPublishDate": "2024-03-01"},
+    ]
+    assert categories == ["Tümü", "Girişim", "Kariyer"]
+    assert rebuilt == maintained
+
+
+def test_memory_storage_reports_the_same_stats():
+    async def run():
+        storage = MemoryDatabase()
+        await apply_writes(storage)
+        return await storage.get_category_stats()
+
+    assert asyncio.run(run()) == [
+        {"category": "Girişim", "count": 1, "latestPublishDate": "2024-01-01"},
+        {"category": "Kariyer", "count": 2, "latestPublishDate": "2024-03-01"},
+    ]
@@ -0,0 +1,46 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from metrics import RequestMetrics
+from ratelimit import MemoryBackend, RateLimit, RateLimiter
+
+
+def make_app(metrics: RequestMetrics) -> FastAPI:
+    app = FastAPI()
+    limiter = RateLimiter({("POST", "/posts/a/like"): RateLimit(1, 600)}, MemoryBackend())
+
+    # Same order as server.py: metrics wraps the rate limiter
+    @app.middleware("http")
+    async def rate_limit(request, call_next):
+        return await limiter.dispatch(request, call_next)
+
+    @app.middleware("http")
+    async def record_request_metrics(request, call_next):
+        return await metrics.dispatch(request, call_next)
+
+    @app.post("/posts/{slug}/like")
+    async def like(slug: str):
+        return {"ok": True}
+
+    return app
+
+
+def test_rate_limited_requests_are_labelled_with_their_route():
+    metrics = RequestMetrics()
+    client = TestClient(make_app(metrics))
+    client.post("/posts/a/like")
+    client.post("/posts/a/like")
+
+    assert metrics.requests == {
+        ("POST", "/posts/{slug}/like", 200): 1,
+        ("POST", "/posts/{slug}/like", 429): 1,
+    }
+
+
+def test_unknown_paths_share_one_label():
+    metrics = RequestMetrics()
+    client = TestClient(make_app(metrics))
+    client.get("/nope")
+    client.get("/other")
+
+    assert metrics.requests == {("GET", "unmatched", 404): 2}
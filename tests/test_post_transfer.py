@@ -0,0 +1,68 @@
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+from memory_storage import MemoryDatabase
+from post_transfer import import_ndjson, prepare_batch
+
+POST = {"title": "Dönüm Noktası", "excerpt": "ozet", "content": "icerik", "category": "A"}
+
+
+@pytest.mark.parametrize("fields, field", [
+    ({"slug": 5}, "slug"),
+    ({"id": 7}, "id"),
+    ({"author": ["x"]}, "author"),
+    ({"publishDate": 20240101}, "publishDate"),
+    ({"publishDate": "01.02.2024"}, "publishDate"),
+    ({"publishDate": "2024-13-01"}, "publishDate"),
+    ({"createdAt": "dün"}, "createdAt"),
+])
+def test_invalid_carried_over_fields_are_reported(fields, field):
+    posts, numbers, errors = prepare_batch([(3, json.dumps({**POST, **fields}))])
+
+    assert posts == [] and numbers == []
+    assert len(errors) == 1
+    assert errors[0]["line"] == 3
+    assert errors[0]["error"].startswith(field)
+
+
+def test_slug_without_url_safe_characters_is_reported():
+    _, _, errors = prepare_batch([(1, json.dumps({**POST, "slug": "!!!"}))])
+
+    assert len(errors) == 1
+
+
+def test_carried_over_fields_are_kept():
+    line = json.dumps({
+        **POST, "id": "p1", "slug": "Özel Slug", "author": "Ben",
+        "publishDate": "2024-01-01", "createdAt": "2024-01-02T03:04:05",
+    })
+    (post,), _, errors = prepare_batch([(1, line)])
+
+    assert errors == []
+    assert post["id"] == "p1"
+    assert post["slug"] == "ozel-slug"
+    assert post["author"] == "Ben"
+    assert post["publishDate"] == "2024-01-01"
+    assert post["createdAt"] == datetime(2024, 1, 2, 3, 4, 5)
+
+
+def test_invalid_lines_do_not_stop_the_import():
+    async def lines():
+        yield json.dumps({**POST, "slug": 5})
+        yield json.dumps({**POST, "publishDate": 20240101})
+        yield json.dumps(POST)
+
+    async def run():
+        storage = MemoryDatabase()
+        report = await import_ndjson(storage, lines())
+        return report, [post async for post in storage.iter_posts()]
+
+    report, posts = asyncio.run(run())
+    assert report["inserted"] == 1
+    assert report["invalid"] == 2
+    assert not report["aborted"]
+    assert [error["line"] for error in report["errors"]] == [1, 2]
+    assert [post["publishDate"] for post in posts] == [datetime.now().strftime("%Y-%m-%d")]
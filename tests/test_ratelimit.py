@@ -0,0 +1,57 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from ratelimit import MemoryBackend, RateLimit, RateLimiter
+
+
+def make_client(proxy_hops: int) -> TestClient:
+    app = FastAPI()
+    limiter = RateLimiter({("POST", "/contact"): RateLimit(2, 600)}, MemoryBackend(), proxy_hops=proxy_hops)
+
+    @app.middleware("http")
+    async def rate_limit(request, call_next):
+        return await limiter.dispatch(request, call_next)
+
+    @app.post("/contact")
+    async def contact():
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+def test_spoofed_leftmost_forwarded_address_does_not_bypass_the_limit():
+    client = make_client(proxy_hops=1)
+    statuses = [
+        client.post("/contact", headers={"X-Forwarded-For": f"10.0.0.{i}, 203.0.113.7"}).status_code
+        for i in range(5)
+    ]
+
+    assert statuses == [200, 200, 429, 429, 429]
+
+
+def test_clients_behind_the_proxy_are_limited_separately():
+    client = make_client(proxy_hops=1)
+    for _ in range(2):
+        assert client.post("/contact", headers={"X-Forwarded-For": "203.0.113.7"}).status_code == 200
+
+    assert client.post("/contact", headers={"X-Forwarded-For": "203.0.113.8"}).status_code == 200
+
+
+def test_forwarded_header_is_ignored_without_trusted_proxies():
+    client = make_client(proxy_hops=0)
+    statuses = [
+        client.post("/contact", headers={"X-Forwarded-For": f"10.0.0.{i}"}).status_code
+        for i in range(3)
+    ]
+
+    assert statuses == [200, 200, 429]
+
+
+def test_client_is_counted_from_the_right_with_several_proxies():
+    limiter = RateLimiter({}, MemoryBackend(), proxy_hops=2)
+
+    class Request:
+        headers = {"x-forwarded-for": "6.6.6.6, 203.0.113.7, 10.0.0.2"}
+        client = None
+
+    assert limiter.client_key(Request()) == "203.0.113.7"
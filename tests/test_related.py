@@ -0,0 +1,94 @@
+import asyncio
+
+from memory_storage import MemoryDatabase
+from models import PostSummary
+from related import RelatedPostsIndex
+
+
+def make_post(post_id, title, tags, excerpt=None):
+    return {
+        "id": post_id, "title": title, "slug": f"yazi-{post_id}", "excerpt": excerpt or post_id,
+        "content": "icerik", "author": "Zirve Hikayem", "publishDate": "2024-01-01", "category": "A", "tags": tags,
+        "readTime": "1 dakika", "featured": False,
+    }
+
+
+POSTS = [
+    make_post("girisim-1", "Girişimcilik Yolculuğu", ["girişim", "yatırım"]),
+    make_post("girisim-2", "Girişimcilik Notları", ["girişim"]),
+    make_post("yatirim", "Yatırım Turu", ["yatırım"]),
+    make_post("kariyer", "Kariyer Değişikliği", ["kariyer"]),
+]
+
+
+def related_ids(index, post_id, k=10):
+    return [post["id"] for post in index.related(post_id, k)]
+
+
+def test_build_ranks_the_most_similar_posts_first():
+    index = RelatedPostsIndex.build(POSTS)
+    assert related_ids(index, "girisim-1") == ["girisim-2", "yatirim"]
+    assert related_ids(index, "girisim-1", k=1) == ["girisim-2"]
+    assert related_ids(index, "kariyer") == []
+    assert set(index.related("girisim-2", 1)[0]) <= set(PostSummary.model_fields)
+
+
+def test_writes_update_the_neighbor_lists():
+    index = RelatedPostsIndex.build(POSTS)
+    index.add(make_post("kariyer-2", "Kariyer Planı", ["kariyer"]))
+    assert related_ids(index, "kariyer") == ["kariyer-2"]
+
+    index.add(make_post("yatirim", "Kariyer Yatırımı", ["kariyer"]))
+    assert "yatirim" not in related_ids(index, "girisim-1")
+    assert "yatirim" in related_ids(index, "kariyer")
+
+    index.remove("kariyer-2")
+    assert "kariyer-2" not in related_ids(index, "kariyer")
+    assert related_ids(index, "kariyer-2") == []
+
+
+def test_compaction_keeps_the_lists_of_live_posts():
+    index = RelatedPostsIndex.build(POSTS)
+    for i in range(100):
+        index.add(make_post(f"gecici-{i}", "Geçici Yazı", ["gecici"]))
+    for i in range(100):
+        index.remove(f"gecici-{i}")
+    assert len(index) == len(POSTS)
+    assert related_ids(index, "girisim-1") == ["girisim-2", "yatirim"]
+
+
+def test_index_behind_another_workers_writes_is_rebuilt():
+    async def run():
+        storage = MemoryDatabase()
+        for post in POSTS:
+            await storage.create_post(dict(post))
+        version = await storage.get_collection_version("blog_posts")
+        posts = [post async for post in storage.iter_posts()]
+        local = RelatedPostsIndex()
+        local.replace(RelatedPostsIndex.build(posts), version)
+        remote = RelatedPostsIndex()
+        remote.replace(RelatedPostsIndex.build(posts), version)
+        # Only this worker's index hears about its writes
+        storage.subscribe(local.on_change)
+
+        await storage.create_post(make_post("girisim-3", "Girişimcilik Yolculuğu Dersleri", ["girişim"]))
+        version = await storage.get_collection_version("blog_posts")
+        in_sync = (local.in_sync(version), remote.in_sync(version), remote.in_sync(version - 1))
+
+        posts = [post async for post in storage.iter_posts()]
+        remote.replace(RelatedPostsIndex.build(posts), version)
+        return in_sync, remote.in_sync(version), related_ids(local, "girisim-3"), related_ids(remote, "girisim-3")
+
+    in_sync, rebuilt_in_sync, local_related, remote_related = asyncio.run(run())
+    assert in_sync == (True, False, True)
+    assert rebuilt_in_sync
+    assert remote_related == local_related
+    assert local_related[:2] == ["girisim-1", "girisim-2"]
+
+
+def test_index_replaced_with_an_unknown_version_is_never_in_sync():
+    index = RelatedPostsIndex()
+    assert not index.in_sync(0)
+    index.replace(RelatedPostsIndex.build(POSTS), None)
+    assert not index.in_sync(0)
+    assert related_ids(index, "girisim-1") == ["girisim-2", "yatirim"]
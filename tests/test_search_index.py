@@ -0,0 +1,45 @@
+import asyncio
+
+from memory_storage import MemoryDatabase
+from search_index import InvertedIndex
+
+
+def make_post(post_id, title, content="icerik"):
+    return {"id": post_id, "title": title, "excerpt": "ozet", "content": content, "tags": []}
+
+
+def test_updated_post_is_still_found():
+    index = InvertedIndex()
+    index.add(make_post("1", "Girişimcilik Yolculuğum"))
+    index.add(make_post("1", "Girişimcilik Yolculuğum", content="yeni icerik"))
+
+    assert [post_id for post_id, _ in index.search("girisimcilik")] == ["1"]
+
+
+def test_removed_posts_do_not_count_towards_document_frequency():
+    index = InvertedIndex()
+    for i in range(10):
+        index.add(make_post(str(i), "Ortak Kelime"))
+    for i in range(1, 10):
+        index.remove(str(i))
+    for _ in range(5):
+        index.add(make_post("0", "Ortak Kelime"))
+
+    results = index.search("ortak")
+    assert [post_id for post_id, _ in results] == ["0"]
+    assert results[0][1] > 0
+    assert index.complete("ort") == ["ortak"]
+
+
+def test_search_after_update_in_memory_storage():
+    async def run():
+        storage = MemoryDatabase()
+        post = await storage.create_post({
+            "id": "p1", "title": "Dönüm Noktası", "slug": "donum-noktasi", "excerpt": "ozet",
+            "content": "icerik", "author": "Zirve Hikayem", "publishDate": "2024-01-01",
+            "category": "A", "tags": [], "readTime": "1 dk", "featured": False,
+        })
+        await storage.update_post(post["id"], {"content": "guncel icerik"})
+        return await storage.search_posts("donum")
+
+    assert [post["id"] for post in asyncio.run(run())] == ["p1"]
@@ -0,0 +1,58 @@
+import asyncio
+
+from memory_storage import MemoryDatabase
+
+
+def make_post(post_id, title, slug):
+    return {
+        "id": post_id, "title": title, "slug": slug, "excerpt": "ozet", "content": "icerik",
+        "author": "Zirve Hikayem", "publishDate": "2024-01-01", "category": "A", "tags": [],
+        "readTime": "1 dakika", "featured": False,
+    }
+
+
+async def seeded() -> MemoryDatabase:
+    storage = MemoryDatabase()
+    await storage.create_post(make_post("1", "Aynı Başlık", "ayni-baslik"))
+    await storage.create_post(make_post("2", "Aynı Başlık", "ayni-baslik-2"))
+    await storage.create_post(make_post("3", "Başka", "baska"))
+    return storage
+
+
+def test_title_edit_keeps_a_suffixed_slug_of_the_same_title():
+    async def run():
+        storage = await seeded()
+        return await storage.update_post("2", {"title": "Aynı  Başlık!"})
+
+    assert asyncio.run(run())["slug"] == "ayni-baslik-2"
+
+
+def test_title_edit_moves_to_the_next_free_slug():
+    async def run():
+        storage = await seeded()
+        return await storage.update_post("3", {"title": "Aynı Başlık"})
+
+    assert asyncio.run(run())["slug"] == "ayni-baslik-3"
+
+
+def test_title_edit_of_a_missing_post_returns_none():
+    async def run():
+        storage = await seeded()
+        return await storage.update_post("nope", {"title": "Aynı Başlık"})
+
+    assert asyncio.run(run()) is None
+
+
+def test_concurrent_creates_get_distinct_slugs():
+    async def run():
+        storage = await seeded()
+
+        async def create(i):
+            post = make_post(f"new-{i}", "Aynı Başlık", None)
+            return await storage.allocate_slug(
+                "ayni-baslik", lambda slug: storage.create_post(dict(post, slug=slug))
+            )
+
+        return [post["slug"] for post in await asyncio.gather(*[create(i) for i in range(4)])]
+
+    assert sorted(asyncio.run(run())) == ["ayni-baslik-3", "ayni-baslik-4", "ayni-baslik-5", "ayni-baslik-6"]
@@ -0,0 +1,108 @@
+import asyncio
+import gzip
+from datetime import datetime
+
+from fastapi import Request
+
+from http_cache import is_not_modified
+from snapshots import SnapshotStore
+
+
+def make_request(**headers):
+    return Request({
+        "type": "http",
+        "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()],
+    })
+
+
+def make_store(versions):
+    builds = []
+
+    async def get_version(collection):
+        return versions[collection]
+
+    async def build():
+        builds.append(versions["blog_posts"])
+        return b'{"surum": %d}' % versions["blog_posts"]
+
+    store = SnapshotStore(get_version)
+    store.register("home", "blog_posts", build)
+    return store, builds
+
+
+def test_snapshot_is_built_once_per_version():
+    async def run():
+        versions = {"blog_posts": 1}
+        store, builds = make_store(versions)
+        first = await store.get("home")
+        await store.get("home")
+        versions["blog_posts"] = 2
+        second = await store.get("home")
+        return first, second, builds
+
+    first, second, builds = asyncio.run(run())
+    assert builds == [1, 2]
+    assert first.body == b'{"surum": 1}'
+    assert gzip.decompress(second.gzip_body) == b'{"surum": 2}'
+    assert first.etag != second.etag
+
+
+def test_each_encoding_has_its_own_etag():
+    async def run():
+        store, _ = make_store({"blog_posts": 1})
+        snapshot = await store.get("home")
+        identity = store.response(snapshot, make_request())
+        gzipped = store.response(snapshot, make_request(accept_encoding="gzip, deflate"))
+        return snapshot, identity, gzipped
+
+    snapshot, identity, gzipped = asyncio.run(run())
+    assert identity.headers["etag"] == snapshot.etag
+    assert "content-encoding" not in identity.headers
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.headers["etag"] != identity.headers["etag"]
+    assert gzip.decompress(gzipped.body) == snapshot.body
+
+
+def test_revalidation_matches_the_requested_encoding_only():
+    async def run():
+        store, _ = make_store({"blog_posts": 1})
+        snapshot = await store.get("home")
+        gzip_etag = store.response(snapshot, make_request(accept_encoding="gzip")).headers["etag"]
+        same = store.response(snapshot, make_request(accept_encoding="gzip", if_none_match=gzip_etag))
+        other = store.response(snapshot, make_request(if_none_match=gzip_etag))
+        return same, other
+
+    same, other = asyncio.run(run())
+    assert same.status_code == 304
+    assert same.body == b""
+    assert same.headers["vary"] == "Accept-Encoding"
+    assert same.headers["etag"].endswith('-gzip"')
+    assert other.status_code == 200
+    assert other.headers["vary"] == "Accept-Encoding"
+
+
+def test_write_invalidates_the_snapshot_etag():
+    async def run():
+        versions = {"blog_posts": 1}
+        store, _ = make_store(versions)
+        etag = (await store.get("home")).etag
+        versions["blog_posts"] = 2
+        return store.response(await store.get("home"), make_request(if_none_match=etag))
+
+    assert asyncio.run(run()).status_code == 200
+
+
+def test_if_none_match_uses_weak_comparison():
+    request = make_request(if_none_match='"a", W/"b"')
+    assert is_not_modified(request, '"b"')
+    assert not is_not_modified(request, '"c"')
+    assert is_not_modified(make_request(if_none_match="*"), '"c"')
+
+
+def test_if_modified_since_applies_without_if_none_match():
+    last_modified = datetime(2024, 1, 1, 12, 0, 0, 500000)
+    assert is_not_modified(make_request(if_modified_since="Mon, 01 Jan 2024 12:00:00 GMT"), '"a"', last_modified)
+    assert not is_not_modified(make_request(if_modified_since="Mon, 01 Jan 2024 11:59:59 GMT"), '"a"', last_modified)
+    assert not is_not_modified(
+        make_request(if_none_match='"b"', if_modified_since="Mon, 01 Jan 2024 12:00:00 GMT"), '"a"', last_modified
+    )
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+import database
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+
+def make_post(post_id, title):
+    return {
+        "id": post_id, "title": title, "slug": post_id, "excerpt": "ozet", "content": "icerik",
+        "author": "Zirve Hikayem", "publishDate": "2024-01-01", "category": "A", "tags": [],
+        "readTime": "1 dakika", "featured": False,
+    }
+
+
+@pytest.fixture
+def workers(monkeypatch):
+    """Two Database instances sharing one (in-memory) MongoDB"""
+    client = mongomock_motor.AsyncMongoMockClient()
+    monkeypatch.setattr(database, "AsyncIOMotorClient", lambda *args, **kwargs: client)
+    monkeypatch.setenv("SEARCH_BACKEND", "memory")
+    monkeypatch.setenv("CACHE_TTL_SECONDS", "600")
+
+    async def connect():
+        first, second = database.Database(), database.Database()
+        await first.connect()
+        await second.connect()
+        return first, second
+
+    return connect
+
+
+def test_post_written_by_another_worker_is_served(workers):
+    async def run():
+        first, second = await workers()
+        missing = await second.get_post_by_slug("s1")
+        await first.create_post(make_post("s1", "Dönüm Noktası"))
+        second.version_cache.clear()  # the version TTL has passed
+        found = await second.get_post_by_slug("s1")
+        await first.delete_post("s1")
+        second.version_cache.clear()
+        return missing, found, await second.get_post_by_slug("s1")
+
+    missing, found, deleted = asyncio.run(run())
+    assert missing is None
+    assert found["id"] == "s1"
+    assert deleted is None
+
+
+def test_search_finds_posts_written_by_another_worker(workers):
+    async def run():
+        first, second = await workers()
+        await second.search_posts("girisim")
+        await first.create_post(make_post("s1", "Girişimcilik Yolculuğu"))
+        second.version_cache.clear()  # the version TTL has passed
+        found = [post["id"] for post in await second.search_posts("girisim")]
+        await first.delete_post("s1")
+        second.version_cache.clear()
+        return found, await second.search_posts("girisim")
+
+    found, deleted = asyncio.run(run())
+    assert found == ["s1"]
+    assert deleted == []
+
+
+def test_local_writes_do_not_rebuild_the_search_index(workers):
+    async def run():
+        first, _ = await workers()
+        index = first.search_index
+        for i in range(3):
+            await first.create_post(make_post(f"s{i}", "Girişimcilik"))
+            first.version_cache.clear()
+            await first.search_posts("girisim")
+        await first.delete_post("s0")
+        first.version_cache.clear()
+        return index is first.search_index, len(await first.search_posts("girisim"))
+
+    assert asyncio.run(run()) == (True, 2)
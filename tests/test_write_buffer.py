@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from write_buffer import WriteBuffer, WriteBufferClosed
+
+
+class Inserts:
+    """Records each insert_many batch, optionally held until released"""
+
+    def __init__(self):
+        self.batches = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self, documents):
+        await self.release.wait()
+        self.batches.append([document["n"] for document in documents])
+
+
+def test_concurrent_submits_are_written_in_one_batch():
+    async def run():
+        inserts = Inserts()
+        buffer = WriteBuffer(inserts, max_batch=100, max_delay=0.05)
+        buffer.start()
+        await asyncio.gather(*(buffer.submit({"n": n}) for n in range(10)))
+        await buffer.close()
+        return inserts.batches
+
+    assert asyncio.run(run()) == [list(range(10))]
+
+
+def test_full_batches_are_flushed_in_submission_order():
+    async def run():
+        inserts = Inserts()
+        buffer = WriteBuffer(inserts, max_batch=4, max_delay=10)
+        buffer.start()
+        await asyncio.gather(*(buffer.submit({"n": n}) for n in range(8)))
+        await buffer.close()
+        return inserts.batches
+
+    assert asyncio.run(run()) == [[0, 1, 2, 3], [4, 5, 6, 7]]
+
+
+def test_close_drains_queued_documents():
+    async def run():
+        inserts = Inserts()
+        inserts.release.clear()
+        buffer = WriteBuffer(inserts, max_batch=2, max_delay=10)
+        buffer.start()
+        submits = [asyncio.create_task(buffer.submit({"n": n})) for n in range(5)]
+        await asyncio.sleep(0.01)
+        closing = asyncio.create_task(buffer.close())
+        await asyncio.sleep(0)
+        with pytest.raises(WriteBufferClosed):
+            await buffer.submit({"n": 99})
+        inserts.release.set()
+        await closing
+        assert all(submit.done() for submit in submits)
+        await asyncio.gather(*submits)
+        return inserts.batches
+
+    batches = asyncio.run(run())
+    assert sorted(n for batch in batches for n in batch) == [0, 1, 2, 3, 4]
+    assert batches[0] == [0, 1]
+
+
+def test_failed_batch_fails_its_callers_only():
+    async def run():
+        calls = 0
+
+        async def insert_many(documents):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("baglanti")
+
+        buffer = WriteBuffer(insert_many, max_batch=2, max_delay=10)
+        buffer.start()
+        results = await asyncio.gather(*(buffer.submit({"n": n}) for n in range(4)), return_exceptions=True)
+        await buffer.close()
+        return results
+
+    results = asyncio.run(run())
+    assert [isinstance(result, RuntimeError) for result in results] == [True, True, False, False]